@@ -0,0 +1,371 @@
+"""
+apertures.py - Analytic Aperture Boundaries for Particle Termination
+
+Lightweight alternative (or complement) to a full PyElectrodeAssembly for
+terminating particles in Pusher.track_batch. Apertures are simple analytic
+shapes whose walls absorb particles; every step segment of every live
+particle is tested against all apertures in one vectorized Numba kernel.
+
+Supported Shapes:
+    - CylinderAperture: round beam pipe of finite length, arbitrary axis
+    - BoxAperture: rectangular pipe along z (x/y limits over a z range)
+    - PlaneAperture: thin plate with a circular hole (diaphragm, iris, beam stop)
+
+Author: PyPATools Development Team
+
+Notes:
+    - Volumetric apertures (cylinder, box) absorb particles that are inside
+      their axial range but outside the opening. Particles starting there
+      are lost in the first step
+    - A hit is reported at the first point of the step segment inside a
+      wall, as a fraction 0..1 of the segment
+"""
+
+import numpy as np
+from typing import List, Optional, Sequence, Tuple, Union
+from abc import ABC, abstractmethod
+import warnings
+
+try:
+    from numba import njit, prange
+
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    warnings.warn("Numba not available. Performance will be reduced.")
+
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return decorator
+
+    def prange(*args, **kwargs):
+        return range(*args, **kwargs)
+
+# Shape codes of the aperture kernel
+CYLINDER = 0
+BOX = 1
+PLANE = 2
+
+# Parameters per aperture row (see Aperture.params)
+N_PARAMS = 8
+
+
+# ============================================================================
+# Kernels
+# ============================================================================
+
+@njit(cache=True)
+def _segment_interval(s0, ds, lo, hi):
+    """Fractions [u_lo, u_hi] of the segment with lo <= s0 + u * ds <= hi, clipped to [0, 1]"""
+    if abs(ds) < 1e-300:
+        if s0 < lo or s0 > hi:
+            return 1.0, 0.0
+        return 0.0, 1.0
+
+    u1 = (lo - s0) / ds
+    u2 = (hi - s0) / ds
+    return max(0.0, min(u1, u2)), min(1.0, max(u1, u2))
+
+
+@njit(cache=True)
+def _cylinder_hit(prm, a, b):
+    """First fraction at which segment a -> b is in the wall of a cylinder, inf if none"""
+    w = np.empty(3)
+    d = np.empty(3)
+    for k in range(3):
+        w[k] = a[k] - prm[k]
+        d[k] = b[k] - a[k]
+
+    s0 = w[0] * prm[3] + w[1] * prm[4] + w[2] * prm[5]
+    ds = d[0] * prm[3] + d[1] * prm[4] + d[2] * prm[5]
+    u_lo, u_hi = _segment_interval(s0, ds, 0.0, prm[6])
+    if u_lo > u_hi:
+        return np.inf
+
+    # Radial distance^2 along the segment: |q + u e|^2
+    qq = 0.0
+    qe = 0.0
+    ee = 0.0
+    for k in range(3):
+        q = w[k] - s0 * prm[3 + k]
+        e = d[k] - ds * prm[3 + k]
+        qq += q * q
+        qe += q * e
+        ee += e * e
+
+    radius_sq = prm[7] * prm[7]
+    if qq + 2.0 * u_lo * qe + u_lo * u_lo * ee > radius_sq:
+        return u_lo
+
+    # Inside at u_lo: leaves through the mantle at the larger root
+    if ee < 1e-300:
+        return np.inf
+    disc = qe * qe - ee * (qq - radius_sq)
+    if disc < 0.0:
+        return np.inf
+    u_exit = (-qe + np.sqrt(disc)) / ee
+    if u_lo <= u_exit < u_hi:
+        return u_exit
+
+    return np.inf
+
+
+@njit(cache=True)
+def _box_hit(prm, a, b):
+    """First fraction at which segment a -> b is in the wall of a rectangular pipe, inf if none"""
+    u_lo, u_hi = _segment_interval(a[2], b[2] - a[2], prm[4], prm[5])
+    if u_lo > u_hi:
+        return np.inf
+
+    # Fractions (over all reals) with x and y inside the opening
+    i_lo = -np.inf
+    i_hi = np.inf
+    for k in range(2):
+        dk = b[k] - a[k]
+        if abs(dk) < 1e-300:
+            if a[k] < prm[2 * k] or a[k] > prm[2 * k + 1]:
+                return u_lo
+        else:
+            u1 = (prm[2 * k] - a[k]) / dk
+            u2 = (prm[2 * k + 1] - a[k]) / dk
+            i_lo = max(i_lo, min(u1, u2))
+            i_hi = min(i_hi, max(u1, u2))
+
+    if u_lo < i_lo or u_lo > i_hi:
+        return u_lo
+    if i_hi < u_hi:
+        return i_hi
+
+    return np.inf
+
+
+@njit(cache=True)
+def _plane_hit(prm, a, b):
+    """Fraction at which segment a -> b crosses a plate outside its hole, inf if none"""
+    f0 = (a[0] - prm[0]) * prm[3] + (a[1] - prm[1]) * prm[4] + (a[2] - prm[2]) * prm[5]
+    f1 = (b[0] - prm[0]) * prm[3] + (b[1] - prm[1]) * prm[4] + (b[2] - prm[2]) * prm[5]
+    if f0 == f1 or f0 * f1 > 0.0:
+        return np.inf
+
+    u = f0 / (f0 - f1)
+    rho_sq = 0.0
+    for k in range(3):
+        dk = a[k] + u * (b[k] - a[k]) - prm[k]
+        rho_sq += dk * dk
+
+    if prm[6] * prm[6] < rho_sq <= prm[7] * prm[7]:
+        return u
+
+    return np.inf
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def aperture_hits_batch(r_old, r_new, kinds, params):
+    """
+    First aperture hit of each step segment r_old[i] -> r_new[i].
+
+    Returns
+    -------
+    hit_id : np.ndarray(M,) int64
+        Index of the aperture hit first, -1 if none
+    fraction : np.ndarray(M,)
+        Position of the hit along the segment, 0..1 (inf if none)
+    """
+    M = r_old.shape[0]
+    hit_id = np.full(M, -1, dtype=np.int64)
+    fraction = np.full(M, np.inf)
+
+    for i in prange(M):
+        for j in range(len(kinds)):
+            if kinds[j] == CYLINDER:
+                u = _cylinder_hit(params[j], r_old[i], r_new[i])
+            elif kinds[j] == BOX:
+                u = _box_hit(params[j], r_old[i], r_new[i])
+            else:
+                u = _plane_hit(params[j], r_old[i], r_new[i])
+
+            if u < fraction[i]:
+                fraction[i] = u
+                hit_id[i] = j
+
+    return hit_id, fraction
+
+
+# ============================================================================
+# Aperture Shapes
+# ============================================================================
+
+class Aperture(ABC):
+    """Base class of analytic apertures: a shape code and N_PARAMS kernel parameters"""
+
+    kind = -1
+
+    @abstractmethod
+    def params(self) -> np.ndarray:
+        """Kernel parameters, shape (N_PARAMS,)"""
+        pass
+
+
+class CylinderAperture(Aperture):
+    """
+    Round beam pipe: particles between start and end farther than radius
+    from the axis are lost.
+
+    Parameters
+    ----------
+    radius : float
+        Inner radius [m]
+    start, end : array-like (3,)
+        Axis end points [m] (default: along z from 0 to 1 m)
+    """
+
+    kind = CYLINDER
+
+    def __init__(self, radius: float,
+                 start: Sequence[float] = (0.0, 0.0, 0.0),
+                 end: Sequence[float] = (0.0, 0.0, 1.0)):
+        self.radius = float(radius)
+        self.start = np.asarray(start, dtype=np.float64)
+        self.end = np.asarray(end, dtype=np.float64)
+
+        self.length = float(np.linalg.norm(self.end - self.start))
+        if self.length == 0.0:
+            raise ValueError("CylinderAperture start and end must differ")
+
+    def params(self) -> np.ndarray:
+        axis = (self.end - self.start) / self.length
+        return np.array([*self.start, *axis, self.length, self.radius])
+
+    def __repr__(self):
+        return f"CylinderAperture(radius={self.radius}, start={self.start.tolist()}, end={self.end.tolist()})"
+
+
+class BoxAperture(Aperture):
+    """
+    Rectangular pipe along z: particles with z_min <= z <= z_max outside
+    the x and y limits are lost.
+
+    Parameters
+    ----------
+    x_limits, y_limits : (float, float)
+        Opening [m]
+    z_limits : (float, float)
+        Axial extent [m]
+    """
+
+    kind = BOX
+
+    def __init__(self, x_limits: Tuple[float, float], y_limits: Tuple[float, float],
+                 z_limits: Tuple[float, float]):
+        self.limits = np.array([x_limits, y_limits, z_limits], dtype=np.float64)
+
+        if np.any(self.limits[:, 0] > self.limits[:, 1]):
+            raise ValueError(f"BoxAperture limits must be (min, max), got {self.limits.tolist()}")
+
+    def params(self) -> np.ndarray:
+        return np.concatenate([self.limits.ravel(), [0.0, 0.0]])
+
+    def __repr__(self):
+        x, y, z = self.limits.tolist()
+        return f"BoxAperture(x_limits={tuple(x)}, y_limits={tuple(y)}, z_limits={tuple(z)})"
+
+
+class PlaneAperture(Aperture):
+    """
+    Thin plate with a circular hole: particles crossing the plane between
+    radius and outer_radius from point are lost.
+
+    Parameters
+    ----------
+    point : array-like (3,)
+        Hole center [m]
+    normal : array-like (3,)
+        Plate normal
+    radius : float
+        Hole radius [m] (default: 0, a beam stop)
+    outer_radius : float
+        Plate radius [m] (default: infinite)
+    """
+
+    kind = PLANE
+
+    def __init__(self, point: Sequence[float], normal: Sequence[float] = (0.0, 0.0, 1.0),
+                 radius: float = 0.0, outer_radius: float = np.inf):
+        self.point = np.asarray(point, dtype=np.float64)
+        self.normal = np.asarray(normal, dtype=np.float64)
+        self.radius = float(radius)
+        self.outer_radius = float(outer_radius)
+
+        if np.linalg.norm(self.normal) == 0.0:
+            raise ValueError("PlaneAperture normal must be non-zero")
+        if self.outer_radius <= self.radius:
+            raise ValueError(f"outer_radius ({self.outer_radius}) must exceed radius ({self.radius})")
+
+    def params(self) -> np.ndarray:
+        normal = self.normal / np.linalg.norm(self.normal)
+        return np.array([*self.point, *normal, self.radius, self.outer_radius])
+
+    def __repr__(self):
+        return (f"PlaneAperture(point={self.point.tolist()}, normal={self.normal.tolist()}, "
+                f"radius={self.radius}, outer_radius={self.outer_radius})")
+
+
+class ApertureSet:
+    """
+    Apertures packed for the aperture kernel.
+
+    Parameters
+    ----------
+    apertures : list of Aperture
+        Shapes; aperture ids in loss records are indices into this list
+
+    Examples
+    --------
+    > apertures = ApertureSet([CylinderAperture(0.02, (0, 0, 0), (0, 0, 0.5)),
+    ...                        PlaneAperture((0, 0, 0.5), radius=0.005)])
+    > pusher = Pusher(ion, 'vay_rel', apertures=apertures)
+    """
+
+    def __init__(self, apertures: List[Aperture]):
+        self.apertures = list(apertures)
+        self.kinds = np.array([ap.kind for ap in self.apertures], dtype=np.int64)
+        self.params = np.array([ap.params() for ap in self.apertures], dtype=np.float64).reshape(-1, N_PARAMS)
+
+    def check(self, r_old: np.ndarray, r_new: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        First aperture hit of the step segments r_old -> r_new (M, 3).
+
+        Returns
+        -------
+        hit_id : np.ndarray(M,)
+            Aperture index, -1 if the segment hits none
+        fraction : np.ndarray(M,)
+            Position of the hit along the segment, 0..1
+        """
+        r_old = np.ascontiguousarray(r_old, dtype=np.float64)
+        r_new = np.ascontiguousarray(r_new, dtype=np.float64)
+
+        if len(self.apertures) == 0:
+            return np.full(len(r_old), -1, dtype=np.int64), np.full(len(r_old), np.inf)
+
+        return aperture_hits_batch(r_old, r_new, self.kinds, self.params)
+
+    def __len__(self):
+        return len(self.apertures)
+
+    def __repr__(self):
+        return f"ApertureSet({self.apertures})"
+
+
+def as_aperture_set(apertures: Optional[Union[ApertureSet, Aperture, List[Aperture]]]) -> Optional[ApertureSet]:
+    """Wrap a single aperture or a list of apertures in an ApertureSet"""
+    if apertures is None or isinstance(apertures, ApertureSet):
+        return apertures
+    if isinstance(apertures, Aperture):
+        return ApertureSet([apertures])
+
+    return ApertureSet(apertures)
@@ -7,10 +7,15 @@ Key design considerations:
 - Memory efficiency: Use NumPy views where safe, explicit copies where needed
 - Performance: Pre-allocated arrays for all timesteps
 - API clarity: Distinguish between views (internal) and copies (external)
+- Scalability: H5Beam keeps the same API but stores data in chunked,
+  compressed HDF5 datasets so run length is no longer limited by RAM
 """
 
+import os
 import numpy as np
-from typing import Optional, Tuple
+import h5py
+from collections import OrderedDict
+from typing import Optional, Tuple, Dict
 from dataclasses import dataclass, field
 from .species import IonSpecies
 from .particles import ParticleDistribution
@@ -63,12 +68,12 @@ class Beam:
     v_vec: np.ndarray = field(init=False)
     alive: np.ndarray = field(init=False)
 
-    # Pre-initialized output object (avoids repeated allocation)
-    _output_pd: ParticleDistribution = field(init=False, default=None)
-
     # Track which save index we're currently at (for convenience)
     _current_save_idx: int = field(init=False, default=0)
 
+    # Particle-major copies for get_trajectory, built lazily per quantity
+    _trajectory_index: dict = field(init=False, default=None, repr=False)
+
     def __post_init__(self):
         """Initialize arrays after dataclass initialization."""
         # Calculate number of save points
@@ -76,21 +81,10 @@ class Beam:
         self.n_saves = (self.n_steps + self.save_freq - 1) // self.save_freq
 
         # Initialize data arrays
-        self.t = np.full(self.n_saves, np.nan, dtype=np.float64)
-        self.x_vec = np.full((self.n_saves, self.n_particles, 3), np.nan, dtype=np.float64)
-        self.v_vec = np.full((self.n_saves, self.n_particles, 3), np.nan, dtype=np.float64)
-
-        # alive should be False (no particles "alive" until set)
-        self.alive = np.zeros((self.n_saves, self.n_particles), dtype=bool)
-
-        # Pre-initialize output ParticleDistribution
-        # This avoids repeated allocation when repeatedly calling get methods
-        self._output_pd = ParticleDistribution(
-            species=self.species,
-            n_particles=self.n_particles
-        )
+        self._allocate_storage()
 
         self._current_save_idx = 0
+        self._trajectory_index = {}
 
     def set_pd_at_step(self, pd: ParticleDistribution, step: int, time: float) -> None:
         """
@@ -129,9 +123,8 @@ class Beam:
 
         # Copy data into internal arrays
         self.t[save_idx] = time
-        self.x_vec[save_idx, :, :] = pd.x_vec[:]
-        self.v_vec[save_idx, :, :] = pd.v_vec[:]
-        self.alive[save_idx, :] = pd.alive[:]
+        self._store_save(save_idx, pd.x_vec, pd.v_vec, pd.alive)
+        self._invalidate_trajectory_index()
 
     def get_pd_at_step(self, step: int) -> ParticleDistribution:
         """
@@ -261,9 +254,9 @@ class Beam:
 
         Notes
         -----
-        Returns an explicit .copy() to ensure caller cannot accidentally
-        modify internal beam state. The pre-initialized _output_pd object
-        is reused for efficiency (only data arrays are updated).
+        The returned distribution owns copies of the stored arrays, so the
+        caller cannot accidentally modify internal beam state. Momenta are
+        recomputed from the stored velocities.
         """
         # Handle negative indices
         if index < 0:
@@ -274,15 +267,76 @@ class Beam:
                 f"Save index {index} out of range [0, {self.n_saves})"
             )
 
-        # Update the pre-allocated output object with data from this timestep
-        # Using view assignment (: slicing) which preserves reference
-        self._output_pd.t = self.t[index]
-        self._output_pd.x[:] = self.x_vec[index, :, :]
-        self._output_pd.v[:] = self.v_vec[index, :, :]
-        self._output_pd.alive[:] = self.alive[index, :]
+        x, v, alive = self._load_save(index)
+
+        # The constructor copies x_vec, so views of internal storage are safe here
+        pd = ParticleDistribution(species=self.species,
+                                  x_vec=np.asarray(x),
+                                  p_vec=np.zeros((self.n_particles, 3)),
+                                  recalculate=False)
+        pd.set_p_from_v_vec(np.asarray(v))
+        pd.alive = np.array(alive, dtype=bool)
+        pd.t = self.t[index]
+
+        return pd
+
+    def get_trajectory(self, particle_ids, quantity: str = 'x',
+                       use_index: bool = True) -> np.ndarray:
+        """
+        Retrieve the full save history of selected particles.
+
+        Parameters
+        ----------
+        particle_ids : int or array_like of int
+            Particle indices (0 to n_particles-1). Duplicates and any order allowed.
+        quantity : str
+            'x' for positions [m] or 'v' for velocities [m/s] (default: 'x')
+        use_index : bool
+            Read from the particle-major trajectory index, building it on first
+            use (default: True). If False, gather directly from the
+            step-major storage, which touches every save point.
+
+        Returns
+        -------
+        np.ndarray, shape (n_saves, k, 3)
+            A NEW array with the history of the k requested particles
+
+        Raises
+        ------
+        ValueError
+            If quantity is unknown
+        IndexError
+            If a particle index is out of range
+
+        Notes
+        -----
+        The index is a transposed copy (n_particles, n_saves, 3), so each
+        particle's history is contiguous. For Beam it doubles the memory of
+        the requested quantity; H5Beam stores it in the HDF5 file. Any call
+        to set_pd_at_step invalidates it.
+
+        Example
+        -------
+        > lost = np.where(~beam.alive[-1])[0]
+        > orbits = beam.get_trajectory(lost[:5])
+        """
+        if quantity not in ('x', 'v'):
+            raise ValueError(f"quantity must be 'x' or 'v', got '{quantity}'")
+
+        ids = np.atleast_1d(np.asarray(particle_ids, dtype=np.int64))
+        if np.any(ids < 0) or np.any(ids >= self.n_particles):
+            raise IndexError(
+                f"Particle indices out of range [0, {self.n_particles})"
+            )
+
+        if use_index:
+            index = self._get_trajectory_index(quantity)
+            if index is not None:
+                # Sorted, unique reads (required by h5py, cache friendly for NumPy)
+                unique_ids, inverse = np.unique(ids, return_inverse=True)
+                return np.asarray(index[unique_ids])[inverse].transpose(1, 0, 2).copy()
 
-        # Return a deep copy to prevent external modification of internal state
-        return self._output_pd.copy()
+        return self._load_particles(quantity, ids)
 
     def get_time_array(self) -> np.ndarray:
         """Return a copy of all saved times."""
@@ -294,4 +348,417 @@ class Beam:
 
     def reset_save_counter(self) -> None:
         """Reset internal save counter for sequential writes."""
-        self._current_save_idx = 0
\ No newline at end of file
+        self._current_save_idx = 0
+
+    # ========================================================================
+    # Storage Access (overridden by disk-backed variants)
+    # ========================================================================
+
+    def _allocate_storage(self) -> None:
+        """Preallocate in-memory arrays for all save points."""
+        self.t = np.full(self.n_saves, np.nan, dtype=np.float64)
+        self.x_vec = np.full((self.n_saves, self.n_particles, 3), np.nan, dtype=np.float64)
+        self.v_vec = np.full((self.n_saves, self.n_particles, 3), np.nan, dtype=np.float64)
+
+        # alive should be False (no particles "alive" until set)
+        self.alive = np.zeros((self.n_saves, self.n_particles), dtype=bool)
+
+    def _store_save(self, save_idx: int, x: np.ndarray, v: np.ndarray,
+                    alive: np.ndarray) -> None:
+        """Write positions, velocities and alive mask of one save point."""
+        self.x_vec[save_idx, :, :] = x[:]
+        self.v_vec[save_idx, :, :] = v[:]
+        self.alive[save_idx, :] = alive[:]
+
+    def _load_save(self, save_idx: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return views of positions, velocities and alive mask of one save point."""
+        return (self.x_vec[save_idx, :, :],
+                self.v_vec[save_idx, :, :],
+                self.alive[save_idx, :])
+
+    def _load_particles(self, quantity: str, ids: np.ndarray) -> np.ndarray:
+        """Gather (n_saves, k, 3) histories directly from step-major storage."""
+        data = self.x_vec if quantity == 'x' else self.v_vec
+        return data[:, ids, :]
+
+    def _get_trajectory_index(self, quantity: str) -> Optional[np.ndarray]:
+        """Return the particle-major (n_particles, n_saves, 3) copy, building it if needed."""
+        if quantity not in self._trajectory_index:
+            data = self.x_vec if quantity == 'x' else self.v_vec
+            self._trajectory_index[quantity] = np.ascontiguousarray(data.transpose(1, 0, 2))
+
+        return self._trajectory_index[quantity]
+
+    def _invalidate_trajectory_index(self) -> None:
+        """Drop the trajectory index after the stored data changed."""
+        self._trajectory_index.clear()
+
+
+# ============================================================================
+# Disk-Backed Storage
+# ============================================================================
+
+class _ChunkCache:
+    """
+    Write-back LRU cache of HDF5 chunks for H5Beam.
+
+    Chunks are addressed by (dataset name, step-chunk index, particle-chunk
+    index) and held as NumPy arrays. Modified chunks are written back to the
+    file when they are evicted or on flush(). The cache is bounded by the total
+    number of bytes held, not by the number of chunks, because the position
+    and alive datasets have very different chunk sizes.
+
+    Parameters
+    ----------
+    datasets : dict
+        Dataset name -> h5py.Dataset, all chunked as (chunk_steps, chunk_particles, ...)
+    chunk_steps : int
+        Number of save points per chunk
+    chunk_particles : int
+        Number of particles per chunk
+    max_bytes : int
+        Memory budget for cached chunks [bytes]
+    fresh : bool
+        True if the datasets were just created. Chunks that have never been
+        written then hold the fill value and need not be read from disk.
+    """
+
+    def __init__(self, datasets: Dict[str, h5py.Dataset], chunk_steps: int,
+                 chunk_particles: int, max_bytes: int, fresh: bool):
+        self._datasets = datasets
+        self._chunk_steps = chunk_steps
+        self._chunk_particles = chunk_particles
+        self._max_bytes = max_bytes
+        self._fresh = fresh
+
+        self._chunks = OrderedDict()
+        self._dirty = set()
+        self._on_disk = set()
+        self._nbytes = 0
+
+        self.hits = 0
+        self.misses = 0
+
+    def _slices(self, key: Tuple[str, int, int]) -> Tuple[slice, slice]:
+        """Return the (steps, particles) slices of the dataset covered by a chunk."""
+        name, si, pj = key
+        n_saves, n_particles = self._datasets[name].shape[:2]
+        s0 = si * self._chunk_steps
+        p0 = pj * self._chunk_particles
+
+        return (slice(s0, min(s0 + self._chunk_steps, n_saves)),
+                slice(p0, min(p0 + self._chunk_particles, n_particles)))
+
+    def get(self, name: str, si: int, pj: int) -> np.ndarray:
+        """Return the cached chunk (loading it on a miss)."""
+        key = (name, si, pj)
+        chunk = self._chunks.get(key)
+
+        if chunk is not None:
+            self._chunks.move_to_end(key)
+            self.hits += 1
+            return chunk
+
+        self.misses += 1
+        dset = self._datasets[name]
+        s_sl, p_sl = self._slices(key)
+
+        if self._fresh and key not in self._on_disk:
+            # Never written: no need to decompress a chunk of fill values
+            shape = (s_sl.stop - s_sl.start, p_sl.stop - p_sl.start) + dset.shape[2:]
+            chunk = np.full(shape, dset.fillvalue, dtype=dset.dtype)
+        else:
+            chunk = dset[s_sl, p_sl]
+
+        self._chunks[key] = chunk
+        self._nbytes += chunk.nbytes
+        self._evict()
+
+        return chunk
+
+    def mark_dirty(self, name: str, si: int, pj: int) -> None:
+        """Flag a cached chunk as modified."""
+        self._dirty.add((name, si, pj))
+
+    def _write_back(self, key: Tuple[str, int, int], chunk: np.ndarray) -> None:
+        s_sl, p_sl = self._slices(key)
+        self._datasets[key[0]][s_sl, p_sl] = chunk
+        self._on_disk.add(key)
+
+    def _evict(self) -> None:
+        """Drop least recently used chunks until the memory budget is met."""
+        # Always keep the most recent chunk, it is in use by the caller
+        while self._nbytes > self._max_bytes and len(self._chunks) > 1:
+            key, chunk = self._chunks.popitem(last=False)
+            self._nbytes -= chunk.nbytes
+
+            if key in self._dirty:
+                self._write_back(key, chunk)
+                self._dirty.discard(key)
+
+    def flush(self) -> None:
+        """Write all modified chunks to the file (chunks stay cached)."""
+        for key in self._dirty:
+            self._write_back(key, self._chunks[key])
+        self._dirty.clear()
+
+    def clear(self) -> None:
+        """Flush and drop all cached chunks."""
+        self.flush()
+        self._chunks.clear()
+        self._nbytes = 0
+
+
+@dataclass
+class H5Beam(Beam):
+    """
+    Beam with chunked, compressed HDF5 storage instead of in-memory arrays.
+
+    Same API as Beam (set_pd_at_step, get_pd_at_step, find_nearest_step, ...),
+    but positions, velocities and alive flags live in HDF5 datasets chunked
+    along both save points and particles. A write-back LRU cache keeps the
+    most recently used chunks in memory, so sequential writes of time slices
+    and reads of a few particle trajectories both touch only a small number
+    of chunks. Save times are small and are kept in memory as well as on disk.
+
+    Attributes
+    ----------
+    filename : str
+        Path to the HDF5 file
+    mode : str
+        'w' create (truncate), 'a' open existing for appending, 'r' read-only
+    chunk_steps : int
+        Save points per chunk (default: 16)
+    chunk_particles : int
+        Particles per chunk (default: 4096)
+    compression : str or None
+        HDF5 compression filter (default: 'gzip'), None to disable
+    compression_opts : int or None
+        Compression level for the filter (default: 4)
+    cache_mb : float
+        Memory budget of the chunk cache [MB] (default: 256). For efficient
+        sequential writes it should hold at least one row of chunks,
+        i.e. about chunk_steps * n_particles * 49 bytes.
+
+    Notes
+    -----
+    x_vec, v_vec and alive are the underlying h5py datasets. Modified chunks
+    may still be in the cache, so call flush() before accessing them directly.
+    The particle-major index used by get_trajectory is stored next to them
+    (x_vec_by_particle, v_vec_by_particle) and survives reopening the file.
+    Call close() (or use the beam as a context manager) when done writing.
+
+    Example
+    -------
+    > with H5Beam(species, n_particles=100000, n_steps=1000000, save_freq=100,
+    ...           filename='run.h5') as beam:
+    ...     beam.set_pd_at_step(pd, step=0, time=0.0)
+    """
+
+    filename: str = "beam.h5"
+    mode: str = "w"
+    chunk_steps: int = 16
+    chunk_particles: int = 4096
+    compression: Optional[str] = "gzip"
+    compression_opts: Optional[int] = 4
+    cache_mb: float = 256.0
+
+    _file: h5py.File = field(init=False, default=None, repr=False)
+    _cache: _ChunkCache = field(init=False, default=None, repr=False)
+
+    def _allocate_storage(self) -> None:
+        """Create (or open) chunked datasets for all save points."""
+        if self.mode not in ('w', 'a', 'r'):
+            raise ValueError(f"mode must be 'w', 'a' or 'r', got '{self.mode}'")
+
+        chunk_steps = max(1, min(self.chunk_steps, self.n_saves))
+        chunk_particles = max(1, min(self.chunk_particles, self.n_particles))
+
+        if self.mode != 'w' and not os.path.exists(self.filename):
+            # h5py would create an empty file for mode 'a'
+            raise FileNotFoundError(f"H5Beam file not found: {self.filename}")
+
+        self._file = h5py.File(self.filename, self.mode)
+
+        if self.mode == 'w':
+            self._file.attrs['n_particles'] = self.n_particles
+            self._file.attrs['n_steps'] = self.n_steps
+            self._file.attrs['save_freq'] = self.save_freq
+            self._file.attrs['species'] = getattr(self.species, 'name', str(self.species))
+
+            dset_kwargs = dict(compression=self.compression,
+                               compression_opts=self.compression_opts,
+                               shuffle=self.compression is not None)
+
+            self._file.create_dataset('t', shape=(self.n_saves,), dtype=np.float64,
+                                      fillvalue=np.nan)
+            for name in ['x_vec', 'v_vec']:
+                self._file.create_dataset(name, shape=(self.n_saves, self.n_particles, 3),
+                                          dtype=np.float64, fillvalue=np.nan,
+                                          chunks=(chunk_steps, chunk_particles, 3),
+                                          **dset_kwargs)
+            self._file.create_dataset('alive', shape=(self.n_saves, self.n_particles),
+                                      dtype=bool, fillvalue=False,
+                                      chunks=(chunk_steps, chunk_particles),
+                                      **dset_kwargs)
+        else:
+            if 'x_vec' not in self._file or 'n_particles' not in self._file.attrs:
+                self._file.close()
+                raise ValueError(f"{self.filename} is not an H5Beam file")
+
+            for key in ['n_particles', 'n_steps', 'save_freq']:
+                if self._file.attrs[key] != getattr(self, key):
+                    self._file.close()
+                    raise ValueError(
+                        f"{key}={getattr(self, key)} does not match "
+                        f"{key}={self._file.attrs[key]} stored in {self.filename}"
+                    )
+
+            # Chunk cache must follow the chunking the file was written with
+            chunk_steps, chunk_particles = self._file['x_vec'].chunks[:2]
+
+        self.chunk_steps = chunk_steps
+        self.chunk_particles = chunk_particles
+
+        self.t = self._file['t'][:]
+        self.x_vec = self._file['x_vec']
+        self.v_vec = self._file['v_vec']
+        self.alive = self._file['alive']
+
+        self._cache = _ChunkCache(
+            datasets={'x_vec': self.x_vec, 'v_vec': self.v_vec, 'alive': self.alive},
+            chunk_steps=chunk_steps,
+            chunk_particles=chunk_particles,
+            max_bytes=int(self.cache_mb * 1024 ** 2),
+            fresh=(self.mode == 'w')
+        )
+
+    def _particle_chunks(self):
+        """Yield (chunk index, first particle, last particle + 1) for all particle chunks."""
+        for p0 in range(0, self.n_particles, self.chunk_particles):
+            yield p0 // self.chunk_particles, p0, min(p0 + self.chunk_particles, self.n_particles)
+
+    def _store_save(self, save_idx: int, x: np.ndarray, v: np.ndarray,
+                    alive: np.ndarray) -> None:
+        """Scatter one save point into the cached chunks of its step-chunk row."""
+        if self.mode == 'r':
+            raise ValueError(f"H5Beam file {self.filename} was opened read-only")
+
+        si, row = divmod(save_idx, self.chunk_steps)
+
+        for name, data in (('x_vec', x), ('v_vec', v), ('alive', alive)):
+            for pj, p0, p1 in self._particle_chunks():
+                chunk = self._cache.get(name, si, pj)
+                chunk[row] = data[p0:p1]
+                self._cache.mark_dirty(name, si, pj)
+
+    def _load_save(self, save_idx: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Gather one save point from the cached chunks of its step-chunk row."""
+        si, row = divmod(save_idx, self.chunk_steps)
+
+        x = np.empty((self.n_particles, 3), dtype=np.float64)
+        v = np.empty((self.n_particles, 3), dtype=np.float64)
+        alive = np.empty(self.n_particles, dtype=bool)
+
+        for name, out in (('x_vec', x), ('v_vec', v), ('alive', alive)):
+            for pj, p0, p1 in self._particle_chunks():
+                out[p0:p1] = self._cache.get(name, si, pj)[row]
+
+        return x, v, alive
+
+    def _load_particles(self, quantity: str, ids: np.ndarray) -> np.ndarray:
+        """Gather (n_saves, k, 3) histories chunk by chunk through the cache."""
+        name = 'x_vec' if quantity == 'x' else 'v_vec'
+        out = np.empty((self.n_saves, len(ids), 3), dtype=np.float64)
+
+        # Group requested particles by the particle chunk they live in
+        chunk_of = ids // self.chunk_particles
+        groups = [(pj, np.where(chunk_of == pj)[0]) for pj in np.unique(chunk_of)]
+
+        for s0 in range(0, self.n_saves, self.chunk_steps):
+            si = s0 // self.chunk_steps
+            s1 = min(s0 + self.chunk_steps, self.n_saves)
+
+            for pj, sel in groups:
+                chunk = self._cache.get(name, si, pj)
+                out[s0:s1, sel] = chunk[:, ids[sel] - pj * self.chunk_particles]
+
+        return out
+
+    def _get_trajectory_index(self, quantity: str) -> Optional[h5py.Dataset]:
+        """
+        Return the particle-major index dataset, building it in the file if needed.
+
+        Returns None for read-only files without a valid index, in which case
+        get_trajectory falls back to reading through the chunk cache.
+        """
+        if quantity in self._trajectory_index:
+            return self._trajectory_index[quantity]
+
+        name = f"{'x_vec' if quantity == 'x' else 'v_vec'}_by_particle"
+
+        if name in self._file and self._file[name].attrs['valid']:
+            self._trajectory_index[quantity] = self._file[name]
+            return self._file[name]
+
+        if self.mode == 'r':
+            return None
+
+        # Source chunks must be on disk before reading around the cache
+        self._cache.flush()
+        source = self.x_vec if quantity == 'x' else self.v_vec
+
+        if name not in self._file:
+            # Few particles per chunk, many save points: one chunk ~ a few orbits
+            index_particles = min(16, self.n_particles)
+            index_steps = max(1, min(self.n_saves, (1024 ** 2) // (index_particles * 24)))
+            self._file.create_dataset(name, shape=(self.n_particles, self.n_saves, 3),
+                                      dtype=np.float64, fillvalue=np.nan,
+                                      chunks=(index_particles, index_steps, 3),
+                                      compression=self.compression,
+                                      compression_opts=self.compression_opts,
+                                      shuffle=self.compression is not None)
+        index = self._file[name]
+
+        # Transpose one block of source chunks at a time within the cache budget
+        block_bytes = self.chunk_steps * self.chunk_particles * 24
+        steps_per_block = self.chunk_steps * max(1, int(self.cache_mb * 1024 ** 2) // (2 * block_bytes))
+
+        for _, p0, p1 in self._particle_chunks():
+            for s0 in range(0, self.n_saves, steps_per_block):
+                s1 = min(s0 + steps_per_block, self.n_saves)
+                index[p0:p1, s0:s1] = source[s0:s1, p0:p1].transpose(1, 0, 2)
+
+        index.attrs['valid'] = True
+        self._trajectory_index[quantity] = index
+
+        return index
+
+    def _invalidate_trajectory_index(self) -> None:
+        """Mark index datasets in the file as stale after the stored data changed."""
+        # Also indexes built in an earlier session that were never loaded here
+        for name in ('x_vec_by_particle', 'v_vec_by_particle'):
+            if name in self._file and self._file[name].attrs['valid']:
+                self._file[name].attrs['valid'] = False
+        self._trajectory_index.clear()
+
+    def flush(self) -> None:
+        """Write cached chunks and save times to the file."""
+        if self.mode == 'r':
+            return
+
+        self._cache.flush()
+        self._file['t'][:] = self.t
+        self._file.flush()
+
+    def close(self) -> None:
+        """Flush and close the HDF5 file."""
+        if self._file is not None and self._file.id.valid:
+            self.flush()
+            self._file.close()
+
+    def __enter__(self) -> 'H5Beam':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
@@ -13,14 +13,19 @@ from .field_src.field_loaders import *
 import h5py
 import pickle
 import os
+import inspect
+import hashlib
 import warnings
+from collections import OrderedDict
 from typing import Optional, Union, Tuple, Dict, List, Callable
 from abc import ABC, abstractmethod
-from .field_src.interpolators import get_interpolator
+from .field_src.interpolators import get_interpolator, get_stacked_interpolator, SymmetricInterpolator, \
+    CylindricalInterpolator, MidplaneExpansionInterpolator, LazyBrickInterpolator, NestedGridInterpolator, \
+    _periodic_theta_grid
 
 try:
     import numba
-    from numba import njit
+    from numba import njit, prange
 
     HAS_NUMBA = True
 except ImportError:
@@ -36,6 +41,9 @@ except ImportError:
             return args[0]
         return decorator
 
+
+    prange = range
+
 try:
     import openpmd_api as io
 
@@ -60,6 +68,125 @@ UNIT_SCALES = {
     "V/mm": 1000.0,
 }
 
+# Step [m] of the central-difference gradient for fields without analytic gradients
+GRADIENT_STEP = 1e-6
+
+
+# ============================================================================
+# Field Symmetry
+# ============================================================================
+
+class FieldSymmetry:
+    """
+    Declared symmetry of a field map, so only the fundamental domain is stored.
+
+    Supports N-fold rotational (sector) symmetry about the z axis and
+    midplane mirror symmetry z -> -z with component sign flips. Query points
+    are folded into the fundamental domain inside the interpolation kernel
+    (see SymmetricInterpolator), cutting memory by up to 2N.
+
+    Parameters
+    ----------
+    n_sectors : int
+        N-fold rotational symmetry (1 = none)
+    sector_start : float
+        Start angle of the stored sector [deg]
+    mirror_z : bool
+        Midplane symmetry (3D maps only)
+    mirror_signs : tuple of float
+        Signs of (Fx, Fy, Fz) below the midplane. Default (-1, -1, 1) is the
+        magnetic midplane symmetry of a cyclotron; use (1, 1, -1) for E fields
+
+    Examples
+    --------
+    # 4-sector cyclotron magnet, only 0° <= θ < 90°, z >= 0 stored
+    > sym = FieldSymmetry(n_sectors=4, mirror_z=True)
+    > B = Field.from_arrays(grid, values, symmetry=sym)  # full map is cropped
+    """
+
+    def __init__(self,
+                 n_sectors: int = 1,
+                 sector_start: float = 0.0,
+                 mirror_z: bool = False,
+                 mirror_signs: Tuple[float, float, float] = (-1.0, -1.0, 1.0)):
+        if n_sectors < 1:
+            raise ValueError(f"n_sectors must be >= 1, got {n_sectors}")
+
+        self.n_sectors = int(n_sectors)
+        self.sector_start = float(sector_start)
+        self.mirror_z = bool(mirror_z)
+        self.mirror_signs = tuple(float(sign) for sign in mirror_signs)
+
+    def __repr__(self):
+        return (f"FieldSymmetry(n_sectors={self.n_sectors}, sector_start={self.sector_start}, "
+                f"mirror_z={self.mirror_z}, mirror_signs={self.mirror_signs})")
+
+    def crop(self, grid_points: Tuple[np.ndarray, ...],
+             values: Dict[str, np.ndarray]) -> Tuple[Tuple[np.ndarray, ...], Dict[str, np.ndarray]]:
+        """
+        Crop a map to the bounding box of the fundamental domain.
+
+        Keeps one extra grid cell on each side so that points on the domain
+        boundary interpolate between stored nodes. Maps that already cover
+        only the fundamental domain are returned unchanged.
+
+        Parameters
+        ----------
+        grid_points : tuple of np.ndarray
+            (x, y) or (x, y, z) grid
+        values : dict
+            {'x', 'y', 'z': ND array} field components
+
+        Returns
+        -------
+        grid_points, values
+            Cropped grid and component arrays (views of the input)
+        """
+        slices = [slice(None)] * len(grid_points)
+
+        if self.n_sectors > 1:
+            gx, gy = grid_points[0], grid_points[1]
+            r_max = np.sqrt(max(abs(gx[0]), abs(gx[-1])) ** 2 + max(abs(gy[0]), abs(gy[-1])) ** 2)
+
+            # Wedge corners plus the axis crossings inside the wedge
+            a0 = np.deg2rad(self.sector_start)
+            a1 = a0 + 2.0 * np.pi / self.n_sectors
+            angles = [a0, a1] + list(np.arange(np.ceil(a0 / (np.pi / 2)), a1 / (np.pi / 2)) * np.pi / 2)
+            xs = np.array([0.0] + [r_max * np.cos(a) for a in angles])
+            ys = np.array([0.0] + [r_max * np.sin(a) for a in angles])
+
+            slices[0] = _covering_slice(gx, xs.min(), xs.max())
+            slices[1] = _covering_slice(gy, ys.min(), ys.max())
+
+        if self.mirror_z and len(grid_points) == 3:
+            gz = grid_points[2]
+            slices[2] = _covering_slice(gz, 0.0, gz[-1])
+
+        grid_points = tuple(g[sl] for g, sl in zip(grid_points, slices))
+        values = {k: v[tuple(slices)] for k, v in values.items()}
+
+        return grid_points, values
+
+    def build_interpolator(self, grid_points: Tuple[np.ndarray, ...],
+                           values: Dict[str, np.ndarray]) -> SymmetricInterpolator:
+        """Crop to the fundamental domain and create the vector interpolator"""
+        grid_points, values = self.crop(grid_points, values)
+        stacked = np.stack([values[k] for k in ['x', 'y', 'z']], axis=-1)
+
+        return SymmetricInterpolator(grid_points, stacked,
+                                     n_sectors=self.n_sectors,
+                                     sector_start=np.deg2rad(self.sector_start),
+                                     mirror_z=self.mirror_z,
+                                     mirror_signs=self.mirror_signs,
+                                     fill_value=0.0)
+
+
+def _covering_slice(grid: np.ndarray, lo: float, hi: float) -> slice:
+    """Index range of grid covering [lo, hi] plus one cell on each side"""
+    i_lo = max(np.searchsorted(grid, lo, side='right') - 2, 0)
+    i_hi = min(np.searchsorted(grid, hi, side='left') + 2, len(grid))
+    return slice(i_lo, i_hi)
+
 
 # ============================================================================
 # Field Base Classes
@@ -85,20 +212,108 @@ class FieldBase(ABC):
         """
         pass
 
+    @property
+    def time_dependent(self) -> bool:
+        """True if the field is evaluated as field(pts, t)"""
+        return False
 
-    def gradient(self, pts: np.ndarray) -> np.ndarray:
+    def gradient(self, pts: np.ndarray, t: Optional[Union[float, np.ndarray]] = None) -> np.ndarray:
         """
-        Compute field gradient (optional, not all fields support this)
+        Compute field gradient (Jacobian) at points.
 
         Returns
         -------
         grad : np.ndarray
             Gradient tensor, shape (N, 3, 3) - grad[i,j,k] = d(F_j)/d(x_k)
         """
-        raise NotImplementedError("Gradient not implemented for this field type")
+        return self.value_and_gradient(pts, t)[1]
+
+    def value_and_gradient(self, pts: np.ndarray,
+                           t: Optional[Union[float, np.ndarray]] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Field values and Jacobian at points.
+
+        Grid-based fields use analytic interpolator gradients (one cell lookup
+        per point). The default is a central difference with step GRADIENT_STEP,
+        evaluated as a single batch of 7M points.
+
+        Parameters
+        ----------
+        pts : np.ndarray(M, 3)
+            Points to evaluate
+        t : float or np.ndarray(M,), optional
+            Time [s] for time-dependent fields
+
+        Returns
+        -------
+        field_values : np.ndarray(M, 3)
+        grad : np.ndarray(M, 3, 3)
+            grad[i, j, k] = d(F_j)/d(x_k)
+        """
+        return _finite_difference_gradient(self, pts, t)
+
+    def cached(self, max_bytes: int = 256 * 2 ** 20) -> 'CachedField':
+        """Memoizing wrapper for repeated evaluation on the same points (see CachedField)"""
+        return CachedField(self, max_bytes=max_bytes)
+
+    # ========================================================================
+    # Field Algebra
+    # ========================================================================
+
+    def __add__(self, other):
+        """Add two fields"""
+        if isinstance(other, (int, float)):
+            return ScaledField(self, offset=other)
+        return CompositeField([self, other], [1.0, 1.0])
+
+    def __mul__(self, scalar: float):
+        """Scale field by constant"""
+        return ScaledField(self, scale=scalar)
+
+    def __rmul__(self, scalar: float):
+        """Scale field by constant (reverse)"""
+        return self.__mul__(scalar)
+
+    def __sub__(self, other):
+        """Subtract fields"""
+        if isinstance(other, (int, float)):
+            return ScaledField(self, offset=-other)
+        return CompositeField([self, other], [1.0, -1.0])
+
+
+class _MapFieldMixin:
+    """
+    Accessors shared by fields loaded from maps.
+
+    Expects the attributes _label, _dim, _scaling and _metadata.
+    """
+
+    @property
+    def label(self) -> str:
+        return self._label
+
+    @label.setter
+    def label(self, value: str):
+        self._label = value
+
+    @property
+    def dim(self) -> int:
+        return self._dim
+
+    @property
+    def scaling(self) -> float:
+        return self._scaling
+
+    @scaling.setter
+    def scaling(self, value: float):
+        self._scaling = value
+
+    @property
+    def metadata(self) -> dict:
+        return self._metadata
 
 
-class Field(FieldBase):
+class Field(_MapFieldMixin, FieldBase):
     """
     Electromagnetic field interpolation class.
 
@@ -120,6 +335,19 @@ class Field(FieldBase):
         Spatial units ('m', 'cm', 'mm')
     debug : bool
         Enable debug output
+    method : str
+        Interpolation method: 'linear' (default) or 'cubic' (C1 continuous,
+        for smooth orbit and tune calculations)
+    interpolator_backend : str
+        'auto', 'numba', 'fast' or 'scipy' (see get_interpolator)
+    symmetry : FieldSymmetry, optional
+        Declared sector/mirror symmetry. Grid-based maps are cropped to the
+        fundamental domain and queries are folded into it
+    layout : str
+        Storage of 3D Cartesian maps: 'plain' (default, one C-ordered array
+        per component) or 'tiled' (one array of 8x8x8 bricks with the three
+        components interleaved, fewer cache misses per stencil on large
+        maps; linear Numba interpolation only, see benchmark_layouts)
 
     Examples
     --------
@@ -140,7 +368,12 @@ class Field(FieldBase):
                  units: str = "m",
                  debug: bool = False,
                  method: str = "linear",
-                 interpolator_backend: str = 'auto'):
+                 interpolator_backend: str = 'auto',
+                 symmetry: Optional[FieldSymmetry] = None,
+                 layout: str = 'plain'):
+
+        if layout not in ('plain', 'tiled'):
+            raise ValueError(f"Unknown layout '{layout}'. Use 'plain' or 'tiled'")
 
         self._label = label
         self._dim = dim
@@ -150,6 +383,9 @@ class Field(FieldBase):
         self._metadata = {}
         self._interpolator_backend = interpolator_backend
         self._method = method
+        self._symmetry = symmetry
+        self._layout = layout
+        self._vector_field = None  # Single (M, 3) interpolator for symmetric or tiled maps
 
         # Unit conversion
         if units not in UNIT_SCALES:
@@ -210,20 +446,27 @@ class Field(FieldBase):
     # Core API
     # ========================================================================
 
-    def __call__(self, pts: np.ndarray) -> np.ndarray:
+    def __call__(self, pts: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
         """
         Evaluate field at points.
 
+        Float64 point arrays of any layout (C, Fortran, strided views) are read
+        in place. For Numba-backed maps the scaled components are written
+        straight into the result, so with a reused out buffer a call
+        allocates nothing.
+
         Parameters
         ----------
         pts : array_like
             Points to evaluate. Shape must be (M, 3) where M is number of points.
             Single points should be passed as [[x, y, z]] (shape (1, 3)).
+        out : np.ndarray(M, 3), optional
+            float64 buffer to write the result into
 
         Returns
         -------
         field_values : np.ndarray(M, 3)
-            Field components [Fx, Fy, Fz] at each point.
+            Field components [Fx, Fy, Fz] at each point (out, if given).
             Always returns 2D array, even for single point.
 
         Examples
@@ -236,12 +479,62 @@ class Field(FieldBase):
         array([[1., 0., 0.],
                [1., 0., 0.]])
         """
+        pts = np.atleast_2d(np.asarray(pts, dtype=np.float64))
+
+        if pts.shape[1] != 3:
+            raise ValueError(f"Points must have shape (M, 3), got {pts.shape}")
+
+        if out is not None and (out.shape != pts.shape or out.dtype != np.float64):
+            raise ValueError(f"out must be a float64 array of shape {pts.shape}, got {out.dtype} {out.shape}")
+
+        interpolators = [self._field[k] for k in ['x', 'y', 'z']]
+        if (self._dim > 0 and self._vector_field is None and
+                all(hasattr(f, 'evaluate_into') for f in interpolators)):
+            if out is None:
+                out = np.empty(pts.shape, dtype=np.float64)
+            axes = [{'x': 0, 'y': 1, 'z': 2}[k] for k in _FIELD_AXES[self._dim]]
+            for j, interpolator in enumerate(interpolators):
+                interpolator.evaluate_into(pts, axes, out, j, self._scaling)
+            return out
+
+        field_values = self._call_dispatch[self._dim](pts)
+        if out is None:
+            return field_values
+
+        out[:] = field_values
+        return out
+
+    def value_and_gradient(self, pts: np.ndarray,
+                           t: Optional[Union[float, np.ndarray]] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Field values and analytic Jacobian (see FieldBase.value_and_gradient).
+
+        Numba-backed maps differentiate the linear or cubic interpolation
+        weights of the cell; other backends and vector (symmetric,
+        cylindrical) maps fall back to central differences.
+        """
         pts = np.atleast_2d(pts)
 
         if pts.shape[1] != 3:
             raise ValueError(f"Points must have shape (M, 3), got {pts.shape}")
 
-        return self._call_dispatch[self._dim](pts)
+        M = len(pts)
+        if self._dim == 0:
+            return self._get_field_0d(pts), np.zeros((M, 3, 3))
+
+        interpolators = [self._field[k] for k in ['x', 'y', 'z']]
+        if self._vector_field is not None or not all(hasattr(f, 'value_and_gradient') for f in interpolators):
+            return _finite_difference_gradient(self, pts, t)
+
+        axes = [{'x': 0, 'y': 1, 'z': 2}[k] for k in _FIELD_AXES[self._dim]]
+        coords = pts[:, axes]
+
+        field_values = np.empty((M, 3))
+        grad = np.zeros((M, 3, 3))
+        for j, interpolator in enumerate(interpolators):
+            field_values[:, j], grad[:, j, axes] = interpolator.value_and_gradient(coords)
+
+        return self._scaling * field_values, self._scaling * grad
 
     def __str__(self) -> str:
         if self._dim == 0:
@@ -253,30 +546,6 @@ class Field(FieldBase):
     def __repr__(self) -> str:
         return f"Field(label='{self._label}', dim={self._dim}, scaling={self._scaling})"
 
-    # ========================================================================
-    # Field Algebra
-    # ========================================================================
-
-    def __add__(self, other):
-        """Add two fields"""
-        if isinstance(other, (int, float)):
-            return ScaledField(self, offset=other)
-        return CompositeField([self, other], [1.0, 1.0])
-
-    def __mul__(self, scalar: float):
-        """Scale field by constant"""
-        return ScaledField(self, scale=scalar)
-
-    def __rmul__(self, scalar: float):
-        """Scale field by constant (reverse)"""
-        return self.__mul__(scalar)
-
-    def __sub__(self, other):
-        """Subtract fields"""
-        if isinstance(other, (int, float)):
-            return ScaledField(self, offset=-other)
-        return CompositeField([self, other], [1.0, -1.0])
-
     # ========================================================================
     # Class Methods (Loaders)
     # ========================================================================
@@ -291,7 +560,11 @@ class Field(FieldBase):
         filename : str
             Path to field file
         **kwargs
-            Additional arguments passed to specific loader
+            Field constructor arguments; all others are passed to the
+            specific loader. Polar maps (.dat, .map) are kept on their
+            native cylindrical grid unless cartesian_grid=True is given,
+            or a mirror_z symmetry or non-linear method requires the
+            Cartesian map
 
         Returns
         -------
@@ -303,42 +576,48 @@ class Field(FieldBase):
 
         _, ext = os.path.splitext(filename)
 
-        field = cls(**kwargs)
+        init_params = inspect.signature(cls.__init__).parameters
+        init_kwargs = {k: v for k, v in kwargs.items() if k in init_params}
+        loader_kwargs = {k: v for k, v in kwargs.items() if k not in init_params}
+
+        field = cls(**init_kwargs)
         field._filename = filename
 
+        # Native polar grids support neither z mirroring nor cubic interpolation
+        native_ok = ((field._symmetry is None or not field._symmetry.mirror_z)
+                     and field._method == 'linear')
+        if ext in (".dat", ".map") and HAS_NUMBA and native_ok:
+            loader_kwargs.setdefault('cartesian_grid', False)
+
         if ext == ".pickle":
             field._load_pickle(filename)
             _data = None
         elif ext == ".h5" or ext == ".h5part":
-            _data = field._load_h5part(filename, **kwargs)
+            _data = field._load_h5part(filename, **loader_kwargs)
         elif ext == ".table":
-            _data = field._load_opera_table(filename, **kwargs)
+            _data = field._load_opera_table(filename, **loader_kwargs)
         elif ext == ".comsol":
-            _data = field._load_comsol(filename, **kwargs)
+            _data = field._load_comsol(filename, **loader_kwargs)
         elif ext == ".dat":
-            _data = field._load_opal_midplane(filename, **kwargs)
+            _data = field._load_opal_midplane(filename, **loader_kwargs)
         elif ext == ".map":
-            _data = field._load_aima_agora(filename, **kwargs)
+            _data = field._load_aima_agora(filename, **loader_kwargs)
         else:
             raise ValueError(f"Unknown file extension: {ext}")
 
-        if _data is not None:
+        if _data is not None and _data.get('coordinate_system') == 'cylindrical':
+            field._dim = _data['dim']
+            field._metadata = _data['metadata']
+            field._build_cylindrical_interpolator(_data['grid'], _data['values'])
+
+        elif _data is not None:
             # Determine dimensionality
             grid_points = [_data['grid'][k] for k in ['x', 'y', 'z'] if k in _data['grid'] and len(_data['grid'][k]) > 1]
             field._dim = _data['dim']
             field._metadata = _data['metadata']
 
             # Create interpolators
-            for component in ['x', 'y', 'z']:
-                if component in _data['values']:
-                    field._field[component] = get_interpolator(
-                        points=tuple(grid_points),
-                        values=_data['values'][component],
-                        bounds_error=False,
-                        fill_value=0.0,
-                        method=field._method,
-                        backend=field._interpolator_backend  # Use selected backend
-                    )
+            field._build_interpolators(tuple(grid_points), _data['values'])
 
         return field
 
@@ -373,16 +652,7 @@ class Field(FieldBase):
         field._dim = len(grid_points)
 
         # Create interpolators
-        for component in ['x', 'y', 'z']:
-            if component in values:
-                field._field[component] = get_interpolator(
-                    points=tuple(grid_points),
-                    values=values[component],
-                    bounds_error=False,
-                    fill_value=0.0,
-                    method=field._method,
-                    backend=field._interpolator_backend  # Use selected backend
-                )
+        field._build_interpolators(tuple(grid_points), values)
 
         return field
 
@@ -406,33 +676,70 @@ class Field(FieldBase):
                 )
             return field
 
-    # ========================================================================
-    # Properties
-    # ========================================================================
+    def _build_interpolators(self, grid_points: Tuple[np.ndarray, ...], values: Dict[str, np.ndarray]):
+        """Create per-component interpolators, or one vector interpolator if symmetric"""
+        if self._symmetry is not None:
+            if self._method != 'linear':
+                warnings.warn(f"Symmetric maps use linear interpolation, ignoring method='{self._method}'")
+            self._vector_field = self._symmetry.build_interpolator(grid_points, values)
+            return
+
+        if self._layout == 'tiled':
+            if len(grid_points) == 3 and self._method == 'linear' and self._interpolator_backend in ('auto', 'numba') \
+                    and HAS_NUMBA:
+                shape = tuple(len(g) for g in grid_points)
+                stacked = np.stack([values.get(k, np.zeros(shape)) for k in ['x', 'y', 'z']], axis=-1)
+                self._vector_field = get_stacked_interpolator(grid_points, stacked, bounds_error=False,
+                                                              fill_value=0.0, backend='numba', layout='tiled')
+                return
+
+            warnings.warn("Tiled layout needs a 3D map with linear Numba interpolation, using layout='plain'")
 
-    @property
-    def label(self) -> str:
-        return self._label
+        for component in ['x', 'y', 'z']:
+            if component in values:
+                self._field[component] = get_interpolator(
+                    points=grid_points,
+                    values=values[component],
+                    bounds_error=False,
+                    fill_value=0.0,
+                    method=self._method,
+                    backend=self._interpolator_backend  # Use selected backend
+                )
 
-    @label.setter
-    def label(self, value: str):
-        self._label = value
+    def _build_cylindrical_interpolator(self, grid: Dict[str, np.ndarray], values: Dict[str, np.ndarray]):
+        """
+        Vector interpolator on a native (r, theta[, z]) grid.
 
-    @property
-    def dim(self) -> int:
-        return self._dim
+        grid: 'r' [m], 'theta' [deg], 'z' [m]; values: 'r', 'theta', 'z'
+        cylindrical components, shape (nr, nth) for 2D or (nr, nth, nz) for 3D.
+        """
+        if self._method != 'linear':
+            warnings.warn(f"Cylindrical maps use linear interpolation, ignoring method='{self._method}'. "
+                          f"Load with cartesian_grid=True for a cubic Cartesian map")
 
-    @property
-    def scaling(self) -> float:
-        return self._scaling
+        theta_period = 2.0 * np.pi
+        if self._symmetry is not None:
+            if self._symmetry.mirror_z:
+                raise ValueError("mirror_z symmetry is not supported for cylindrical maps, "
+                                 "store the full z range")
+            theta_period /= self._symmetry.n_sectors
 
-    @scaling.setter
-    def scaling(self, value: float):
-        self._scaling = value
+        points = [grid['r'], np.deg2rad(grid['theta'])]
+        if self._dim == 3:
+            points.append(grid['z'])
+
+        stacked = np.stack([values[k] for k in ['r', 'theta', 'z']], axis=-1)
+
+        self._vector_field = CylindricalInterpolator(tuple(points), stacked,
+                                                     theta_period=theta_period, fill_value=0.0)
+
+    # ========================================================================
+    # Properties
+    # ========================================================================
 
     @property
-    def metadata(self) -> dict:
-        return self._metadata
+    def symmetry(self) -> Optional[FieldSymmetry]:
+        return self._symmetry
 
     # ========================================================================
     # Internal Evaluation Methods
@@ -482,6 +789,9 @@ class Field(FieldBase):
         """
         xy = pts[:, :2]
 
+        if self._vector_field is not None:
+            return self._scaling * self._vector_field(xy)
+
         fx = self._scaling * self._field["x"](xy)
         fy = self._scaling * self._field["y"](xy)
         fz = self._scaling * self._field["z"](xy)
@@ -497,6 +807,9 @@ class Field(FieldBase):
         field_values : np.ndarray(M, 3)
             Field components [Fx, Fy, Fz] for M points
         """
+        if self._vector_field is not None:
+            return self._scaling * self._vector_field(pts)
+
         fx = self._scaling * self._field["x"](pts)
         fy = self._scaling * self._field["y"](pts)
         fz = self._scaling * self._field["z"](pts)
@@ -513,7 +826,8 @@ class Field(FieldBase):
             data = pickle.load(f)
 
         # Restore attributes
-        for key in ['_label', '_dim', '_scaling', '_field', '_unit_scale', '_metadata']:
+        for key in ['_label', '_dim', '_scaling', '_field', '_unit_scale', '_metadata',
+                    '_symmetry', '_vector_field']:
             if key in data:
                 setattr(self, key, data[key])
 
@@ -525,7 +839,9 @@ class Field(FieldBase):
             '_scaling': self._scaling,
             '_field': self._field,
             '_unit_scale': self._unit_scale,
-            '_metadata': self._metadata
+            '_metadata': self._metadata,
+            '_symmetry': self._symmetry,
+            '_vector_field': self._vector_field
         }
 
         with open(filename, "wb") as f:
@@ -536,27 +852,27 @@ class Field(FieldBase):
     @staticmethod
     def _load_h5part(filename: str, **kwargs):
         """Load from H5Part format"""
-        return load_h5part(filename)
+        return load_h5part(filename, **kwargs)
 
     @staticmethod
     def _load_opera_table(filename: str, **kwargs):
         """Load from OPERA table format"""
-        return load_opera_table(filename)
+        return load_opera_table(filename, **kwargs)
 
     @staticmethod
     def _load_comsol(filename: str, **kwargs):
         """Load from COMSOL export format"""
-        return load_comsol(filename)
+        return load_comsol(filename, **kwargs)
 
     @staticmethod
     def _load_opal_midplane(filename: str, **kwargs):
         """Load from OPAL midplane format"""
-        return load_opal_midplane(filename)
+        return load_opal_midplane(filename, **kwargs)
 
     @staticmethod
     def _load_aima_agora(filename: str, **kwargs):
         """Load from AIMA Agora format"""
-        return load_aima_agora(filename)
+        return load_aima_agora(filename, **kwargs)
 
 
 # ============================================================================
@@ -600,12 +916,26 @@ class CompositeField(FieldBase):
 
     Uses Numba JIT parallelization for efficient batch queries when M > 100.
 
+    Grid-backed components that share a mesh (or all static components, if a
+    resample_grid is given) are collapsed lazily into a single pre-summed
+    Field, so a query costs one interpolation per mesh instead of one per
+    component. The pre-summed grid is rebuilt on the next call whenever the
+    weights (or the scaling of a component Field) change. Since interpolation
+    is linear in the grid values, the result on a shared mesh is the same as
+    summing the component interpolations.
+
     Parameters
     ----------
     fields : list of Field
         Component fields
     weights : list of float
         Weights for each field
+    presum : bool
+        Collapse components on a shared mesh into one grid (default: True)
+    resample_grid : dict, optional
+        Common mesh {'x': x_array, 'y': y_array, 'z': z_array}. If given, all
+        static components are sampled onto it once and pre-summed (requires
+        presum); time-dependent components are always evaluated directly
 
     Examples
     --------
@@ -613,22 +943,54 @@ class CompositeField(FieldBase):
     > B_corr = Field.from_file('correction_coils.table')
     > B_total = CompositeField([B_main, B_corr], [1.0, 0.8])
     > B_values = B_total([[0, 0, 0]])  # Returns (1, 3) array
+    > B_total.weights[1] = 0.9  # Re-summed on next call
     """
 
-    def __init__(self, fields: List[FieldBase], weights: List[float]):
+    def __init__(self, fields: List[FieldBase], weights: List[float],
+                 presum: bool = True,
+                 resample_grid: Optional[Dict[str, np.ndarray]] = None):
         if len(fields) != len(weights):
             raise ValueError("Number of fields must match number of weights")
 
         self.fields = fields
-        self.weights = np.array(weights, dtype=np.float64)
         self.n_fields = len(fields)
+        self.weights = weights
 
-    def __call__(self, pts: np.ndarray) -> np.ndarray:
+        self._presum = presum
+        self._resample_grid = resample_grid
+
+        # Built lazily on first call
+        self._groups = None  # list of dicts, one per pre-summed mesh
+        self._direct_idx = list(range(self.n_fields))
+
+    @property
+    def weights(self) -> np.ndarray:
+        return self._weights
+
+    @weights.setter
+    def weights(self, value):
+        value = np.array(value, dtype=np.float64)
+        if len(value) != self.n_fields:
+            raise ValueError("Number of fields must match number of weights")
+        self._weights = value
+
+    @property
+    def time_dependent(self) -> bool:
+        return any(_is_time_dependent(field) for field in self.fields)
+
+    def __call__(self, pts: np.ndarray, t: Optional[Union[float, np.ndarray]] = None) -> np.ndarray:
         """
         Evaluate composite field at points.
 
         Uses Numba parallelization for large queries (M > 100).
 
+        Parameters
+        ----------
+        pts : np.ndarray(M, 3)
+            Points to evaluate
+        t : float or np.ndarray(M,), optional
+            Time [s], passed on to time-dependent components
+
         Returns
         -------
         field_values : np.ndarray(M, 3)
@@ -637,27 +999,210 @@ class CompositeField(FieldBase):
         pts = np.atleast_2d(pts)
         M = len(pts)
 
+        if self._presum:
+            self._update_presummed()
+            terms = [(group['field'], 1.0) for group in self._groups]
+            terms += [(self.fields[i], self.weights[i]) for i in self._direct_idx]
+        else:
+            terms = zip(self.fields, self.weights)
+
         # Initialize output array
         field_total = np.zeros((M, 3), dtype=np.float64)
 
         # Choose algorithm based on query size
         if HAS_NUMBA and M > 100:
             # Use parallel Numba kernel for large queries
-            for field, weight in zip(self.fields, self.weights):
-                field_values = field(pts)  # Returns (M, 3)
+            for field, weight in terms:
+                field_values = _evaluate_field(field, pts, t)  # Returns (M, 3)
                 _composite_field_add_kernel(field_total, field_values, weight)
         else:
             # Use simple NumPy for small queries (less overhead)
-            for field, weight in zip(self.fields, self.weights):
-                field_values = field(pts)  # Returns (M, 3)
+            for field, weight in terms:
+                field_values = _evaluate_field(field, pts, t)  # Returns (M, 3)
                 field_total += weight * field_values
 
         return field_total
 
+    def value_and_gradient(self, pts: np.ndarray,
+                           t: Optional[Union[float, np.ndarray]] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Weighted sum of component values and Jacobians"""
+        pts = np.atleast_2d(pts)
+
+        if self._presum:
+            self._update_presummed()
+            terms = [(group['field'], 1.0) for group in self._groups]
+            terms += [(self.fields[i], self.weights[i]) for i in self._direct_idx]
+        else:
+            terms = zip(self.fields, self.weights)
+
+        field_total = np.zeros((len(pts), 3))
+        grad_total = np.zeros((len(pts), 3, 3))
+        for field, weight in terms:
+            field_values, grad = _evaluate_gradient(field, pts, t)
+            field_total += weight * field_values
+            grad_total += weight * grad
+
+        return field_total, grad_total
+
+    def refresh(self):
+        """Discard pre-summed grids (e.g. after editing component grid data)"""
+        self._groups = None
+        self._direct_idx = list(range(self.n_fields))
+
+    # ========================================================================
+    # Pre-summed Grids
+    # ========================================================================
+
+    def _effective_weight(self, i: int) -> float:
+        """Weight of component i applied to its unscaled grid values"""
+        field = self.fields[i]
+        scale = field.scaling if isinstance(field, Field) else 1.0
+        return self.weights[i] * scale
+
+    def _build_groups(self):
+        """Sort components into pre-summable meshes and direct terms"""
+        self._groups = []
+
+        if self._resample_grid is not None:
+            grid, pts = _resample_points(self._resample_grid)
+            members = []
+            direct_idx = []
+            for i, field in enumerate(self.fields):
+                # A snapshot of a time-dependent field would freeze it at one time
+                if _is_time_dependent(field):
+                    direct_idx.append(i)
+                else:
+                    members.append((i, _sample_unscaled(field, pts, grid)))
+            if members:
+                self._groups.append({'grid': grid, 'members': members, 'method': 'linear',
+                                     'backend': 'auto', 'key': None, 'field': None})
+            self._direct_idx = direct_idx
+            return
+
+        direct_idx = []
+        for i, field in enumerate(self.fields):
+            data = _grid_backed_data(field)
+            if data is None:
+                direct_idx.append(i)
+                continue
+
+            grid, values = data
+            for group in self._groups:
+                if (group['method'] == field._method
+                        and len(group['grid']) == len(grid)
+                        and all(np.array_equal(g1, g2) for g1, g2 in zip(group['grid'].values(), grid.values()))):
+                    group['members'].append((i, values))
+                    break
+            else:
+                self._groups.append({'grid': grid, 'members': [(i, values)],
+                                     'method': field._method,
+                                     'backend': field._interpolator_backend,
+                                     'key': None, 'field': None})
+
+        # A single component gains nothing from a copy of its own grid
+        for group in [g for g in self._groups if len(g['members']) < 2]:
+            self._groups.remove(group)
+            direct_idx.append(group['members'][0][0])
+
+        self._direct_idx = sorted(direct_idx)
+
+    def _update_presummed(self):
+        """(Re)build pre-summed grids whose effective weights changed"""
+        if self._groups is None:
+            self._build_groups()
+
+        for group in self._groups:
+            key = tuple(self._effective_weight(i) for i, _ in group['members'])
+            if key == group['key']:
+                continue
+
+            summed = {}
+            for component in ['x', 'y', 'z']:
+                total = np.zeros_like(group['members'][0][1][component])
+                for (_, values), weight in zip(group['members'], key):
+                    if weight != 0.0:
+                        total += weight * values[component]
+                summed[component] = total
+
+            group['field'] = Field.from_arrays(grid=group['grid'], values=summed,
+                                               label="Pre-summed CompositeField",
+                                               method=group['method'],
+                                               interpolator_backend=group['backend'])
+            group['key'] = key
+
     def __str__(self):
         return f"CompositeField with {len(self.fields)} components"
 
 
+# Grid axes used by Field for each dimensionality (see _get_field_Nd)
+_FIELD_AXES = {1: ('z',), 2: ('x', 'y'), 3: ('x', 'y', 'z')}
+
+
+def _grid_backed_data(field: FieldBase) -> Optional[Tuple[Dict[str, np.ndarray], Dict[str, np.ndarray]]]:
+    """
+    Unscaled grid and values of a regular-grid Field.
+
+    Returns
+    -------
+    (grid, values) or None
+        grid: {axis: 1D array}, values: {'x', 'y', 'z': ND array}. None if the
+        field is not a Field backed by regular-grid interpolators on one mesh.
+    """
+    if not isinstance(field, Field) or field.dim not in _FIELD_AXES:
+        return None
+
+    grid = None
+    values = {}
+    for component in ['x', 'y', 'z']:
+        interp = field._field.get(component)
+        if hasattr(interp, '_grid') and hasattr(interp, '_values'):
+            comp_grid, comp_values = interp._grid, interp._values
+        elif isinstance(interp, RegularGridInterpolator):
+            comp_grid, comp_values = interp.grid, interp.values
+        else:
+            return None
+        if getattr(interp, 'fill_value', 0.0) != 0.0:
+            return None
+
+        if grid is None:
+            grid = comp_grid
+        elif len(grid) != len(comp_grid) or not all(np.array_equal(g1, g2) for g1, g2 in zip(grid, comp_grid)):
+            return None
+        values[component] = np.asarray(comp_values, dtype=np.float64)
+
+    return dict(zip(_FIELD_AXES[field.dim], grid)), values
+
+
+def _resample_points(resample_grid: Dict[str, np.ndarray]) -> Tuple[Dict[str, np.ndarray], np.ndarray]:
+    """Active axes and (M, 3) sample points of a resampling mesh"""
+    axes = [np.atleast_1d(np.asarray(resample_grid.get(k, [0.0]), dtype=np.float64)) for k in ['x', 'y', 'z']]
+    grid = {k: a for k, a in zip(['x', 'y', 'z'], axes) if len(a) > 1}
+
+    if tuple(grid.keys()) not in _FIELD_AXES.values():
+        raise ValueError(f"resample_grid must span z (1D), x-y (2D) or x-y-z (3D). Got axes {tuple(grid.keys())}")
+
+    mesh = np.meshgrid(*axes, indexing='ij')
+    pts = np.column_stack([m.ravel() for m in mesh])
+
+    return grid, pts
+
+
+def _sample_unscaled(field: FieldBase, pts: np.ndarray, grid: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """Sample a field on mesh points, without the scaling of a Field"""
+    if isinstance(field, Field):
+        scaling = field._scaling
+        field._scaling = 1.0
+        try:
+            values = field(pts)
+        finally:
+            field._scaling = scaling
+    else:
+        values = field(pts)
+
+    shape = tuple(len(a) for a in grid.values())
+    return {component: values[:, j].reshape(shape) for j, component in enumerate(['x', 'y', 'z'])}
+
+
 class ScaledField(FieldBase):
     """
     Field with scaling and offset: F_new = scale * F_old + offset
@@ -677,7 +1222,11 @@ class ScaledField(FieldBase):
         self.scale = scale
         self.offset = offset
 
-    def __call__(self, pts: np.ndarray) -> np.ndarray:
+    @property
+    def time_dependent(self) -> bool:
+        return _is_time_dependent(self.field)
+
+    def __call__(self, pts: np.ndarray, t: Optional[Union[float, np.ndarray]] = None) -> np.ndarray:
         """
         Evaluate scaled field at points.
 
@@ -686,19 +1235,938 @@ class ScaledField(FieldBase):
         field_values : np.ndarray(M, 3)
             Scaled and offset field values
         """
-        field_values = self.field(pts)  # always returns (M, 3)
+        field_values = _evaluate_field(self.field, pts, t)  # always returns (M, 3)
         return self.scale * field_values + self.offset
 
+    def value_and_gradient(self, pts: np.ndarray,
+                           t: Optional[Union[float, np.ndarray]] = None) -> Tuple[np.ndarray, np.ndarray]:
+        field_values, grad = _evaluate_gradient(self.field, pts, t)
+        return self.scale * field_values + self.offset, self.scale * grad
 
-# ============================================================================
-# Field Map Container
-# ============================================================================
 
-class FieldMap:
+class CachedField(FieldBase):
     """
-    Container for electric and magnetic fields.
+    Memoizing wrapper: F_cached(pts) = F(pts), reusing results for repeated
+    query sets (replots, solver mesh nodes, scan start points).
 
-    Used when both E and B fields are defined in the same simulation region.
+    Results are keyed by a hash of the query array (and t) and kept in an LRU
+    cache bounded by max_bytes. The cache is cleared when the scaling of the
+    wrapped field (or any scale/weight of a composite or scaled field inside
+    it) changes. Returned arrays are copies.
+
+    Parameters
+    ----------
+    field : FieldBase
+        Field to memoize
+    max_bytes : int
+        Memory budget of the cached results (default: 256 MB)
+
+    Examples
+    --------
+    > B_cached = B.cached()
+    > B_cached(mesh_nodes)  # miss: evaluates B
+    > B_cached(mesh_nodes)  # hit
+    > B_cached.cache_info()
+    {'hits': 1, 'misses': 1, 'entries': 1, 'nbytes': ..., 'max_bytes': ...}
+    """
+
+    def __init__(self, field: FieldBase, max_bytes: int = 256 * 2 ** 20):
+        self.field = field
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()
+        self._nbytes = 0
+        self._state = _scaling_state(field)
+
+    @property
+    def time_dependent(self) -> bool:
+        return _is_time_dependent(self.field)
+
+    def __call__(self, pts: np.ndarray, t: Optional[Union[float, np.ndarray]] = None) -> np.ndarray:
+        """
+        Evaluate field at points, from the cache if this query was seen before.
+
+        Returns
+        -------
+        field_values : np.ndarray(M, 3)
+        """
+        pts = np.ascontiguousarray(np.atleast_2d(pts), dtype=np.float64)
+
+        state = _scaling_state(self.field)
+        if state != self._state:
+            self.clear()
+            self._state = state
+
+        key = _query_key(pts, t if self.time_dependent else None)
+        field_values = self._cache.get(key)
+
+        if field_values is not None:
+            self.hits += 1
+            self._cache.move_to_end(key)
+            return field_values.copy()
+
+        self.misses += 1
+        field_values = _evaluate_field(self.field, pts, t)
+
+        if field_values.nbytes <= self.max_bytes:
+            self._cache[key] = field_values.copy()
+            self._nbytes += field_values.nbytes
+            while self._nbytes > self.max_bytes:
+                _, evicted = self._cache.popitem(last=False)
+                self._nbytes -= evicted.nbytes
+
+        return field_values
+
+    def value_and_gradient(self, pts: np.ndarray,
+                           t: Optional[Union[float, np.ndarray]] = None) -> Tuple[np.ndarray, np.ndarray]:
+        return _evaluate_gradient(self.field, pts, t)
+
+    def clear(self):
+        """Drop all cached results (statistics are kept)"""
+        self._cache.clear()
+        self._nbytes = 0
+
+    def cache_info(self) -> dict:
+        """Hit/miss statistics and memory use"""
+        return {'hits': self.hits, 'misses': self.misses, 'entries': len(self._cache),
+                'nbytes': self._nbytes, 'max_bytes': self.max_bytes}
+
+    def __str__(self):
+        return f"CachedField ({self.hits} hits, {self.misses} misses) of {self.field}"
+
+
+def _query_key(pts: np.ndarray, t: Optional[Union[float, np.ndarray]]) -> Tuple:
+    """Hash key of a (contiguous float64) query array and time"""
+    digest = hashlib.blake2b(pts.data, digest_size=16)
+    if t is not None:
+        digest.update(np.ascontiguousarray(t, dtype=np.float64).data)
+    return pts.shape, t is None, digest.digest()
+
+
+def _scaling_state(field) -> Tuple:
+    """Scale factors a cached field result depends on"""
+    if isinstance(field, CompositeField):
+        return tuple(field.weights), tuple(_scaling_state(f) for f in field.fields)
+    if isinstance(field, ScaledField):
+        return field.scale, field.offset, _scaling_state(field.field)
+    if isinstance(field, RFField):
+        return field.frequency, field.phase, field.harmonic, _scaling_state(field.field)
+    if isinstance(field, HarmonicField):
+        return tuple(field.amplitudes), tuple(field.frequencies), tuple(field.phases)
+    return (getattr(field, 'scaling', None),)
+
+
+class RFField(FieldBase):
+    """
+    Time-harmonic field with a static spatial map and a phase factor.
+
+    F(r, t) = F(r) * cos(ωt + φ)   (harmonic='cos', e.g. RF electric field)
+    F(r, t) = F(r) * sin(ωt + φ)   (harmonic='sin', e.g. RF magnetic field)
+
+    The spatial map is interpolated once per point and multiplied by the
+    phase factor, so a time-dependent query costs the same as a static one.
+
+    Parameters
+    ----------
+    field : FieldBase
+        Spatial map of the peak field
+    frequency : float
+        RF frequency [Hz]
+    phase : float
+        Phase φ [deg]
+    harmonic : str
+        'cos' or 'sin'
+
+    Examples
+    --------
+    > E_map = Field.from_file('cavity_E.h5part')
+    > B_map = Field.from_file('cavity_B.h5part')
+    > rf = FieldMap.from_rf(E_map, B_map, frequency=168e6, phase=-20.0)
+    > E = rf.efield(pts, t=1.2e-9)
+    """
+
+    def __init__(self, field: FieldBase, frequency: float, phase: float = 0.0,
+                 harmonic: str = 'cos'):
+        if harmonic not in ('cos', 'sin'):
+            raise ValueError(f"harmonic must be 'cos' or 'sin', got '{harmonic}'")
+
+        self.field = field
+        self.frequency = frequency
+        self.phase = phase
+        self.harmonic = harmonic
+
+    @property
+    def time_dependent(self) -> bool:
+        return True
+
+    @property
+    def omega(self) -> float:
+        return 2.0 * np.pi * self.frequency
+
+    def phase_factor(self, t: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """cos(ωt + φ) or sin(ωt + φ) at time(s) t [s]"""
+        arg = self.omega * np.asarray(t, dtype=np.float64) + np.deg2rad(self.phase)
+        return np.cos(arg) if self.harmonic == 'cos' else np.sin(arg)
+
+    def __call__(self, pts: np.ndarray, t: Union[float, np.ndarray] = 0.0) -> np.ndarray:
+        """
+        Evaluate field at points and time.
+
+        Parameters
+        ----------
+        pts : np.ndarray(M, 3)
+            Points to evaluate
+        t : float or np.ndarray(M,)
+            Time [s], common to all points or one per point (default: 0)
+
+        Returns
+        -------
+        field_values : np.ndarray(M, 3)
+            Field components at time t
+        """
+        factor = self.phase_factor(t)
+        if np.ndim(factor) > 0:
+            factor = factor.reshape(-1, 1)
+
+        return self.field(pts) * factor
+
+    def value_and_gradient(self, pts: np.ndarray,
+                           t: Union[float, np.ndarray] = 0.0) -> Tuple[np.ndarray, np.ndarray]:
+        """Values and Jacobian of the spatial map times the phase factor at time t"""
+        factor = self.phase_factor(0.0 if t is None else t)
+        field_values, grad = _evaluate_gradient(self.field, pts, None)
+        if np.ndim(factor) > 0:
+            return field_values * factor.reshape(-1, 1), grad * factor.reshape(-1, 1, 1)
+
+        return field_values * factor, grad * factor
+
+    def __str__(self):
+        return (f"RFField({self.harmonic}, f={self.frequency * 1e-6:.3f} MHz, "
+                f"phase={self.phase:.1f} deg) of {self.field}")
+
+
+class HarmonicField(FieldBase):
+    """
+    Superposition of K time-harmonic field maps on a common grid.
+
+    F(r, t) = Σ_k a_k · F_k(r) · h_k(ω_k t + φ_k),   h_k = cos or sin
+
+    The K maps are stored stacked as (nx, ny, nz, 3K) and evaluated in a
+    single interpolation pass (one cell search per point for all maps), then
+    combined with the K time factors. Evaluating several harmonics costs
+    little more than one map. A map with frequency 0 and harmonic 'cos' is
+    a static contribution.
+
+    Parameters
+    ----------
+    grid : dict
+        Grid definition {'x': x_array, 'y': y_array, 'z': z_array}, 1D arrays.
+        Axes with a single point are dropped as in Field.from_arrays
+    maps : list of dict
+        K spatial maps, each {'x': fx_array, 'y': fy_array, 'z': fz_array}
+    frequencies : list of float
+        Frequency of each map [Hz]
+    phases : list of float, optional
+        Phase of each map [deg] (default: 0)
+    harmonics : list of str, optional
+        'cos' or 'sin' for each map (default: 'cos')
+    amplitudes : list of float, optional
+        Scale factor of each map (default: 1)
+    interpolator_backend : str
+        'auto', 'numba' or 'scipy' (see get_stacked_interpolator)
+
+    Examples
+    --------
+    # Fundamental + flat-top (3rd harmonic) cavity voltage on one dee map
+    > E = HarmonicField.from_fields([E_dee, E_dee], frequencies=[f0, 3 * f0],
+    ...                             phases=[0.0, 180.0], amplitudes=[1.0, 1.0 / 9.0])
+    > E(pts, t=1e-9)
+    """
+
+    def __init__(self,
+                 grid: Dict[str, np.ndarray],
+                 maps: List[Dict[str, np.ndarray]],
+                 frequencies: List[float],
+                 phases: Optional[List[float]] = None,
+                 harmonics: Optional[List[str]] = None,
+                 amplitudes: Optional[List[float]] = None,
+                 interpolator_backend: str = 'auto'):
+
+        n_maps = len(maps)
+        if n_maps == 0:
+            raise ValueError("HarmonicField needs at least one map")
+
+        phases = np.zeros(n_maps) if phases is None else phases
+        harmonics = ['cos'] * n_maps if harmonics is None else list(harmonics)
+        amplitudes = np.ones(n_maps) if amplitudes is None else amplitudes
+
+        for name, arg in [('frequencies', frequencies), ('phases', phases),
+                          ('harmonics', harmonics), ('amplitudes', amplitudes)]:
+            if len(arg) != n_maps:
+                raise ValueError(f"Number of {name} ({len(arg)}) must match number of maps ({n_maps})")
+        for h in harmonics:
+            if h not in ('cos', 'sin'):
+                raise ValueError(f"harmonics must be 'cos' or 'sin', got '{h}'")
+
+        self.frequencies = np.array(frequencies, dtype=np.float64)
+        self.phases = np.array(phases, dtype=np.float64)
+        self.harmonics = harmonics
+        self.amplitudes = np.array(amplitudes, dtype=np.float64)
+
+        grid_points = [np.asarray(grid[k], dtype=np.float64) for k in ['x', 'y', 'z'] if k in grid and len(grid[k]) > 1]
+        self._dim = len(grid_points)
+        if self._dim not in _FIELD_AXES:
+            raise ValueError(f"HarmonicField needs a 1D, 2D or 3D grid, got {self._dim}D")
+
+        # Stack as (..., K, 3) -> (..., 3K): map k component j is channel 3k + j
+        shape = tuple(len(g) for g in grid_points)
+        stacked = np.empty(shape + (3 * n_maps,), dtype=np.float64)
+        for k, field_map in enumerate(maps):
+            for j, component in enumerate(['x', 'y', 'z']):
+                stacked[..., 3 * k + j] = np.reshape(field_map[component], shape)
+
+        self._interpolator = get_stacked_interpolator(tuple(grid_points), stacked,
+                                                      bounds_error=False, fill_value=0.0,
+                                                      backend=interpolator_backend)
+
+    @classmethod
+    def from_fields(cls, fields: List['Field'], frequencies: List[float], **kwargs) -> 'HarmonicField':
+        """
+        Build from grid-backed Fields that share one mesh.
+
+        Field scaling is folded into the amplitudes. Other arguments as in
+        HarmonicField().
+        """
+        grid = None
+        maps = []
+        for field in fields:
+            data = _grid_backed_data(field)
+            if data is None:
+                raise ValueError(f"{field} is not a grid-backed Field")
+            field_grid, values = data
+            if grid is None:
+                grid = field_grid
+            elif (field_grid.keys() != grid.keys() or
+                  not all(np.array_equal(field_grid[k], grid[k]) for k in grid)):
+                raise ValueError("All fields of a HarmonicField must share one mesh")
+            maps.append({k: field.scaling * v for k, v in values.items()})
+
+        return cls(grid, maps, frequencies, **kwargs)
+
+    @property
+    def time_dependent(self) -> bool:
+        return True
+
+    @property
+    def dim(self) -> int:
+        return self._dim
+
+    @property
+    def n_maps(self) -> int:
+        return len(self.frequencies)
+
+    def time_factors(self, t: Union[float, np.ndarray]) -> np.ndarray:
+        """
+        Weights a_k · h_k(ω_k t + φ_k) of the K maps.
+
+        Returns
+        -------
+        factors : np.ndarray(K,) for scalar t, (M, K) for t of shape (M,)
+        """
+        t = np.asarray(t, dtype=np.float64)[..., np.newaxis]
+        arg = 2.0 * np.pi * self.frequencies * t + np.deg2rad(self.phases)
+        is_cos = np.array([h == 'cos' for h in self.harmonics])
+        return self.amplitudes * np.where(is_cos, np.cos(arg), np.sin(arg))
+
+    def __call__(self, pts: np.ndarray, t: Union[float, np.ndarray] = 0.0) -> np.ndarray:
+        """
+        Evaluate superposition at points and time.
+
+        Parameters
+        ----------
+        pts : np.ndarray(M, 3)
+            Points to evaluate
+        t : float or np.ndarray(M,)
+            Time [s], common to all points or one per point (default: 0)
+
+        Returns
+        -------
+        field_values : np.ndarray(M, 3)
+        """
+        pts = np.atleast_2d(pts)
+        if pts.shape[1] != 3:
+            raise ValueError(f"Points must have shape (M, 3), got {pts.shape}")
+
+        if self._dim == 1:
+            coords = pts[:, 2:3]
+        elif self._dim == 2:
+            coords = pts[:, :2]
+        else:
+            coords = pts
+
+        # One interpolation pass for all K maps: (M, 3K) -> (M, K, 3)
+        stacked = self._interpolator(coords).reshape(len(pts), self.n_maps, 3)
+        factors = self.time_factors(t)
+
+        if factors.ndim == 1:
+            return np.einsum('mkc,k->mc', stacked, factors)
+        return np.einsum('mkc,mk->mc', stacked, factors)
+
+    def __str__(self):
+        freqs = ", ".join(f"{f * 1e-6:.3f}" for f in self.frequencies)
+        return f"HarmonicField ({self._dim}D, {self.n_maps} maps at [{freqs}] MHz)"
+
+
+class MidplaneExpansionField(_MapFieldMixin, FieldBase):
+    """
+    3D magnetic field from a median-plane Bz(r, θ) map.
+
+    Off-plane components follow from the Maxwell-consistent (curl- and
+    divergence-free) expansion about a mid-plane symmetric field:
+
+        Bz(r, θ, z) = B0 - z²/2 ∇²B0
+        Br(r, θ, z) = z ∂B0/∂r - z³/6 ∂(∇²B0)/∂r
+        Bθ(r, θ, z) = z/r ∂B0/∂θ - z³/6 1/r ∂(∇²B0)/∂θ
+
+    The derivative maps are computed once by finite differences on the polar
+    grid and evaluated together with B0 in one Numba kernel (one cell search
+    per point). No 3D map is built or stored. Valid for |z| small compared to
+    the scale on which B0 varies (pole gap).
+
+    Parameters
+    ----------
+    r : np.ndarray
+        Radial grid [m], ascending
+    theta : np.ndarray
+        Azimuthal grid [deg], ascending and uniform if it spans the period
+    bz : np.ndarray(nr, nth)
+        Median-plane Bz
+    order : int, optional
+        Highest power of z kept: 1, 2 or 3 (default: 3)
+    scaling : float, optional
+        Scaling factor applied to the field (default: 1.0)
+    symmetry : FieldSymmetry, optional
+        Sector symmetry; the map then covers one sector of 360/n_sectors deg.
+        Mid-plane symmetry is implied by the expansion
+    label : str, optional
+
+    Examples
+    --------
+    > B = MidplaneExpansionField.from_file('cyclotron_midplane.dat')
+    > B(np.array([[0.3, 0.0, 0.005]]))  # Br, Bθ from the map gradients
+    """
+
+    def __init__(self,
+                 r: np.ndarray,
+                 theta: np.ndarray,
+                 bz: np.ndarray,
+                 order: int = 3,
+                 scaling: float = 1.0,
+                 symmetry: Optional[FieldSymmetry] = None,
+                 label: str = "Midplane Expansion Field"):
+
+        if not HAS_NUMBA:
+            raise ImportError("MidplaneExpansionField requires Numba. Install with: pip install numba")
+
+        r = np.asarray(r, dtype=np.float64)
+        bz = np.asarray(bz, dtype=np.float64)
+        if bz.shape != (len(r), len(theta)):
+            raise ValueError(f"bz shape {bz.shape} does not match grid ({len(r)}, {len(theta)})")
+        if len(r) < 3 or len(theta) < 3:
+            raise ValueError("Midplane expansion needs at least 3 points in r and theta")
+
+        theta_period = 2.0 * np.pi
+        if symmetry is not None:
+            theta_period /= symmetry.n_sectors
+
+        theta, bz, periodic = _periodic_theta_grid(np.deg2rad(theta), bz, theta_period)
+
+        self.order = order
+        self._label = label
+        self._dim = 3
+        self._scaling = scaling
+        self._symmetry = symmetry
+        self._metadata = {}
+
+        maps = _midplane_derivative_maps(r, theta, bz, periodic)
+        self._interpolator = MidplaneExpansionInterpolator((r, theta), maps, order=order,
+                                                           theta_period=theta_period, fill_value=0.0)
+
+    @classmethod
+    def from_file(cls, filename: str, **kwargs) -> 'MidplaneExpansionField':
+        """
+        Load the median plane from an OPAL (.dat) or AIMA AGORA (.map) map.
+
+        For AGORA maps the z = 0 plane of the field set is used.
+
+        Parameters
+        ----------
+        filename : str
+            Path to field file
+        **kwargs
+            MidplaneExpansionField constructor arguments; all others are
+            passed to the loader
+
+        Returns
+        -------
+        MidplaneExpansionField
+        """
+        if not os.path.exists(filename):
+            raise FileNotFoundError(f"Field file not found: {filename}")
+
+        _, ext = os.path.splitext(filename)
+
+        init_params = inspect.signature(cls.__init__).parameters
+        init_kwargs = {k: v for k, v in kwargs.items() if k in init_params}
+        loader_kwargs = {k: v for k, v in kwargs.items() if k not in init_params}
+        loader_kwargs['cartesian_grid'] = False
+
+        if ext == ".dat":
+            _data = load_opal_midplane(filename, **loader_kwargs)
+            bz = _data['values']['z']
+        elif ext == ".map":
+            _data = load_aima_agora(filename, **loader_kwargs)
+            iz = np.flatnonzero(np.isclose(_data['grid']['z'], 0.0))
+            if len(iz) == 0:
+                raise ValueError(f"No z = 0 plane in {filename}")
+            bz = _data['values']['z'][:, :, iz[0]]
+        else:
+            raise ValueError(f"Unknown median-plane file extension: {ext}")
+
+        field = cls(_data['grid']['r'], _data['grid']['theta'], bz, **init_kwargs)
+        field._metadata = _data['metadata']
+
+        return field
+
+    def __call__(self, pts: np.ndarray) -> np.ndarray:
+        """
+        Evaluate field at Cartesian points.
+
+        Parameters
+        ----------
+        pts : np.ndarray(M, 3)
+            Points to evaluate [m]
+
+        Returns
+        -------
+        field_values : np.ndarray(M, 3)
+            (Bx, By, Bz), zero outside the (r, θ) range of the map
+        """
+        pts = np.atleast_2d(pts)
+        if pts.shape[1] != 3:
+            raise ValueError(f"Points must have shape (M, 3), got {pts.shape}")
+
+        return self._scaling * self._interpolator(pts)
+
+    def __str__(self):
+        return f"MidplaneExpansionField '{self._label}' (order {self.order}, scaling={self._scaling})"
+
+
+def _midplane_derivative_maps(r: np.ndarray, theta: np.ndarray, bz: np.ndarray, periodic: bool) -> np.ndarray:
+    """
+    Derivative maps of the median-plane expansion on an (r, θ [rad]) grid.
+
+    Returns
+    -------
+    maps : np.ndarray(nr, nth, 6)
+        B0, ∂B0/∂r, (1/r)∂B0/∂θ, L = ∇²B0, ∂L/∂r, (1/r)∂L/∂θ
+    """
+    inv_r = np.zeros_like(r)
+    inv_r[r > 0.0] = 1.0 / r[r > 0.0]
+    inv_r = inv_r[:, np.newaxis]
+
+    def d_dr(f):
+        return np.gradient(f, r, axis=0, edge_order=2)
+
+    def d_dth(f):
+        if periodic:
+            # Uniform grid over one period: central differences wrap around
+            return (np.roll(f, -1, axis=1) - np.roll(f, 1, axis=1)) / (2.0 * (theta[1] - theta[0]))
+        return np.gradient(f, theta, axis=1, edge_order=2)
+
+    db_dr = d_dr(bz)
+    db_dth = d_dth(bz)
+    lap = d_dr(db_dr) + inv_r * db_dr + inv_r ** 2 * d_dth(db_dth)
+
+    # 1/r terms are singular on the axis; take ∇²B0 from the first ring off-axis
+    on_axis = r <= 0.0
+    if np.any(on_axis) and not np.all(on_axis):
+        lap[on_axis] = lap[np.argmax(~on_axis)]
+
+    return np.stack([bz, db_dr, inv_r * db_dth, lap, d_dr(lap), inv_r * d_dth(lap)], axis=-1)
+
+
+def _is_time_dependent(field) -> bool:
+    """True for fields evaluated as field(pts, t); plain callables are static"""
+    return getattr(field, 'time_dependent', False)
+
+
+class LazyField(_MapFieldMixin, FieldBase):
+    """
+    3D field map evaluated straight from an HDF5 file, read brick by brick.
+
+    The component datasets stay open; only the bricks touched by the query
+    points are read into an LRU brick cache (see LazyBrickInterpolator) and
+    interpolated (trilinear) in their stored [z, y, x] layout. Maps larger
+    than RAM can be tracked through as long as the working set of bricks
+    fits in max_bytes.
+
+    Parameters
+    ----------
+    interpolator : LazyBrickInterpolator
+        Brick reader over the open datasets
+    h5_file : h5py.File, optional
+        File holding the datasets, closed by close()
+    scaling : float
+        Global scaling factor
+    label : str
+        Descriptive label
+
+    Examples
+    --------
+    > with LazyField.from_h5part('cavity.h5part', max_bytes=2 * 2**30) as B:
+    ...     r, v, active = pusher.track_batch(r0, v0, E, B, dt, n_steps)
+    ...     print(B.cache_info())
+    """
+
+    def __init__(self, interpolator: LazyBrickInterpolator, h5_file: Optional[h5py.File] = None,
+                 scaling: float = 1.0, label: str = "Lazy Field"):
+        self._interpolator = interpolator
+        self._h5_file = h5_file
+        self._scaling = scaling
+        self._label = label
+        self._dim = 3
+        self._metadata = {}
+
+    @classmethod
+    def from_h5part(cls, filename: str, field: str = 'Hfield', step: int = 0,
+                    brick_size: int = 32, max_bytes: int = 512 * 2 ** 20, **kwargs) -> 'LazyField':
+        """
+        Open the field group of an H5Part file (see load_h5part for the layout).
+
+        Parameters
+        ----------
+        filename : str
+            Path to .h5 or .h5part file
+        field : str
+            'Hfield' (default) or 'Efield'
+        step : int
+            Step#<step> to read (default: 0)
+        brick_size, max_bytes
+            See LazyBrickInterpolator
+        **kwargs
+            LazyField constructor arguments
+        """
+        if not os.path.exists(filename):
+            raise FileNotFoundError(f"Field file not found: {filename}")
+
+        h5_file = h5py.File(filename, 'r')
+        try:
+            group = h5_file[f'Step#{step}']['Block'][field]
+            datasets = [group[c] for c in ['0', '1', '2']]  # (nz, ny, nx)
+            spacing = np.asarray(group.attrs['__Spacing__'], dtype=np.float64)
+            origin = np.asarray(group.attrs['__Origin__'], dtype=np.float64)
+
+            interpolator = LazyBrickInterpolator(datasets, origin, spacing, axis_order=(2, 1, 0),
+                                                 brick_size=brick_size, max_bytes=max_bytes)
+        except Exception:
+            h5_file.close()
+            raise
+
+        kwargs.setdefault('label', f"{field} ({os.path.basename(filename)})")
+        lazy = cls(interpolator, h5_file=h5_file, **kwargs)
+        lazy._metadata = {'spacing': spacing, 'origin': origin, 'shape': tuple(datasets[0].shape),
+                          'field': field, 'step': step, 'filename': os.path.basename(filename)}
+
+        return lazy
+
+    @classmethod
+    def from_openpmd(cls, filename: str, iteration: int = 0, field_name: str = 'B',
+                     brick_size: int = 32, max_bytes: int = 512 * 2 ** 20, **kwargs) -> 'LazyField':
+        """
+        Open a 3D mesh of an openPMD HDF5 file (read with h5py, openpmd-api not needed).
+
+        Axis order, spacing, offset, in-cell position and unitSI are taken
+        from the openPMD attributes (cell-centered if 'position' is missing,
+        as in load_field_openpmd).
+
+        Parameters
+        ----------
+        filename : str
+            Path to openPMD .h5 file
+        iteration : int
+            Iteration to read (default: 0)
+        field_name : str
+            Mesh record, 'B' (default) or 'E'
+        brick_size, max_bytes
+            See LazyBrickInterpolator
+        **kwargs
+            LazyField constructor arguments
+        """
+        if not os.path.exists(filename):
+            raise FileNotFoundError(f"Field file not found: {filename}")
+
+        def _str(value):
+            return value.decode() if isinstance(value, bytes) else str(value)
+
+        h5_file = h5py.File(filename, 'r')
+        try:
+            base_path = _str(h5_file.attrs.get('basePath', '/data/%T/')).replace('%T', str(iteration))
+            meshes_path = _str(h5_file.attrs.get('meshesPath', 'meshes/'))
+            mesh = h5_file[base_path + meshes_path + field_name]
+
+            labels = [_str(label) for label in mesh.attrs.get('axisLabels', ['z', 'y', 'x'])]
+            if len(labels) != 3:
+                raise ValueError(f"Only 3D meshes can be read lazily, got axes {labels}")
+            axis_order = tuple({'x': 0, 'y': 1, 'z': 2}[label] for label in labels)
+
+            datasets = [mesh[c] for c in ['x', 'y', 'z']]
+            unit = float(mesh.attrs.get('gridUnitSI', 1.0))
+            grid_spacing = np.asarray(mesh.attrs['gridSpacing'], dtype=np.float64) * unit
+            grid_offset = np.asarray(mesh.attrs.get('gridGlobalOffset', np.zeros(3)), dtype=np.float64) * unit
+            position = np.asarray(datasets[0].attrs.get('position', 0.5 * np.ones(3)), dtype=np.float64)
+
+            # Per dataset axis -> per spatial axis (x, y, z)
+            spacing = np.empty(3)
+            origin = np.empty(3)
+            for d, a in enumerate(axis_order):
+                spacing[a] = grid_spacing[d]
+                origin[a] = grid_offset[d] + position[d] * grid_spacing[d]
+
+            scale = [float(ds.attrs.get('unitSI', 1.0)) for ds in datasets]
+
+            interpolator = LazyBrickInterpolator(datasets, origin, spacing, axis_order=axis_order,
+                                                 brick_size=brick_size, max_bytes=max_bytes, scale=scale)
+        except Exception:
+            h5_file.close()
+            raise
+
+        kwargs.setdefault('label', f"{field_name} ({os.path.basename(filename)})")
+        lazy = cls(interpolator, h5_file=h5_file, **kwargs)
+        lazy._metadata = {'spacing': spacing, 'origin': origin, 'shape': tuple(datasets[0].shape),
+                          'axis_labels': labels, 'iteration': iteration, 'field_type': field_name,
+                          'filename': os.path.basename(filename)}
+
+        return lazy
+
+    def __call__(self, pts: np.ndarray) -> np.ndarray:
+        """
+        Evaluate field at points, reading missing bricks from disk.
+
+        Returns
+        -------
+        field_values : np.ndarray(M, 3)
+        """
+        pts = np.atleast_2d(pts)
+        if pts.shape[1] != 3:
+            raise ValueError(f"Points must have shape (M, 3), got {pts.shape}")
+
+        return self._scaling * self._interpolator(pts)
+
+    def cache_info(self) -> dict:
+        """Brick cache statistics (see LazyBrickInterpolator.cache_info)"""
+        return self._interpolator.cache_info()
+
+    def close(self):
+        """Drop the brick cache and close the HDF5 file"""
+        self._interpolator.clear()
+        if self._h5_file is not None:
+            self._h5_file.close()
+            self._h5_file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __str__(self):
+        return f"LazyField '{self._label}' (shape {self._interpolator.shape.tolist()}, scaling={self._scaling})"
+
+
+class NestedField(_MapFieldMixin, FieldBase):
+    """
+    Coarse global field map with locally refined patches.
+
+    Each level is a regular Cartesian 2D (x, y) or 3D grid. Queries are
+    resolved in a single Numba kernel: a point uses the finest patch whose
+    bounding box contains it, the base map everywhere else (see
+    NestedGridInterpolator). Typical use is a cyclotron map at coarse
+    spacing plus fine patches around the central region and the
+    extraction septum, instead of the whole map at the finest spacing.
+
+    Parameters
+    ----------
+    base : Field or dict
+        Global map, either a grid-based Field (linear, no symmetry) or a
+        loader output {'grid': {...}, 'values': {...}} with a Cartesian grid
+    patches : list of Field or dict
+        Refined maps, same dimensionality as the base
+    scaling : float
+        Global scaling factor (applied on top of the scaling of Field levels)
+    label : str
+        Descriptive label
+
+    Examples
+    --------
+    > B = NestedField.from_files('cyclotron_coarse.table',
+    ...                          ['central_region.table', 'septum.table'], units='mm')
+    > print(B.metadata['nbytes'] / 2**20, 'MB')
+    """
+
+    def __init__(self, base: Union['Field', Dict], patches: Optional[List[Union['Field', Dict]]] = None,
+                 scaling: float = 1.0, label: str = "Nested Field"):
+        if not HAS_NUMBA:
+            raise ImportError("NestedField needs Numba. Install with: pip install numba")
+
+        levels = [_nested_level_data(level) for level in [base] + list(patches or [])]
+
+        dims = {len(grid) for grid, _ in levels}
+        if len(dims) != 1:
+            raise ValueError(f"Base and patches must have the same dimensionality, got {sorted(dims)}")
+
+        self._dim = len(levels[0][0])
+        self._axes = [{'x': 0, 'y': 1, 'z': 2}[k] for k in _FIELD_AXES[self._dim]]
+        if self._dim not in (2, 3):
+            raise ValueError(f"Nested grids need 2D (x, y) or 3D maps, got {self._dim}D")
+
+        stacked = [(tuple(grid.values()), np.stack([values[k] for k in ['x', 'y', 'z']], axis=-1))
+                   for grid, values in levels]
+        self._interpolator = NestedGridInterpolator(stacked[0], stacked[1:], fill_value=0.0)
+
+        self._scaling = scaling
+        self._label = label
+        self._metadata = {'n_patches': len(levels) - 1, 'nbytes': self._interpolator.nbytes}
+
+    @classmethod
+    def from_files(cls, base_file: str, patch_files: List[str], **kwargs) -> 'NestedField':
+        """
+        Load the base map and patches with Field.from_file.
+
+        Parameters
+        ----------
+        base_file : str
+            Global (coarse) map
+        patch_files : list of str
+            Refined maps
+        **kwargs
+            NestedField constructor arguments (scaling, label); all others
+            are passed to Field.from_file for every level. Polar maps are
+            loaded with cartesian_grid=True
+        """
+        init_params = inspect.signature(cls.__init__).parameters
+        init_kwargs = {k: v for k, v in kwargs.items() if k in init_params}
+        file_kwargs = {k: v for k, v in kwargs.items() if k not in init_params}
+        file_kwargs['cartesian_grid'] = True
+
+        def load(filename):
+            _, ext = os.path.splitext(filename)
+            level_kwargs = file_kwargs if ext in ('.dat', '.map') else \
+                {k: v for k, v in file_kwargs.items() if k != 'cartesian_grid'}
+            return _nested_level_data(Field.from_file(filename, **level_kwargs))
+
+        init_kwargs.setdefault('label', f"Nested Field ({os.path.basename(base_file)})")
+        field = cls(load(base_file), [load(filename) for filename in patch_files], **init_kwargs)
+        field._metadata['filenames'] = [os.path.basename(f) for f in [base_file] + list(patch_files)]
+
+        return field
+
+    def __call__(self, pts: np.ndarray) -> np.ndarray:
+        """
+        Evaluate field at points on the finest level containing each point.
+
+        Returns
+        -------
+        field_values : np.ndarray(M, 3)
+        """
+        pts = np.atleast_2d(pts)
+        if pts.shape[1] != 3:
+            raise ValueError(f"Points must have shape (M, 3), got {pts.shape}")
+
+        return self._scaling * self._interpolator(pts[:, self._axes])
+
+    def level_of(self, pts: np.ndarray) -> np.ndarray:
+        """Level index per point (see NestedGridInterpolator.level_of; last = base map)"""
+        pts = np.atleast_2d(pts)
+        return self._interpolator.level_of(pts[:, self._axes])
+
+    def __str__(self):
+        return (f"NestedField '{self._label}' ({self._dim}D, {self._metadata['n_patches']} patches, "
+                f"{self._metadata['nbytes'] / 2 ** 20:.1f} MB, scaling={self._scaling})")
+
+
+def _nested_level_data(level: Union['Field', Dict]) -> Tuple[Dict[str, np.ndarray], Dict[str, np.ndarray]]:
+    """Scaled (grid, values) of a NestedField level given as Field or loader output"""
+    if isinstance(level, Field):
+        data = _grid_backed_data(level)
+        if data is None or level._method != 'linear':
+            raise ValueError(f"Level '{level.label}' is not a linear Cartesian grid-based Field")
+        grid, values = data
+        return grid, {k: level.scaling * v for k, v in values.items()}
+
+    if level.get('coordinate_system') == 'cylindrical':
+        raise ValueError("Nested grids need Cartesian maps, load with cartesian_grid=True")
+
+    grid = {k: np.asarray(level['grid'][k], dtype=np.float64) for k in ['x', 'y', 'z']
+            if k in level['grid'] and len(level['grid'][k]) > 1}
+    if tuple(grid.keys()) not in _FIELD_AXES.values():
+        raise ValueError(f"Nested grids must span x-y (2D) or x-y-z (3D). Got axes {tuple(grid.keys())}")
+
+    shape = tuple(len(g) for g in grid.values())
+    values = {k: np.asarray(level['values'][k], dtype=np.float64).reshape(shape) if k in level['values']
+              else np.zeros(shape) for k in ['x', 'y', 'z']}
+
+    return grid, values
+
+
+def _evaluate_gradient(field, pts: np.ndarray,
+                       t: Optional[Union[float, np.ndarray]]) -> Tuple[np.ndarray, np.ndarray]:
+    """Values and Jacobian of field at pts, passing t only to time-dependent fields"""
+    if not isinstance(field, FieldBase):
+        return _finite_difference_gradient(field, pts, t)
+    if t is not None and _is_time_dependent(field):
+        return field.value_and_gradient(pts, t)
+    return field.value_and_gradient(pts)
+
+
+def _finite_difference_gradient(field, pts: np.ndarray,
+                                t: Optional[Union[float, np.ndarray]]) -> Tuple[np.ndarray, np.ndarray]:
+    """Values and central-difference Jacobian, all 7 point sets in one field call"""
+    pts = np.atleast_2d(np.asarray(pts, dtype=np.float64))
+    M = len(pts)
+
+    offsets = np.zeros((7, 3))
+    for k in range(3):
+        offsets[1 + 2 * k, k] = GRADIENT_STEP
+        offsets[2 + 2 * k, k] = -GRADIENT_STEP
+
+    shifted = (pts[np.newaxis, :, :] + offsets[:, np.newaxis, :]).reshape(-1, 3)
+    if t is not None and np.ndim(t) > 0:
+        t = np.tile(t, 7)
+
+    F = _evaluate_field(field, shifted, t).reshape(7, M, 3)
+    grad = np.stack([F[1 + 2 * k] - F[2 + 2 * k] for k in range(3)], axis=-1) / (2.0 * GRADIENT_STEP)
+
+    return F[0], grad
+
+
+def _evaluate_field(field, pts: np.ndarray, t: Optional[Union[float, np.ndarray]]) -> np.ndarray:
+    """Evaluate field at pts, passing t only to time-dependent fields"""
+    if t is not None and _is_time_dependent(field):
+        return field(pts, t)
+    return field(pts)
+
+
+# ============================================================================
+# Field Map Container
+# ============================================================================
+
+class FieldMap:
+    """
+    Container for electric and magnetic fields.
+
+    Used when both E and B fields are defined in the same simulation region.
     Commonly loaded from single HDF5 file containing both fields.
 
     Parameters
@@ -751,6 +2219,31 @@ class FieldMap:
         """Create FieldMap from existing Field objects"""
         return cls(efield=efield, bfield=bfield, metadata=metadata)
 
+    @classmethod
+    def from_rf(cls, efield: FieldBase, bfield: FieldBase,
+                frequency: float, phase: float = 0.0, **metadata) -> 'FieldMap':
+        """
+        Create an RF FieldMap: E(r)·cos(ωt+φ), B(r)·sin(ωt+φ).
+
+        Parameters
+        ----------
+        efield, bfield : FieldBase
+            Spatial maps of the peak electric and magnetic fields
+        frequency : float
+            RF frequency [Hz]
+        phase : float
+            Phase φ [deg]
+
+        Returns
+        -------
+        FieldMap
+            Container with two RFField objects
+        """
+        metadata.update(frequency=frequency, phase=phase)
+        return cls(efield=RFField(efield, frequency, phase, harmonic='cos'),
+                   bfield=RFField(bfield, frequency, phase, harmonic='sin'),
+                   metadata=metadata)
+
     def __str__(self):
         return f"FieldMap(E: {self.efield}, B: {self.bfield})"
 
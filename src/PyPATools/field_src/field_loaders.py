@@ -10,9 +10,13 @@ Date: 2024
 
 import numpy as np
 import h5py
+import io
+import itertools
+import json
 import os
 import re
 import gc
+from concurrent.futures import ThreadPoolExecutor
 from scipy.interpolate import RegularGridInterpolator
 
 # Unit conversion factors to SI (meters, Tesla, V/m)
@@ -256,7 +260,43 @@ def load_opera_table(filename, extents=None, extents_dims=None):
     return result
 
 
-def load_comsol(filename):
+# Bytes of text parsed per block by the streaming COMSOL reader
+COMSOL_CHUNK_BYTES = 64 * 2 ** 20
+
+
+def _comsol_chunks(filename, data_offset, array_len, chunk_bytes):
+    """
+    Yield (first_row, rows) blocks of the COMSOL data section.
+
+    Blocks of about chunk_bytes, cut at line ends, are parsed by np.loadtxt
+    (C-level reader). At most array_len rows are returned in total.
+    """
+    row = 0
+    with open(filename, 'rb') as infile:
+        infile.seek(data_offset)
+        while row < array_len:
+            block = infile.read(chunk_bytes)
+            if not block.strip():
+                break
+            block += infile.readline()
+
+            rows = np.loadtxt(io.BytesIO(block), ndmin=2)[:array_len - row]
+            yield row, rows
+            row += len(rows)
+
+    if row < array_len:
+        raise ValueError(f"File ends after {row} of {array_len} data rows")
+
+
+def _lexicographically_increasing(steps):
+    """True if the first nonzero entry of every row of steps is positive"""
+    if len(steps) == 0:
+        return True
+    first = np.argmax(steps != 0, axis=1)
+    return bool(np.all(steps[np.arange(len(steps)), first] > 0))
+
+
+def load_comsol(filename, chunk_bytes=COMSOL_CHUNK_BYTES):
     """
     Load COMSOL .comsol format field map.
 
@@ -281,11 +321,17 @@ def load_comsol(filename):
     - Handles derived COMSOL variable names (removes 'mir', 'sec', 'side' prefixes)
     - Automatically detects magnetic field columns with (T) suffix
     - Automatically detects electric field columns with (V/cm) or (V/m) suffix
+    - Data are streamed in blocks: memory use is the output arrays plus one
+      block. Points already on a structured grid in any axis order are
+      reshaped without sorting, others are scattered to their grid index
+      in a second pass over the file
 
     Parameters:
     -----------
     filename : str
         Path to .comsol file
+    chunk_bytes : int, optional
+        Size of the text blocks parsed at once (default: COMSOL_CHUNK_BYTES)
 
     Returns:
     --------
@@ -383,54 +429,83 @@ def load_comsol(filename):
 
         dim = len(spatial_coords)
 
-        # Read all data at once using numpy (MUCH faster)
-        print(f"Loading {array_len} data points...")
-        raw_data = np.loadtxt(filename, skiprows=9, max_rows=array_len)
-
-        # If only one row, ensure it's 2D
-        if raw_data.ndim == 1:
-            raw_data = raw_data.reshape(1, -1)
-
-        print("Data loaded, processing...")
+        with open(filename, 'rb') as infile:
+            for _ in range(9):
+                infile.readline()
+            data_offset = infile.tell()
 
     except Exception as e:
         raise RuntimeError(f"Error reading COMSOL file: {e}")
 
-    # Extract spatial columns for sorting
     spatial_indices = [data[coord]["column"] for coord in spatial_coords]
-
-    # Single efficient sort using lexsort (sorts by last key first)
-    # For 3D: sorts by z, then y, then x
-    # For 2D: sorts by second coord, then first
-    # For 1D: sorts by single coord
-    if dim == 1:
-        sort_idx = np.argsort(raw_data[:, spatial_indices[0]])
-    else:
-        # lexsort expects keys in reverse order (last dimension first)
-        sort_keys = [raw_data[:, spatial_indices[i]] for i in range(dim - 1, -1, -1)]
-        sort_idx = np.lexsort(sort_keys)
-
-    raw_data = raw_data[sort_idx]
+    field_indices = [data[label]["column"] for label in field_coords]
+
+    # Pass 1: stream field columns into the output buffers (in file order),
+    # collect the grid values of each axis and test whether the points come
+    # in structured order, i.e. are lexicographically increasing for some
+    # priority of the axes (slowest first)
+    print(f"Loading {array_len} data points...")
+    axis_values = [np.empty(0) for _ in range(dim)]
+    field_flat = [np.empty(array_len) for _ in field_coords]
+    orders = {order: True for order in itertools.permutations(range(dim))}
+    previous = np.empty((0, dim))
+    n_read = 0
+
+    for row, rows in _comsol_chunks(filename, data_offset, array_len, chunk_bytes):
+        n_read += len(rows)
+        coords = rows[:, spatial_indices]
+        for a in range(dim):
+            axis_values[a] = np.union1d(axis_values[a], coords[:, a])
+        for values, col_idx in zip(field_flat, field_indices):
+            values[row:row + len(rows)] = rows[:, col_idx]
+
+        if any(orders.values()):
+            steps = np.diff(np.concatenate((previous, coords)), axis=0)
+            for order in orders:
+                orders[order] = orders[order] and _lexicographically_increasing(steps[:, list(order)])
+            previous = coords[-1:]
+
+    print("Data loaded, processing...")
 
     # Determine grid dimensions
     n = {}
     grid_dict = {}
     l_scale = UNIT_CONVERSIONS['length'].get(l_unit.lower(), 1.0)
 
-    for coord in spatial_coords:
-        col_idx = data[coord]["column"]
-        unique_vals = np.unique(raw_data[:, col_idx])
+    for coord, unique_vals in zip(spatial_coords, axis_values):
         n[coord] = len(unique_vals)
         grid_dict[coord.lower()] = unique_vals * l_scale
 
-    # Verify total points
-    expected_points = np.prod(list(n.values()))
-    if expected_points != array_len:
-        raise ValueError(f"Grid size mismatch: {expected_points} expected vs {array_len} in file")
-
     # Determine reshape order
     shape = [n[coord] for coord in spatial_coords]
 
+    # Verify total points: the reshape below needs exactly one row per grid point
+    expected_points = int(np.prod(shape))
+    if n_read != expected_points or array_len != expected_points:
+        raise ValueError(f"COMSOL grid {tuple(shape)} needs {expected_points} points, "
+                         f"file has {n_read} data rows (header: {array_len} nodes)")
+
+    structured_order = next((order for order, ok in orders.items() if ok), None)
+    if structured_order is not None:
+        # array_len distinct, increasing grid points: the full grid in this order
+        order_shape = [shape[a] for a in structured_order]
+        field_grids = [np.ascontiguousarray(values.reshape(order_shape).transpose(np.argsort(structured_order)))
+                       for values in field_flat]
+    else:
+        # Pass 2: scatter each row to its grid index
+        filled = np.zeros(array_len, dtype=bool)
+        for row, rows in _comsol_chunks(filename, data_offset, array_len, chunk_bytes):
+            flat_idx = np.ravel_multi_index([np.searchsorted(axis_values[a], rows[:, spatial_indices[a]])
+                                             for a in range(dim)], shape)
+            for values, col_idx in zip(field_flat, field_indices):
+                values[flat_idx] = rows[:, col_idx]
+            filled[flat_idx] = True
+
+        if not filled.all():
+            raise ValueError(f"{np.count_nonzero(~filled)} grid points missing (duplicate points in file)")
+
+        field_grids = [values.reshape(shape) for values in field_flat]
+
     # Extract and reshape field values (vectorized - very fast)
     values_dict = {}
     unit_type = 'magnetic' if field_type == 'magnetic' else 'electric'
@@ -442,13 +517,12 @@ def load_comsol(filename):
         'ER': 'r', 'EPHI': 'phi', 'ETHETA': 'theta'
     }
 
-    for field_label in field_coords:
+    for field_label, field_data in zip(field_coords, field_grids):
         unit = data[field_label]["unit"]
         scale = UNIT_CONVERSIONS[unit_type].get(unit.lower(), 1.0)
-        col_idx = data[field_label]["column"]
 
-        # Direct indexing and reshape (no intermediate arrays)
-        field_data = raw_data[:, col_idx].reshape(shape) * scale
+        # Scale in place (no intermediate arrays)
+        field_data *= scale
 
         output_key = field_map.get(field_label, field_label.lower())
         values_dict[output_key] = field_data
@@ -463,8 +537,8 @@ def load_comsol(filename):
         if coord not in grid_dict:
             grid_dict[coord] = np.array([0.0])
 
-    # Clear raw_data to free memory
-    del raw_data
+    # Free the pass buffers
+    del field_flat, field_grids
     gc.collect()
 
     print("Processing complete!")
@@ -478,6 +552,8 @@ def load_comsol(filename):
             'n_points': n,
             'spatial_dims': spatial_coords,
             'field_dims': field_coords,
+            'structured_order': (None if structured_order is None
+                                 else [spatial_coords[a] for a in structured_order]),
             'units_original': {k: v['unit'] for k, v in data.items()},
             'filename': os.path.basename(filename)
         }
@@ -670,7 +746,83 @@ def load_opal_midplane(filename, r_cutoff=None, scaling=1.0, cartesian_grid=True
     return result
 
 
-def load_aima_agora(path, mirror=False, interp_resolution=1000):
+def _read_agora_map(filename):
+    """
+    Grid header and field values of one AGORA .map file.
+
+    Returns
+    -------
+    header : tuple
+        (nth, nr, sr, dr, sth, dth)
+    field : np.ndarray(nr, nth)
+        Field values (theta varies fastest)
+    """
+    with open(filename, 'r') as infile:
+        text = infile.read()
+
+    lines = text.split('\n', 4)
+    try:
+        nth, nr = [int(val) for val in lines[1].split()]
+        sr, dr = [float(val) for val in lines[2].split()]
+        sth, dth = [float(val) for val in lines[3].split()]
+    except (IndexError, ValueError) as e:
+        raise ValueError(f"{filename}: malformed header ({e})")
+
+    # Data lines follow the 4 header lines; the last line is not data
+    body = lines[4]
+    body = body[:body.rstrip('\n').rfind('\n') + 1]
+
+    field_flat = np.fromstring(body, sep=" ")
+    if field_flat.size != nr * nth:
+        raise ValueError(f"{filename}: {field_flat.size} values, expected {nr} x {nth}")
+
+    return (nth, nr, sr, dr, sth, dth), field_flat.reshape(nr, nth)
+
+
+def _field_cache_key(files, **params):
+    """Cache key of a field derived from files (name, size, mtime) and loader parameters"""
+    stats = [(os.path.basename(fn), os.stat(fn).st_size, os.stat(fn).st_mtime_ns) for fn in sorted(files)]
+    return json.dumps({'files': stats, 'params': params}, sort_keys=True)
+
+
+def _save_field_cache(cache_file, key, result):
+    """Write a loader result (grid/values arrays, scalar info, metadata) to a binary .npz cache"""
+    arrays = {f"grid_{k}": v for k, v in result['grid'].items()}
+    arrays.update({f"values_{k}": v for k, v in result['values'].items()})
+    info = {k: v for k, v in result.items() if k not in ('grid', 'values', 'metadata')}
+
+    # Arrays go to the .npz as such, tuples are recorded so loading restores them
+    arrays.update({f"metadata_{k}": v for k, v in result['metadata'].items() if isinstance(v, np.ndarray)})
+    other = {k: v for k, v in result['metadata'].items() if not isinstance(v, np.ndarray)}
+    metadata = json.dumps({'items': other, 'tuples': [k for k, v in other.items() if isinstance(v, tuple)]},
+                          default=lambda v: np.asarray(v).tolist())
+
+    with open(cache_file, 'wb') as outfile:
+        np.savez(outfile, _key=key, _info=json.dumps(info), _metadata=metadata, **arrays)
+
+
+def _load_field_cache(cache_file, key):
+    """Loader result from a binary .npz cache, or None if missing or stale"""
+    if cache_file is None or not os.path.exists(cache_file):
+        return None
+
+    with np.load(cache_file) as cache:
+        if str(cache['_key']) != key:
+            return None
+
+        result = json.loads(str(cache['_info']))
+        result['grid'] = {name[5:]: cache[name] for name in cache.files if name.startswith('grid_')}
+        result['values'] = {name[7:]: cache[name] for name in cache.files if name.startswith('values_')}
+        metadata = json.loads(str(cache['_metadata']))
+        result['metadata'] = metadata['items']
+        result['metadata'].update({k: tuple(result['metadata'][k]) for k in metadata['tuples']})
+        result['metadata'].update({name[9:]: cache[name] for name in cache.files if name.startswith('metadata_')})
+
+    return result
+
+
+def load_aima_agora(path, mirror=False, interp_resolution=1000, cartesian_grid=True,
+                    n_workers=None, cache_file=None):
     """
     Load AIMA AGORA field map from multiple .map files.
 
@@ -689,6 +841,10 @@ def load_aima_agora(path, mirror=False, interp_resolution=1000):
     All files must have same r and theta grids. Units are cm and degrees.
     Field values are in unspecified units (assumed Gauss or Tesla based on magnitude).
 
+    The files are read and parsed in a thread pool. For the Cartesian grid
+    all z-planes and components are resampled in one interpolation pass
+    (the (r, theta) of the Cartesian grid are the same in every plane).
+
     Parameters:
     -----------
     path : str
@@ -697,12 +853,23 @@ def load_aima_agora(path, mirror=False, interp_resolution=1000):
         If True, mirror field about z=0 (BX, BY flip sign; BZ doesn't)
     interp_resolution : int, optional
         Number of points for Cartesian interpolation grid (default: 1000)
+    cartesian_grid : bool, optional
+        If True, interpolate onto Cartesian grid (default: True)
+        If False, return native cylindrical grid (no resampling, much smaller)
+    n_workers : int, optional
+        Threads reading the .map files (default: ThreadPoolExecutor default)
+    cache_file : str, optional
+        Binary (.npz) cache of the result. Reused if the .map files (names,
+        sizes, modification times) and the options above are unchanged,
+        otherwise (re)written
 
     Returns:
     --------
     dict with keys:
         'grid': dict with 'x', 'y', 'z' arrays (1D, in meters)
+                OR 'r' [m], 'theta' [deg], 'z' [m] if cartesian_grid=False
         'values': dict with 'x', 'y', 'z' arrays (3D, in Tesla)
+                  OR 'r', 'theta', 'z' if cartesian_grid=False (cylindrical components)
         'dim': int (3)
         'field_type': str ('magnetic')
         'metadata': dict with 'z_positions', 'n_files', 'mirrored'
@@ -764,139 +931,124 @@ def load_aima_agora(path, mirror=False, interp_resolution=1000):
     if not (z_br == z_bf == z_bz):
         raise ValueError("Not all components have the same z positions. Maybe a file is missing?")
 
-    # Read first file to get grid parameters
-    first_file = metadata["fn"][0]
+    cache_key = _field_cache_key(metadata["fn"], mirror=mirror, interp_resolution=interp_resolution,
+                                 cartesian_grid=cartesian_grid)
+    cached = _load_field_cache(cache_file, cache_key)
+    if cached is not None:
+        print(f"Loaded AGORA field from cache {cache_file}")
+        return cached
+
+    # Read and parse all files in parallel
+    print(f"Reading {len(metadata)} .map files...")
     try:
-        with open(first_file, 'r') as infile:
-            infile.readline()  # Skip comment
-            nth, nr = [int(val) for val in infile.readline().strip().split()]
-            sr, dr = [float(val) for val in infile.readline().strip().split()]
-            sth, dth = [float(val) for val in infile.readline().strip().split()]
-    except Exception as e:
-        raise RuntimeError(f"Error reading grid parameters from {first_file}: {e}")
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            maps = list(executor.map(_read_agora_map, metadata["fn"]))
+    except OSError as e:
+        raise RuntimeError(f"Error reading AGORA .map files: {e}")
 
     # Verify all files have same grid
-    for fn in metadata["fn"][1:]:
-        with open(fn, 'r') as infile:
-            infile.readline()
-            nth2, nr2 = [int(val) for val in infile.readline().strip().split()]
-            sr2, dr2 = [float(val) for val in infile.readline().strip().split()]
-            sth2, dth2 = [float(val) for val in infile.readline().strip().split()]
-
-            if not (nth == nth2 and nr == nr2 and sr == sr2 and dr == dr2 and sth == sth2 and dth == dth2):
-                raise ValueError(f"Grid mismatch in file {fn}")
+    nth, nr, sr, dr, sth, dth = maps[0][0]
+    for fn, (header, _) in zip(metadata["fn"][1:], maps[1:]):
+        if header != maps[0][0]:
+            raise ValueError(f"Grid mismatch in file {fn}")
 
     # Create cylindrical grid
     r_unique = np.linspace(sr, nr * dr, nr, endpoint=False)  # cm
     th_unique = np.linspace(sth, nth * dth, nth, endpoint=False)  # degrees
     z_unique = np.sort(np.unique(metadata["zpos"])) / 10.0  # mm -> cm
 
-    # Create Cartesian grid for interpolation
+    # Stack as (nr, nth, nz, 3) with components br, bf, bz
+    planes = np.empty((nr, nth, len(z_unique), 3))
+    for (fn, comp, zpos), (_, field) in zip(metadata, maps):
+        j = np.searchsorted(z_unique, zpos / 10.0)
+        planes[:, :, j, ['br', 'bf', 'bz'].index(comp)] = field
+    del maps
+
+    # Option 1: Return in native cylindrical coordinates
+    if not cartesian_grid:
+        field_cyl = {comp: planes[:, :, :, c] for c, comp in enumerate(['br', 'bf', 'bz'])}
+
+        z_cyl = z_unique
+        if mirror:
+            # Br, Btheta flip sign below the midplane; Bz doesn't
+            z_cyl = np.concatenate((-z_unique[:0:-1], z_unique))
+            for comp, sign in [('br', -1.0), ('bf', -1.0), ('bz', 1.0)]:
+                field_cyl[comp] = np.concatenate((sign * field_cyl[comp][:, :, :0:-1], field_cyl[comp]), axis=2)
+
+        result = {
+            'grid': {
+                'r': r_unique * 0.01,  # cm -> m
+                'theta': th_unique,  # degrees
+                'z': z_cyl * 0.01  # cm -> m
+            },
+            'values': {
+                'r': np.ascontiguousarray(field_cyl['br']),
+                'theta': np.ascontiguousarray(field_cyl['bf']),
+                'z': np.ascontiguousarray(field_cyl['bz'])
+            },
+            'dim': 3,
+            'field_type': 'magnetic',
+            'coordinate_system': 'cylindrical',
+            'metadata': {
+                'z_positions': z_unique,  # cm
+                'n_files': len(map_files),
+                'mirrored': mirror,
+                'r_range': (sr, nr * dr),  # cm
+                'theta_range': (sth, nth * dth),  # degrees
+                'filename': os.path.basename(directory)
+            }
+        }
+
+        print(f"\nComplete! Loaded cylindrical 3D field: {field_cyl['bz'].shape}")
+
+        if cache_file is not None:
+            _save_field_cache(cache_file, cache_key, result)
+
+        return result
+
+    # Option 2: Resample onto a Cartesian grid, all planes and components at once
     r_max = r_unique[-1]
 
     x_cart = np.linspace(-r_max, r_max, interp_resolution)  # cm
     y_cart = np.linspace(-r_max, r_max, interp_resolution)  # cm
 
+    grid_x, grid_y = np.meshgrid(x_cart, y_cart, indexing='ij')
+    r_cart = np.sqrt(grid_x ** 2 + grid_y ** 2)
+    # Wrap angles into [sth, sth + 360)
+    theta_cart = sth + np.mod(np.rad2deg(np.arctan2(grid_y, grid_x)) - sth, 360.0)
+
+    th_grid = th_unique
+    values = planes.reshape(nr, nth, -1)
+    if abs(nth * dth - 360.0) < 1e-6 * 360.0:
+        # Full circle: close the last cell (th_last -> 360) with the first column
+        th_grid = np.append(th_unique, sth + 360.0)
+        values = np.concatenate((values, values[:, :1]), axis=1)
+
+    print(f"Resampling {len(z_unique)} z-slices...")
+
+    interp = RegularGridInterpolator((r_unique, th_grid), values, method='linear',
+                                     bounds_error=False, fill_value=0.0)
+    sampled = interp(np.column_stack([r_cart.ravel(), theta_cart.ravel()]))
+    sampled = sampled.reshape(interp_resolution, interp_resolution, len(z_unique), 3)
+    del values, planes
+
+    # Convert cylindrical field components to Cartesian
+    theta_rad = np.deg2rad(theta_cart)[:, :, np.newaxis]
+    cos_theta = np.cos(theta_rad)
+    sin_theta = np.sin(theta_rad)
+
+    bx_3d = sampled[..., 0] * cos_theta - sampled[..., 1] * sin_theta
+    by_3d = sampled[..., 0] * sin_theta + sampled[..., 1] * cos_theta
+    bz_3d = np.ascontiguousarray(sampled[..., 2])
+    del sampled
+
+    z_cart = z_unique
     if mirror:
+        # Bx, By flip sign below the midplane; Bz doesn't
         z_cart = np.concatenate((-z_unique[:0:-1], z_unique))
-        idx_offset = len(z_unique) - 1
-    else:
-        z_cart = z_unique
-        idx_offset = 0
-
-    # Initialize 3D field arrays
-    grid_x, grid_y, grid_z = np.meshgrid(x_cart, y_cart, z_cart, indexing='ij')
-    bx_3d = np.zeros(grid_x.shape)
-    by_3d = np.zeros(grid_x.shape)
-    bz_3d = np.zeros(grid_x.shape)
-
-    # Precompute Cartesian -> cylindrical conversion for entire grid
-    r_cart = np.sqrt(grid_x ** 2 + grid_y ** 2)
-    theta_cart = np.rad2deg(np.arctan2(grid_y, grid_x))
-    # Handle negative angles
-    theta_cart = np.where(theta_cart < 0, theta_cart + 360.0, theta_cart)
-
-    print(f"Processing {len(z_unique)} z-slices...")
-
-    # Process each z slice
-    for j, z_val in enumerate(z_unique):
-        i = j + idx_offset
-        k = idx_offset - j
-
-        # Load all components at this z
-        field_data = {}
-        for comp in ['br', 'bf', 'bz']:
-            matching = metadata[(metadata["fcomp"] == comp) & (metadata["zpos"] == 10.0 * z_val)]
-            if len(matching) == 0:
-                raise ValueError(f"Missing {comp} component at z={10.0 * z_val} mm")
-
-            fn = matching["fn"][0]
-            print(f"  [{j + 1}/{len(z_unique)}] Reading {comp} at z = {10.0 * z_val} mm")
-
-            with open(fn, 'r') as infile:
-                raw_lines = infile.readlines()[4:-1]
-
-            field_flat = np.array([np.fromstring(line, sep=" ") for line in raw_lines]).flatten()
-
-            # Reshape to 2D grid (theta varies fastest, so reshape as (nr, nth))
-            field_data[comp] = field_flat.reshape(nr, nth)
-
-        # Create interpolators on the native (r, theta) grid - MUCH FASTER than griddata
-        print(f"  [{j + 1}/{len(z_unique)}] Creating interpolators...")
-
-        br_interp = RegularGridInterpolator(
-            (r_unique, th_unique),
-            field_data["br"],
-            method='linear',
-            bounds_error=False,
-            fill_value=0.0
-        )
-
-        bf_interp = RegularGridInterpolator(
-            (r_unique, th_unique),
-            field_data["bf"],
-            method='linear',
-            bounds_error=False,
-            fill_value=0.0
-        )
-
-        bz_interp = RegularGridInterpolator(
-            (r_unique, th_unique),
-            field_data["bz"],
-            method='linear',
-            bounds_error=False,
-            fill_value=0.0
-        )
-
-        # Interpolate all points at once (vectorized - FAST!)
-        print(f"  [{j + 1}/{len(z_unique)}] Interpolating...")
-
-        # Extract slice and flatten
-        r_slice = r_cart[:, :, i].ravel()
-        theta_slice = theta_cart[:, :, i].ravel()
-        points = np.column_stack([r_slice, theta_slice])
-
-        # Interpolate cylindrical components
-        br_cart = br_interp(points).reshape(interp_resolution, interp_resolution)
-        bf_cart = bf_interp(points).reshape(interp_resolution, interp_resolution)
-        bz_cart = bz_interp(points).reshape(interp_resolution, interp_resolution)
-
-        # Convert cylindrical field components to Cartesian
-        theta_rad = np.deg2rad(theta_cart[:, :, i])
-        cos_theta = np.cos(theta_rad)
-        sin_theta = np.sin(theta_rad)
-
-        bx_3d[:, :, i] = br_cart * cos_theta - bf_cart * sin_theta
-        by_3d[:, :, i] = br_cart * sin_theta + bf_cart * cos_theta
-        bz_3d[:, :, i] = bz_cart
-
-        # Mirror if requested
-        if mirror and j != 0:
-            bx_3d[:, :, k] = -bx_3d[:, :, i]
-            by_3d[:, :, k] = -by_3d[:, :, i]
-            bz_3d[:, :, k] = bz_3d[:, :, i]
-
-        print(f"  [{j + 1}/{len(z_unique)}] Done!")
+        bx_3d = np.concatenate((-bx_3d[:, :, :0:-1], bx_3d), axis=2)
+        by_3d = np.concatenate((-by_3d[:, :, :0:-1], by_3d), axis=2)
+        bz_3d = np.concatenate((bz_3d[:, :, :0:-1], bz_3d), axis=2)
 
     # Convert to SI units (cm -> m)
     result = {
@@ -925,6 +1077,9 @@ def load_aima_agora(path, mirror=False, interp_resolution=1000):
 
     print(f"\nComplete! Loaded 3D field: {bx_3d.shape}")
 
+    if cache_file is not None:
+        _save_field_cache(cache_file, cache_key, result)
+
     return result
 
 
@@ -7,6 +7,9 @@ Provides plotting utilities for Field objects including:
 - 3D isosurface plots
 - Field line tracing
 
+Slice samples are cached per field (see sample_field_slices), so replotting
+the same planes, e.g. with a different colormap, does not query the field again.
+
 Usage:
     from field_visualization import plot_field_slice
     plot_field_slice(field, axis='z', intersect=0.0)
@@ -14,9 +17,108 @@ Usage:
 
 import numpy as np
 import matplotlib.pyplot as plt
+import weakref
+from collections import OrderedDict
 from matplotlib import cm
-from typing import Optional, Tuple, Union
-from ..field import Field
+from typing import Optional, Tuple, Union, List
+from ..field import Field, _scaling_state
+
+# Maximum number of cached planes per field (each holds 3 * resolution^2 floats)
+SLICE_CACHE_MAX_PLANES = 32
+
+# In-plane and perpendicular coordinate indices for each slice axis
+_PLANE_INDICES = {'x': (1, 2, 0), 'y': (0, 2, 1), 'z': (0, 1, 2)}
+
+# field -> OrderedDict(plane key -> (fx, fy, fz)), entries vanish with the field
+_slice_cache = weakref.WeakKeyDictionary()
+
+
+def sample_field_slices(field: Field,
+                        axis: str,
+                        positions: List[float],
+                        limits: Tuple[Tuple[float, float], Tuple[float, float]],
+                        resolution: int) -> Tuple[np.ndarray, np.ndarray, List[Tuple]]:
+    """
+    Sample field components on one or more parallel planes, with caching.
+
+    All planes not yet cached are evaluated in a single batched field call.
+    Results are cached per field object, keyed on axis, position, limits,
+    resolution and the field's scaling, and reused on later calls.
+
+    Parameters
+    ----------
+    field : Field
+        Field object to sample
+    axis : str
+        Axis perpendicular to the planes ('x', 'y', or 'z')
+    positions : list of float
+        Plane positions along the perpendicular axis [m]
+    limits : tuple of tuples
+        In-plane limits ((min1, max1), (min2, max2)) [m]
+    resolution : int
+        Number of points in each in-plane direction
+
+    Returns
+    -------
+    C1, C2 : np.ndarray(resolution, resolution)
+        In-plane coordinate meshgrids (indexing='ij')
+    planes : list of tuple
+        (fx, fy, fz) arrays of shape (resolution, resolution) for each position.
+        The arrays are shared with the cache and must not be modified in place.
+    """
+    coord1_idx, coord2_idx, perp_idx = _PLANE_INDICES[axis]
+
+    coord1 = np.linspace(limits[0][0], limits[0][1], resolution)
+    coord2 = np.linspace(limits[1][0], limits[1][1], resolution)
+    C1, C2 = np.meshgrid(coord1, coord2, indexing='ij')
+
+    try:
+        cache = _slice_cache.setdefault(field, OrderedDict())
+    except TypeError:
+        # Not weak-referenceable: sample without caching
+        cache = OrderedDict()
+
+    limits_key = tuple(float(lim) for pair in limits for lim in pair)
+    # Weights, scale/offset and RF parameters of wrapped fields, not just Field.scaling
+    scaling = _scaling_state(field)
+    keys = [(axis, float(pos), limits_key, resolution, scaling) for pos in positions]
+
+    # Evaluate all missing planes in one field call
+    missing = [key for key in dict.fromkeys(keys) if key not in cache]
+
+    if missing:
+        n_pts = resolution * resolution
+        pts = np.empty((len(missing) * n_pts, 3))
+
+        for i, key in enumerate(missing):
+            block = pts[i * n_pts:(i + 1) * n_pts]
+            block[:, coord1_idx] = C1.ravel()
+            block[:, coord2_idx] = C2.ravel()
+            block[:, perp_idx] = key[1]
+
+        values = np.asarray(field(pts))
+
+        for i, key in enumerate(missing):
+            comp = values[i * n_pts:(i + 1) * n_pts]
+            cache[key] = tuple(comp[:, j].reshape(resolution, resolution) for j in range(3))
+
+    planes = []
+    for key in keys:
+        cache.move_to_end(key)
+        planes.append(cache[key])
+
+    while len(cache) > SLICE_CACHE_MAX_PLANES:
+        cache.popitem(last=False)
+
+    return C1, C2, planes
+
+
+def clear_slice_cache(field: Optional[Field] = None):
+    """Drop cached slice samples for one field, or for all fields if None."""
+    if field is None:
+        _slice_cache.clear()
+    else:
+        _slice_cache.pop(field, None)
 
 
 def plot_field_slice(field: Field,
@@ -127,36 +229,9 @@ def plot_field_slice(field: Field,
                 all_lims = [(g[0], g[-1]) for g in grid]
                 limits = (all_lims[coord1_idx], all_lims[coord2_idx])
 
-    # Create coordinate arrays
-    coord1 = np.linspace(limits[0][0], limits[0][1], resolution)
-    coord2 = np.linspace(limits[1][0], limits[1][1], resolution)
-
-    # Create meshgrid
-    C1, C2 = np.meshgrid(coord1, coord2, indexing='ij')
-
-    # Build 3D point array
-    pts = np.zeros((resolution * resolution, 3))
-
-    if axis == 'z':
-        pts[:, 0] = C1.ravel()
-        pts[:, 1] = C2.ravel()
-        pts[:, 2] = intersect
-    elif axis == 'y':
-        pts[:, 0] = C1.ravel()
-        pts[:, 1] = intersect
-        pts[:, 2] = C2.ravel()
-    else:  # axis == 'x'
-        pts[:, 0] = intersect
-        pts[:, 1] = C1.ravel()
-        pts[:, 2] = C2.ravel()
-
-    # Query field
-    fx, fy, fz = field(pts)
-
-    # Reshape to 2D
-    fx = fx.reshape(resolution, resolution)
-    fy = fy.reshape(resolution, resolution)
-    fz = fz.reshape(resolution, resolution)
+    # Query field on the plane (cached)
+    C1, C2, planes = sample_field_slices(field, axis, [intersect], limits, resolution)
+    fx, fy, fz = planes[0]
 
     # Determine field magnitude for colorbar scaling
     f_mag = np.sqrt(fx ** 2 + fy ** 2 + fz ** 2)
@@ -278,24 +353,9 @@ def plot_field_magnitude(field: Field,
         else:
             limits = ((-0.1, 0.1), (-0.1, 0.1))
 
-    # Create grid
-    coord1 = np.linspace(limits[0][0], limits[0][1], resolution)
-    coord2 = np.linspace(limits[1][0], limits[1][1], resolution)
-    C1, C2 = np.meshgrid(coord1, coord2, indexing='ij')
-
-    # Build points
-    pts = np.zeros((resolution * resolution, 3))
-    pts[:, coord1_idx] = C1.ravel()
-    pts[:, coord2_idx] = C2.ravel()
-    pts[:, perp_idx] = intersect
-
-    # Query field
-    fx, fy, fz = field(pts)
-
-    # Reshape
-    fx = fx.reshape(resolution, resolution)
-    fy = fy.reshape(resolution, resolution)
-    fz = fz.reshape(resolution, resolution)
+    # Query field on the plane (cached)
+    C1, C2, planes = sample_field_slices(field, axis, [intersect], limits, resolution)
+    fx, fy, fz = planes[0]
 
     # Calculate magnitude
     f_mag = np.sqrt(fx ** 2 + fy ** 2 + fz ** 2)
@@ -432,34 +492,15 @@ def plot_field_multiplane(field: Field,
     elif limits is None:
         limits = ((-0.1, 0.1), (-0.1, 0.1))
 
-    # Create coordinate arrays
-    coord1 = np.linspace(limits[0][0], limits[0][1], resolution)
-    coord2 = np.linspace(limits[1][0], limits[1][1], resolution)
-    C1, C2 = np.meshgrid(coord1, coord2, indexing='ij')
+    # Query field on all planes in one batched call (cached)
+    C1, C2, planes = sample_field_slices(field, axis_lower, positions, limits, resolution)
+    f_mags = [np.sqrt(fx ** 2 + fy ** 2 + fz ** 2) for fx, fy, fz in planes]
 
     # Find global vmax for consistent colorscale
-    all_mags = []
-    for pos in positions:
-        pts = np.zeros((resolution * resolution, 3))
-        pts[:, coord1_idx] = C1.ravel()
-        pts[:, coord2_idx] = C2.ravel()
-        pts[:, perp_idx] = pos
-
-        fx, fy, fz = field(pts)
-        f_mag = np.sqrt(fx ** 2 + fy ** 2 + fz ** 2)
-        all_mags.append(np.max(f_mag))
-
-    vmax = max(all_mags)
+    vmax = max(np.max(f_mag) for f_mag in f_mags)
 
     # Plot each position
-    for idx, (ax, pos) in enumerate(zip(axes[:n_plots], positions)):
-        pts = np.zeros((resolution * resolution, 3))
-        pts[:, coord1_idx] = C1.ravel()
-        pts[:, coord2_idx] = C2.ravel()
-        pts[:, perp_idx] = pos
-
-        fx, fy, fz = field(pts)
-        f_mag = np.sqrt(fx ** 2 + fy ** 2 + fz ** 2).reshape(resolution, resolution)
+    for idx, (ax, pos, f_mag) in enumerate(zip(axes[:n_plots], positions, f_mags)):
 
         contour = ax.contourf(C1, C2, f_mag, levels=15, cmap=cmap, vmin=0, vmax=vmax)
         ax.set_xlabel(f'{coord1_label} (m)')
@@ -18,6 +18,7 @@ Author: Refactored for cyclotron design suite
 import numpy as np
 from scipy.interpolate import RegularGridInterpolator
 from scipy.ndimage import map_coordinates
+from collections import OrderedDict
 import warnings
 
 # Optional dependencies
@@ -266,146 +267,1796 @@ if HAS_NUMBA:
                                          grid_x, grid_y, grid_z, values, fill_value)
         return result
 
+
+    # Cubic kernels: piecewise tricubic Hermite (Lekien-Marsden) interpolation.
+    # Instead of 4^ndim polynomial coefficients per cell, the per-node data
+    # f, ∂f/∂x, ∂f/∂y, ∂²f/∂x∂y, ... (2^ndim channels, see _hermite_node_data)
+    # are precomputed once, and the cell polynomial is the tensor product of
+    # 1D Hermite bases over the 2^ndim corners. This is the same C1-continuous
+    # interpolant at 1/8 of the memory of stored cell coefficients (3D).
+    # Channel m of a node holds the derivative along the axes in bitmask m.
+
+    @njit(cache=True, fastmath=True)
+    def _hermite_basis(t, h):
+        """1D cubic Hermite weights (f0, h·f0', f1, h·f1') at fraction t of a cell of width h."""
+        t2 = t * t
+        t3 = t2 * t
+        return (2.0 * t3 - 3.0 * t2 + 1.0,
+                (t3 - 2.0 * t2 + t) * h,
+                -2.0 * t3 + 3.0 * t2,
+                (t3 - t2) * h)
+
+
+    @njit(cache=True, fastmath=True)
+    def _cubic1d_single(x, grid_x, values, fill_value):
+        """1D cubic Hermite interpolation for single point, values (nx, 2)."""
+        nx = len(grid_x)
+        if x < grid_x[0] or x > grid_x[nx - 1]:
+            return fill_value
+
+        i = max(0, min(_searchsorted_numba(grid_x, x), nx - 2))
+        hx = grid_x[i + 1] - grid_x[i]
+        bx = _hermite_basis(max(0.0, min((x - grid_x[i]) / hx, 1.0)), hx)
+
+        return bx[0] * values[i, 0] + bx[1] * values[i, 1] + bx[2] * values[i + 1, 0] + bx[3] * values[i + 1, 1]
+
+
+    @njit(cache=True, fastmath=True)
+    def _cubic2d_single(x, y, grid_x, grid_y, values, fill_value):
+        """2D bicubic Hermite interpolation for single point, values (nx, ny, 4)."""
+        nx, ny = len(grid_x), len(grid_y)
+        if x < grid_x[0] or x > grid_x[nx - 1] or y < grid_y[0] or y > grid_y[ny - 1]:
+            return fill_value
+
+        i = max(0, min(_searchsorted_numba(grid_x, x), nx - 2))
+        j = max(0, min(_searchsorted_numba(grid_y, y), ny - 2))
+        hx = grid_x[i + 1] - grid_x[i]
+        hy = grid_y[j + 1] - grid_y[j]
+        bx = _hermite_basis(max(0.0, min((x - grid_x[i]) / hx, 1.0)), hx)
+        by = _hermite_basis(max(0.0, min((y - grid_y[j]) / hy, 1.0)), hy)
+
+        result = 0.0
+        for a in range(2):
+            for b in range(2):
+                for my in range(2):
+                    wy = by[2 * b + my]
+                    for mx in range(2):
+                        result += bx[2 * a + mx] * wy * values[i + a, j + b, mx + 2 * my]
+        return result
+
+
+    @njit(cache=True, fastmath=True)
+    def _cubic3d_single(x, y, z, grid_x, grid_y, grid_z, values, fill_value):
+        """3D tricubic Hermite interpolation for single point, values (nx, ny, nz, 8)."""
+        nx, ny, nz = len(grid_x), len(grid_y), len(grid_z)
+        if (x < grid_x[0] or x > grid_x[nx - 1] or
+                y < grid_y[0] or y > grid_y[ny - 1] or
+                z < grid_z[0] or z > grid_z[nz - 1]):
+            return fill_value
+
+        i = max(0, min(_searchsorted_numba(grid_x, x), nx - 2))
+        j = max(0, min(_searchsorted_numba(grid_y, y), ny - 2))
+        k = max(0, min(_searchsorted_numba(grid_z, z), nz - 2))
+        hx = grid_x[i + 1] - grid_x[i]
+        hy = grid_y[j + 1] - grid_y[j]
+        hz = grid_z[k + 1] - grid_z[k]
+        bx = _hermite_basis(max(0.0, min((x - grid_x[i]) / hx, 1.0)), hx)
+        by = _hermite_basis(max(0.0, min((y - grid_y[j]) / hy, 1.0)), hy)
+        bz = _hermite_basis(max(0.0, min((z - grid_z[k]) / hz, 1.0)), hz)
+
+        result = 0.0
+        for a in range(2):
+            for b in range(2):
+                for c in range(2):
+                    for mz in range(2):
+                        for my in range(2):
+                            wyz = by[2 * b + my] * bz[2 * c + mz]
+                            for mx in range(2):
+                                result += (bx[2 * a + mx] * wyz *
+                                           values[i + a, j + b, k + c, mx + 2 * my + 4 * mz])
+        return result
+
+
+    @njit(parallel=True, cache=True, fastmath=True, nogil=True)
+    def _cubic1d_batch(x_arr, grid_x, values, fill_value):
+        """1D cubic interpolation for batch of points."""
+        n = len(x_arr)
+        result = np.empty(n, dtype=np.float64)
+        for i in prange(n):
+            result[i] = _cubic1d_single(x_arr[i], grid_x, values, fill_value)
+        return result
+
+
+    @njit(parallel=True, cache=True, fastmath=True, nogil=True)
+    def _cubic2d_batch(x_arr, y_arr, grid_x, grid_y, values, fill_value):
+        """2D bicubic interpolation for batch of points."""
+        n = len(x_arr)
+        result = np.empty(n, dtype=np.float64)
+        for i in prange(n):
+            result[i] = _cubic2d_single(x_arr[i], y_arr[i], grid_x, grid_y, values, fill_value)
+        return result
+
+
+    @njit(parallel=True, cache=True, fastmath=True, nogil=True)
+    def _cubic3d_batch(x_arr, y_arr, z_arr, grid_x, grid_y, grid_z, values, fill_value):
+        """3D tricubic interpolation for batch of points."""
+        n = len(x_arr)
+        result = np.empty(n, dtype=np.float64)
+        for i in prange(n):
+            result[i] = _cubic3d_single(x_arr[i], y_arr[i], z_arr[i],
+                                        grid_x, grid_y, grid_z, values, fill_value)
+        return result
+
+
+    # Strided kernels: read coordinates straight from the columns (axes) of an
+    # (M, ncols) point array of any layout and write scale * value into column
+    # col of out. No coordinate copies or result temporaries are made.
+
+    @njit(parallel=True, cache=True, fastmath=True, nogil=True)
+    def _interp1d_into(pts, ax0, grid_x, values, fill_value, scale, out, col):
+        """1D linear interpolation of pts[:, ax0] into out[:, col]."""
+        for p in prange(pts.shape[0]):
+            out[p, col] = scale * _interp1d_single(pts[p, ax0], grid_x, values, fill_value)
+
+
+    @njit(parallel=True, cache=True, fastmath=True, nogil=True)
+    def _interp2d_into(pts, ax0, ax1, grid_x, grid_y, values, fill_value, scale, out, col):
+        """2D bilinear interpolation of pts[:, (ax0, ax1)] into out[:, col]."""
+        for p in prange(pts.shape[0]):
+            out[p, col] = scale * _interp2d_single(pts[p, ax0], pts[p, ax1],
+                                                   grid_x, grid_y, values, fill_value)
+
+
+    @njit(parallel=True, cache=True, fastmath=True, nogil=True)
+    def _interp3d_into(pts, ax0, ax1, ax2, grid_x, grid_y, grid_z, values, fill_value, scale, out, col):
+        """3D trilinear interpolation of pts[:, (ax0, ax1, ax2)] into out[:, col]."""
+        for p in prange(pts.shape[0]):
+            out[p, col] = scale * _interp3d_single(pts[p, ax0], pts[p, ax1], pts[p, ax2],
+                                                   grid_x, grid_y, grid_z, values, fill_value)
+
+
+    @njit(parallel=True, cache=True, fastmath=True, nogil=True)
+    def _cubic1d_into(pts, ax0, grid_x, values, fill_value, scale, out, col):
+        """1D cubic interpolation of pts[:, ax0] into out[:, col]."""
+        for p in prange(pts.shape[0]):
+            out[p, col] = scale * _cubic1d_single(pts[p, ax0], grid_x, values, fill_value)
+
+
+    @njit(parallel=True, cache=True, fastmath=True, nogil=True)
+    def _cubic2d_into(pts, ax0, ax1, grid_x, grid_y, values, fill_value, scale, out, col):
+        """2D bicubic interpolation of pts[:, (ax0, ax1)] into out[:, col]."""
+        for p in prange(pts.shape[0]):
+            out[p, col] = scale * _cubic2d_single(pts[p, ax0], pts[p, ax1],
+                                                  grid_x, grid_y, values, fill_value)
+
+
+    @njit(parallel=True, cache=True, fastmath=True, nogil=True)
+    def _cubic3d_into(pts, ax0, ax1, ax2, grid_x, grid_y, grid_z, values, fill_value, scale, out, col):
+        """3D tricubic interpolation of pts[:, (ax0, ax1, ax2)] into out[:, col]."""
+        for p in prange(pts.shape[0]):
+            out[p, col] = scale * _cubic3d_single(pts[p, ax0], pts[p, ax1], pts[p, ax2],
+                                                  grid_x, grid_y, grid_z, values, fill_value)
+
+
+    # Gradient kernels: value and analytic gradient from one cell lookup, by
+    # differentiating the linear or Hermite weights. Outside the grid the value
+    # is fill_value and the gradient zero.
+
+    @njit(cache=True, fastmath=True)
+    def _hermite_basis_deriv(t, h):
+        """d/dx of the _hermite_basis weights (cell width h)."""
+        t2 = t * t
+        return ((6.0 * t2 - 6.0 * t) / h,
+                3.0 * t2 - 4.0 * t + 1.0,
+                (-6.0 * t2 + 6.0 * t) / h,
+                3.0 * t2 - 2.0 * t)
+
+
+    @njit(parallel=True, cache=True, fastmath=True, nogil=True)
+    def _interp1d_grad_batch(x_arr, grid_x, values, fill_value):
+        """1D linear value and gradient for batch of points."""
+        n = len(x_arr)
+        nx = len(grid_x)
+        result = np.empty(n, dtype=np.float64)
+        grad = np.zeros((n, 1), dtype=np.float64)
+        for p in prange(n):
+            x = x_arr[p]
+            if x < grid_x[0] or x > grid_x[nx - 1]:
+                result[p] = fill_value
+                continue
+            i = max(0, min(_searchsorted_numba(grid_x, x), nx - 2))
+            hx = grid_x[i + 1] - grid_x[i]
+            tx = max(0.0, min((x - grid_x[i]) / hx, 1.0))
+            result[p] = values[i] * (1.0 - tx) + values[i + 1] * tx
+            grad[p, 0] = (values[i + 1] - values[i]) / hx
+        return result, grad
+
+
+    @njit(parallel=True, cache=True, fastmath=True, nogil=True)
+    def _interp2d_grad_batch(x_arr, y_arr, grid_x, grid_y, values, fill_value):
+        """2D bilinear value and gradient for batch of points."""
+        n = len(x_arr)
+        nx, ny = len(grid_x), len(grid_y)
+        result = np.empty(n, dtype=np.float64)
+        grad = np.zeros((n, 2), dtype=np.float64)
+        for p in prange(n):
+            x = x_arr[p]
+            y = y_arr[p]
+            if x < grid_x[0] or x > grid_x[nx - 1] or y < grid_y[0] or y > grid_y[ny - 1]:
+                result[p] = fill_value
+                continue
+            i = max(0, min(_searchsorted_numba(grid_x, x), nx - 2))
+            j = max(0, min(_searchsorted_numba(grid_y, y), ny - 2))
+            hx = grid_x[i + 1] - grid_x[i]
+            hy = grid_y[j + 1] - grid_y[j]
+            tx = max(0.0, min((x - grid_x[i]) / hx, 1.0))
+            ty = max(0.0, min((y - grid_y[j]) / hy, 1.0))
+
+            c00 = values[i, j]
+            c10 = values[i + 1, j]
+            c01 = values[i, j + 1]
+            c11 = values[i + 1, j + 1]
+
+            c0 = c00 * (1.0 - tx) + c10 * tx
+            c1 = c01 * (1.0 - tx) + c11 * tx
+            result[p] = c0 * (1.0 - ty) + c1 * ty
+            grad[p, 0] = ((c10 - c00) * (1.0 - ty) + (c11 - c01) * ty) / hx
+            grad[p, 1] = (c1 - c0) / hy
+        return result, grad
+
+
+    @njit(parallel=True, cache=True, fastmath=True, nogil=True)
+    def _interp3d_grad_batch(x_arr, y_arr, z_arr, grid_x, grid_y, grid_z, values, fill_value):
+        """3D trilinear value and gradient for batch of points."""
+        n = len(x_arr)
+        nx, ny, nz = len(grid_x), len(grid_y), len(grid_z)
+        result = np.empty(n, dtype=np.float64)
+        grad = np.zeros((n, 3), dtype=np.float64)
+        for p in prange(n):
+            x = x_arr[p]
+            y = y_arr[p]
+            z = z_arr[p]
+            if (x < grid_x[0] or x > grid_x[nx - 1] or
+                    y < grid_y[0] or y > grid_y[ny - 1] or
+                    z < grid_z[0] or z > grid_z[nz - 1]):
+                result[p] = fill_value
+                continue
+            i = max(0, min(_searchsorted_numba(grid_x, x), nx - 2))
+            j = max(0, min(_searchsorted_numba(grid_y, y), ny - 2))
+            k = max(0, min(_searchsorted_numba(grid_z, z), nz - 2))
+            hx = grid_x[i + 1] - grid_x[i]
+            hy = grid_y[j + 1] - grid_y[j]
+            hz = grid_z[k + 1] - grid_z[k]
+            tx = max(0.0, min((x - grid_x[i]) / hx, 1.0))
+            ty = max(0.0, min((y - grid_y[j]) / hy, 1.0))
+            tz = max(0.0, min((z - grid_z[k]) / hz, 1.0))
+
+            f = 0.0
+            dfx = 0.0
+            dfy = 0.0
+            dfz = 0.0
+            for a in range(2):
+                wx = tx if a == 1 else 1.0 - tx
+                dwx = (1.0 if a == 1 else -1.0) / hx
+                for b in range(2):
+                    wy = ty if b == 1 else 1.0 - ty
+                    dwy = (1.0 if b == 1 else -1.0) / hy
+                    for c in range(2):
+                        wz = tz if c == 1 else 1.0 - tz
+                        dwz = (1.0 if c == 1 else -1.0) / hz
+                        v = values[i + a, j + b, k + c]
+                        f += wx * wy * wz * v
+                        dfx += dwx * wy * wz * v
+                        dfy += wx * dwy * wz * v
+                        dfz += wx * wy * dwz * v
+            result[p] = f
+            grad[p, 0] = dfx
+            grad[p, 1] = dfy
+            grad[p, 2] = dfz
+        return result, grad
+
+
+    @njit(parallel=True, cache=True, fastmath=True, nogil=True)
+    def _cubic1d_grad_batch(x_arr, grid_x, values, fill_value):
+        """1D cubic Hermite value and gradient for batch of points."""
+        n = len(x_arr)
+        nx = len(grid_x)
+        result = np.empty(n, dtype=np.float64)
+        grad = np.zeros((n, 1), dtype=np.float64)
+        for p in prange(n):
+            x = x_arr[p]
+            if x < grid_x[0] or x > grid_x[nx - 1]:
+                result[p] = fill_value
+                continue
+            i = max(0, min(_searchsorted_numba(grid_x, x), nx - 2))
+            hx = grid_x[i + 1] - grid_x[i]
+            tx = max(0.0, min((x - grid_x[i]) / hx, 1.0))
+            bx = _hermite_basis(tx, hx)
+            dbx = _hermite_basis_deriv(tx, hx)
+            f = 0.0
+            dfx = 0.0
+            for a in range(2):
+                for mx in range(2):
+                    v = values[i + a, mx]
+                    f += bx[2 * a + mx] * v
+                    dfx += dbx[2 * a + mx] * v
+            result[p] = f
+            grad[p, 0] = dfx
+        return result, grad
+
+
+    @njit(parallel=True, cache=True, fastmath=True, nogil=True)
+    def _cubic2d_grad_batch(x_arr, y_arr, grid_x, grid_y, values, fill_value):
+        """2D bicubic Hermite value and gradient for batch of points."""
+        n = len(x_arr)
+        nx, ny = len(grid_x), len(grid_y)
+        result = np.empty(n, dtype=np.float64)
+        grad = np.zeros((n, 2), dtype=np.float64)
+        for p in prange(n):
+            x = x_arr[p]
+            y = y_arr[p]
+            if x < grid_x[0] or x > grid_x[nx - 1] or y < grid_y[0] or y > grid_y[ny - 1]:
+                result[p] = fill_value
+                continue
+            i = max(0, min(_searchsorted_numba(grid_x, x), nx - 2))
+            j = max(0, min(_searchsorted_numba(grid_y, y), ny - 2))
+            hx = grid_x[i + 1] - grid_x[i]
+            hy = grid_y[j + 1] - grid_y[j]
+            tx = max(0.0, min((x - grid_x[i]) / hx, 1.0))
+            ty = max(0.0, min((y - grid_y[j]) / hy, 1.0))
+            bx = _hermite_basis(tx, hx)
+            by = _hermite_basis(ty, hy)
+            dbx = _hermite_basis_deriv(tx, hx)
+            dby = _hermite_basis_deriv(ty, hy)
+
+            f = 0.0
+            dfx = 0.0
+            dfy = 0.0
+            for a in range(2):
+                for b in range(2):
+                    for my in range(2):
+                        wy = by[2 * b + my]
+                        dwy = dby[2 * b + my]
+                        for mx in range(2):
+                            v = values[i + a, j + b, mx + 2 * my]
+                            f += bx[2 * a + mx] * wy * v
+                            dfx += dbx[2 * a + mx] * wy * v
+                            dfy += bx[2 * a + mx] * dwy * v
+            result[p] = f
+            grad[p, 0] = dfx
+            grad[p, 1] = dfy
+        return result, grad
+
+
+    @njit(parallel=True, cache=True, fastmath=True, nogil=True)
+    def _cubic3d_grad_batch(x_arr, y_arr, z_arr, grid_x, grid_y, grid_z, values, fill_value):
+        """3D tricubic Hermite value and gradient for batch of points."""
+        n = len(x_arr)
+        nx, ny, nz = len(grid_x), len(grid_y), len(grid_z)
+        result = np.empty(n, dtype=np.float64)
+        grad = np.zeros((n, 3), dtype=np.float64)
+        for p in prange(n):
+            x = x_arr[p]
+            y = y_arr[p]
+            z = z_arr[p]
+            if (x < grid_x[0] or x > grid_x[nx - 1] or
+                    y < grid_y[0] or y > grid_y[ny - 1] or
+                    z < grid_z[0] or z > grid_z[nz - 1]):
+                result[p] = fill_value
+                continue
+            i = max(0, min(_searchsorted_numba(grid_x, x), nx - 2))
+            j = max(0, min(_searchsorted_numba(grid_y, y), ny - 2))
+            k = max(0, min(_searchsorted_numba(grid_z, z), nz - 2))
+            hx = grid_x[i + 1] - grid_x[i]
+            hy = grid_y[j + 1] - grid_y[j]
+            hz = grid_z[k + 1] - grid_z[k]
+            tx = max(0.0, min((x - grid_x[i]) / hx, 1.0))
+            ty = max(0.0, min((y - grid_y[j]) / hy, 1.0))
+            tz = max(0.0, min((z - grid_z[k]) / hz, 1.0))
+            bx = _hermite_basis(tx, hx)
+            by = _hermite_basis(ty, hy)
+            bz = _hermite_basis(tz, hz)
+            dbx = _hermite_basis_deriv(tx, hx)
+            dby = _hermite_basis_deriv(ty, hy)
+            dbz = _hermite_basis_deriv(tz, hz)
+
+            f = 0.0
+            dfx = 0.0
+            dfy = 0.0
+            dfz = 0.0
+            for a in range(2):
+                for b in range(2):
+                    for c in range(2):
+                        for mz in range(2):
+                            wz = bz[2 * c + mz]
+                            dwz = dbz[2 * c + mz]
+                            for my in range(2):
+                                wy = by[2 * b + my]
+                                dwy = dby[2 * b + my]
+                                for mx in range(2):
+                                    wx = bx[2 * a + mx]
+                                    v = values[i + a, j + b, k + c, mx + 2 * my + 4 * mz]
+                                    f += wx * wy * wz * v
+                                    dfx += dbx[2 * a + mx] * wy * wz * v
+                                    dfy += wx * dwy * wz * v
+                                    dfz += wx * wy * dwz * v
+            result[p] = f
+            grad[p, 0] = dfx
+            grad[p, 1] = dfy
+            grad[p, 2] = dfz
+        return result, grad
+
+
+    # Stacked kernels: values carry a trailing channel axis (..., C). The cell
+    # search and weights are computed once per point and reused for all C
+    # channels, which are contiguous in memory.
+
+    @njit(parallel=True, cache=True, fastmath=True, nogil=True)
+    def _interp1d_stacked_batch(x_arr, grid_x, values, fill_value):
+        """1D linear interpolation of C stacked channels for batch of points."""
+        n = len(x_arr)
+        nx = len(grid_x)
+        nc = values.shape[1]
+        result = np.empty((n, nc), dtype=np.float64)
+        for p in prange(n):
+            x = x_arr[p]
+            if x < grid_x[0] or x > grid_x[nx - 1]:
+                for c in range(nc):
+                    result[p, c] = fill_value
+                continue
+
+            i = max(0, min(_searchsorted_numba(grid_x, x), nx - 2))
+            t = max(0.0, min((x - grid_x[i]) / (grid_x[i + 1] - grid_x[i]), 1.0))
+
+            for c in range(nc):
+                result[p, c] = values[i, c] * (1.0 - t) + values[i + 1, c] * t
+        return result
+
+
+    @njit(cache=True, fastmath=True)
+    def _interp2d_stacked_point(x, y, grid_x, grid_y, values, fill_value, out):
+        """2D bilinear interpolation of all stacked channels at one point into out."""
+        nx, ny = len(grid_x), len(grid_y)
+        nc = values.shape[2]
+        if x < grid_x[0] or x > grid_x[nx - 1] or y < grid_y[0] or y > grid_y[ny - 1]:
+            for c in range(nc):
+                out[c] = fill_value
+            return
+
+        i = max(0, min(_searchsorted_numba(grid_x, x), nx - 2))
+        j = max(0, min(_searchsorted_numba(grid_y, y), ny - 2))
+        tx = max(0.0, min((x - grid_x[i]) / (grid_x[i + 1] - grid_x[i]), 1.0))
+        ty = max(0.0, min((y - grid_y[j]) / (grid_y[j + 1] - grid_y[j]), 1.0))
+
+        w00 = (1.0 - tx) * (1.0 - ty)
+        w10 = tx * (1.0 - ty)
+        w01 = (1.0 - tx) * ty
+        w11 = tx * ty
+
+        for c in range(nc):
+            out[c] = (w00 * values[i, j, c] + w10 * values[i + 1, j, c] +
+                      w01 * values[i, j + 1, c] + w11 * values[i + 1, j + 1, c])
+
+
+    @njit(cache=True, fastmath=True)
+    def _interp3d_stacked_point(x, y, z, grid_x, grid_y, grid_z, values, fill_value, out):
+        """3D trilinear interpolation of all stacked channels at one point into out."""
+        nx, ny, nz = len(grid_x), len(grid_y), len(grid_z)
+        nc = values.shape[3]
+        if (x < grid_x[0] or x > grid_x[nx - 1] or
+                y < grid_y[0] or y > grid_y[ny - 1] or
+                z < grid_z[0] or z > grid_z[nz - 1]):
+            for c in range(nc):
+                out[c] = fill_value
+            return
+
+        i = max(0, min(_searchsorted_numba(grid_x, x), nx - 2))
+        j = max(0, min(_searchsorted_numba(grid_y, y), ny - 2))
+        k = max(0, min(_searchsorted_numba(grid_z, z), nz - 2))
+        tx = max(0.0, min((x - grid_x[i]) / (grid_x[i + 1] - grid_x[i]), 1.0))
+        ty = max(0.0, min((y - grid_y[j]) / (grid_y[j + 1] - grid_y[j]), 1.0))
+        tz = max(0.0, min((z - grid_z[k]) / (grid_z[k + 1] - grid_z[k]), 1.0))
+
+        w000 = (1.0 - tx) * (1.0 - ty) * (1.0 - tz)
+        w100 = tx * (1.0 - ty) * (1.0 - tz)
+        w010 = (1.0 - tx) * ty * (1.0 - tz)
+        w110 = tx * ty * (1.0 - tz)
+        w001 = (1.0 - tx) * (1.0 - ty) * tz
+        w101 = tx * (1.0 - ty) * tz
+        w011 = (1.0 - tx) * ty * tz
+        w111 = tx * ty * tz
+
+        for c in range(nc):
+            out[c] = (w000 * values[i, j, k, c] + w100 * values[i + 1, j, k, c] +
+                      w010 * values[i, j + 1, k, c] + w110 * values[i + 1, j + 1, k, c] +
+                      w001 * values[i, j, k + 1, c] + w101 * values[i + 1, j, k + 1, c] +
+                      w011 * values[i, j + 1, k + 1, c] + w111 * values[i + 1, j + 1, k + 1, c])
+
+
+    @njit(parallel=True, cache=True, fastmath=True, nogil=True)
+    def _interp2d_stacked_batch(x_arr, y_arr, grid_x, grid_y, values, fill_value):
+        """2D bilinear interpolation of C stacked channels for batch of points."""
+        n = len(x_arr)
+        result = np.empty((n, values.shape[2]), dtype=np.float64)
+        for p in prange(n):
+            _interp2d_stacked_point(x_arr[p], y_arr[p], grid_x, grid_y, values, fill_value, result[p])
+        return result
+
+
+    @njit(parallel=True, cache=True, fastmath=True, nogil=True)
+    def _interp3d_stacked_batch(x_arr, y_arr, z_arr, grid_x, grid_y, grid_z, values, fill_value):
+        """3D trilinear interpolation of C stacked channels for batch of points."""
+        n = len(x_arr)
+        result = np.empty((n, values.shape[3]), dtype=np.float64)
+        for p in prange(n):
+            _interp3d_stacked_point(x_arr[p], y_arr[p], z_arr[p], grid_x, grid_y, grid_z,
+                                    values, fill_value, result[p])
+        return result
+
+
+    # Tiled kernels: 3D stacked values stored as T x T x T bricks with all
+    # channels interleaved, tiles[ti, tj, tk, li, lj, lk, c] for node
+    # (ti*T + li, tj*T + lj, tk*T + lk), passed flattened. The 8 corners of a
+    # stencil then lie in one contiguous T^3*C block except at brick faces,
+    # instead of in 4 rows that are ny*nz*C and nz*C elements apart. The flat
+    # offset of a node separates per axis, so each corner is one sum of three
+    # precomputed axis offsets.
+
+    @njit(cache=True)
+    def _tiled_axis_offset(i, shift, tile_stride, local_stride):
+        return (i >> shift) * tile_stride + (i & ((1 << shift) - 1)) * local_stride
+
+
+    @njit(cache=True, fastmath=True)
+    def _interp3d_tiled_point(x, y, z, grid_x, grid_y, grid_z, tiles, strides, shift, nc, fill_value, out):
+        """3D trilinear interpolation of all channels of a flat tiled array at one point into out."""
+        nx, ny, nz = len(grid_x), len(grid_y), len(grid_z)
+        if (x < grid_x[0] or x > grid_x[nx - 1] or
+                y < grid_y[0] or y > grid_y[ny - 1] or
+                z < grid_z[0] or z > grid_z[nz - 1]):
+            for c in range(nc):
+                out[c] = fill_value
+            return
+
+        i = max(0, min(_searchsorted_numba(grid_x, x), nx - 2))
+        j = max(0, min(_searchsorted_numba(grid_y, y), ny - 2))
+        k = max(0, min(_searchsorted_numba(grid_z, z), nz - 2))
+        tx = max(0.0, min((x - grid_x[i]) / (grid_x[i + 1] - grid_x[i]), 1.0))
+        ty = max(0.0, min((y - grid_y[j]) / (grid_y[j + 1] - grid_y[j]), 1.0))
+        tz = max(0.0, min((z - grid_z[k]) / (grid_z[k + 1] - grid_z[k]), 1.0))
+
+        ox0 = _tiled_axis_offset(i, shift, strides[0], strides[3])
+        ox1 = _tiled_axis_offset(i + 1, shift, strides[0], strides[3])
+        oy0 = _tiled_axis_offset(j, shift, strides[1], strides[4])
+        oy1 = _tiled_axis_offset(j + 1, shift, strides[1], strides[4])
+        oz0 = _tiled_axis_offset(k, shift, strides[2], strides[5])
+        oz1 = _tiled_axis_offset(k + 1, shift, strides[2], strides[5])
+
+        w000 = (1.0 - tx) * (1.0 - ty) * (1.0 - tz)
+        w100 = tx * (1.0 - ty) * (1.0 - tz)
+        w010 = (1.0 - tx) * ty * (1.0 - tz)
+        w110 = tx * ty * (1.0 - tz)
+        w001 = (1.0 - tx) * (1.0 - ty) * tz
+        w101 = tx * (1.0 - ty) * tz
+        w011 = (1.0 - tx) * ty * tz
+        w111 = tx * ty * tz
+
+        for c in range(nc):
+            out[c] = (w000 * tiles[ox0 + oy0 + oz0 + c] + w100 * tiles[ox1 + oy0 + oz0 + c] +
+                      w010 * tiles[ox0 + oy1 + oz0 + c] + w110 * tiles[ox1 + oy1 + oz0 + c] +
+                      w001 * tiles[ox0 + oy0 + oz1 + c] + w101 * tiles[ox1 + oy0 + oz1 + c] +
+                      w011 * tiles[ox0 + oy1 + oz1 + c] + w111 * tiles[ox1 + oy1 + oz1 + c])
+
+
+    @njit(parallel=True, cache=True, fastmath=True, nogil=True)
+    def _interp3d_tiled_batch(x_arr, y_arr, z_arr, grid_x, grid_y, grid_z, tiles, strides, shift, nc, fill_value):
+        """3D trilinear interpolation of a flat tiled array for batch of points."""
+        n = len(x_arr)
+        result = np.empty((n, nc), dtype=np.float64)
+        for p in prange(n):
+            _interp3d_tiled_point(x_arr[p], y_arr[p], z_arr[p], grid_x, grid_y, grid_z,
+                                  tiles, strides, shift, nc, fill_value, result[p])
+        return result
+
+
+    # Nested-grid kernels: levels (refined patches first, coarse base last)
+    # are concatenated into flat arrays; level l owns grid_d[grid_off[l, d]:
+    # grid_off[l + 1, d]] and values[val_off[l]:val_off[l + 1]]. A point is
+    # interpolated on the first level whose bounding box contains it.
+
+    @njit(cache=True)
+    def _nested_level(pt, bounds):
+        """Index of the first level whose box contains pt (last level = base)."""
+        n_levels = bounds.shape[0]
+        for l in range(n_levels - 1):
+            inside = True
+            for d in range(len(pt)):
+                if pt[d] < bounds[l, d, 0] or pt[d] > bounds[l, d, 1]:
+                    inside = False
+                    break
+            if inside:
+                return l
+        return n_levels - 1
+
+
+    @njit(parallel=True, cache=True, fastmath=True, nogil=True)
+    def _interp2d_nested_batch(pts, grid_x, grid_y, grid_off, values, val_off, bounds, nc, fill_value):
+        """2D bilinear interpolation on nested grids for batch of points."""
+        n = len(pts)
+        result = np.empty((n, nc), dtype=np.float64)
+        for p in prange(n):
+            l = _nested_level(pts[p], bounds)
+            gx = grid_x[grid_off[l, 0]:grid_off[l + 1, 0]]
+            gy = grid_y[grid_off[l, 1]:grid_off[l + 1, 1]]
+            vals = values[val_off[l]:val_off[l + 1]].reshape((len(gx), len(gy), nc))
+            _interp2d_stacked_point(pts[p, 0], pts[p, 1], gx, gy, vals, fill_value, result[p])
+        return result
+
+
+    @njit(parallel=True, cache=True, fastmath=True, nogil=True)
+    def _interp3d_nested_batch(pts, grid_x, grid_y, grid_z, grid_off, values, val_off, bounds, nc, fill_value):
+        """3D trilinear interpolation on nested grids for batch of points."""
+        n = len(pts)
+        result = np.empty((n, nc), dtype=np.float64)
+        for p in prange(n):
+            l = _nested_level(pts[p], bounds)
+            gx = grid_x[grid_off[l, 0]:grid_off[l + 1, 0]]
+            gy = grid_y[grid_off[l, 1]:grid_off[l + 1, 1]]
+            gz = grid_z[grid_off[l, 2]:grid_off[l + 1, 2]]
+            vals = values[val_off[l]:val_off[l + 1]].reshape((len(gx), len(gy), len(gz), nc))
+            _interp3d_stacked_point(pts[p, 0], pts[p, 1], pts[p, 2], gx, gy, gz, vals, fill_value, result[p])
+        return result
+
+
+    @njit(parallel=True, cache=True)
+    def _nested_level_batch(pts, bounds):
+        """Level index per point (see _nested_level)."""
+        n = len(pts)
+        result = np.empty(n, dtype=np.int64)
+        for p in prange(n):
+            result[p] = _nested_level(pts[p], bounds)
+        return result
+
+
+    # Symmetric kernels: only the fundamental domain of a vector field (3
+    # stacked channels) is stored. Each query point is rotated into the
+    # sector [sector_start, sector_start + 2π/n_sectors) and, for mirror_z,
+    # reflected to z >= 0; the interpolated vector gets the mirror signs and
+    # is rotated back.
+
+    @njit(cache=True, fastmath=True)
+    def _fold_sector(x, y, n_sectors, sector_start):
+        """Rotate (x, y) into the fundamental sector. Returns x', y', cos(a), sin(a)."""
+        if n_sectors <= 1:
+            return x, y, 1.0, 0.0
+
+        dphi = 2.0 * np.pi / n_sectors
+        a = np.floor((np.arctan2(y, x) - sector_start) / dphi) * dphi
+        c = np.cos(a)
+        s = np.sin(a)
+        return c * x + s * y, -s * x + c * y, c, s
+
+
+    @njit(cache=True, fastmath=True)
+    def _snap_to_range(x, lo, hi, eps):
+        """Move x onto [lo, hi] if it lies outside by less than eps (rotation round-off)."""
+        if lo - eps < x < lo:
+            return lo
+        if hi < x < hi + eps:
+            return hi
+        return x
+
+
+    @njit(parallel=True, cache=True, fastmath=True, nogil=True)
+    def _interp2d_symmetric_batch(x_arr, y_arr, grid_x, grid_y, values, fill_value,
+                                  n_sectors, sector_start):
+        """2D vector interpolation with N-fold sector symmetry."""
+        n = len(x_arr)
+        nx, ny = len(grid_x), len(grid_y)
+        eps_x = 1e-9 * (grid_x[nx - 1] - grid_x[0])
+        eps_y = 1e-9 * (grid_y[ny - 1] - grid_y[0])
+        result = np.empty((n, 3), dtype=np.float64)
+        for p in prange(n):
+            xf, yf, c, s = _fold_sector(x_arr[p], y_arr[p], n_sectors, sector_start)
+            xf = _snap_to_range(xf, grid_x[0], grid_x[nx - 1], eps_x)
+            yf = _snap_to_range(yf, grid_y[0], grid_y[ny - 1], eps_y)
+
+            _interp2d_stacked_point(xf, yf, grid_x, grid_y, values, fill_value, result[p])
+
+            fx = result[p, 0]
+            fy = result[p, 1]
+            result[p, 0] = c * fx - s * fy
+            result[p, 1] = s * fx + c * fy
+        return result
+
+
+    @njit(parallel=True, cache=True, fastmath=True, nogil=True)
+    def _interp3d_symmetric_batch(x_arr, y_arr, z_arr, grid_x, grid_y, grid_z, values, fill_value,
+                                  n_sectors, sector_start, mirror_z, mirror_signs):
+        """3D vector interpolation with N-fold sector and midplane mirror symmetry."""
+        n = len(x_arr)
+        nx, ny = len(grid_x), len(grid_y)
+        eps_x = 1e-9 * (grid_x[nx - 1] - grid_x[0])
+        eps_y = 1e-9 * (grid_y[ny - 1] - grid_y[0])
+        result = np.empty((n, 3), dtype=np.float64)
+        for p in prange(n):
+            xf, yf, c, s = _fold_sector(x_arr[p], y_arr[p], n_sectors, sector_start)
+            xf = _snap_to_range(xf, grid_x[0], grid_x[nx - 1], eps_x)
+            yf = _snap_to_range(yf, grid_y[0], grid_y[ny - 1], eps_y)
+
+            zf = z_arr[p]
+            flip = mirror_z and zf < 0.0
+            if flip:
+                zf = -zf
+
+            _interp3d_stacked_point(xf, yf, zf, grid_x, grid_y, grid_z, values, fill_value, result[p])
+
+            if flip:
+                for j in range(3):
+                    result[p, j] *= mirror_signs[j]
+
+            fx = result[p, 0]
+            fy = result[p, 1]
+            result[p, 0] = c * fx - s * fy
+            result[p, 1] = s * fx + c * fy
+        return result
+
+    # Cylindrical kernels: values are stored on the native (r, θ[, z]) grid as
+    # stacked (Fr, Fθ, Fz). Cartesian query points are converted in-kernel,
+    # θ is wrapped into [θ0, θ0 + period) and, for a periodic grid, the last
+    # θ cell interpolates back to the first column. The result is returned
+    # in Cartesian components.
+
+    @njit(cache=True, fastmath=True)
+    def _locate_theta(theta, grid_th, period, periodic):
+        """Cell (j0, j1) and weight t of angle theta. j0 = -1 if outside a non-periodic grid."""
+        nth = len(grid_th)
+        th = (theta - grid_th[0]) % period
+
+        if periodic:
+            u = th / (period / nth)
+            j0 = min(int(u), nth - 1)
+            j1 = j0 + 1
+            if j1 == nth:
+                j1 = 0
+            return j0, j1, max(0.0, min(u - j0, 1.0))
+
+        th += grid_th[0]
+        if th > grid_th[nth - 1]:
+            return -1, -1, 0.0
+        j0 = max(0, min(_searchsorted_numba(grid_th, th), nth - 2))
+        t = max(0.0, min((th - grid_th[j0]) / (grid_th[j0 + 1] - grid_th[j0]), 1.0))
+        return j0, j0 + 1, t
+
+
+    @njit(parallel=True, cache=True, fastmath=True, nogil=True)
+    def _interp2d_cylindrical_batch(x_arr, y_arr, grid_r, grid_th, values, fill_value,
+                                    period, periodic):
+        """Bilinear interpolation on an (r, θ) grid for Cartesian points (x, y)."""
+        n = len(x_arr)
+        nr = len(grid_r)
+        result = np.empty((n, 3), dtype=np.float64)
+        for p in prange(n):
+            x = x_arr[p]
+            y = y_arr[p]
+            r = np.sqrt(x * x + y * y)
+            j0, j1, tth = _locate_theta(np.arctan2(y, x), grid_th, period, periodic)
+
+            if r < grid_r[0] or r > grid_r[nr - 1] or j0 < 0:
+                for c in range(3):
+                    result[p, c] = fill_value
+                continue
+
+            i = max(0, min(_searchsorted_numba(grid_r, r), nr - 2))
+            tr = max(0.0, min((r - grid_r[i]) / (grid_r[i + 1] - grid_r[i]), 1.0))
+
+            w00 = (1.0 - tr) * (1.0 - tth)
+            w10 = tr * (1.0 - tth)
+            w01 = (1.0 - tr) * tth
+            w11 = tr * tth
+
+            f_r = (w00 * values[i, j0, 0] + w10 * values[i + 1, j0, 0] +
+                   w01 * values[i, j1, 0] + w11 * values[i + 1, j1, 0])
+            f_th = (w00 * values[i, j0, 1] + w10 * values[i + 1, j0, 1] +
+                    w01 * values[i, j1, 1] + w11 * values[i + 1, j1, 1])
+            f_z = (w00 * values[i, j0, 2] + w10 * values[i + 1, j0, 2] +
+                   w01 * values[i, j1, 2] + w11 * values[i + 1, j1, 2])
+
+            # Cylindrical -> Cartesian components (cos θ = x/r, sin θ = y/r)
+            if r > 0.0:
+                cos_th = x / r
+                sin_th = y / r
+            else:
+                cos_th = 1.0
+                sin_th = 0.0
+            result[p, 0] = f_r * cos_th - f_th * sin_th
+            result[p, 1] = f_r * sin_th + f_th * cos_th
+            result[p, 2] = f_z
+        return result
+
+
+    @njit(cache=True, fastmath=True)
+    def _trilinear_cell(values, i, j0, j1, k, c, t0, t1, t2):
+        """Trilinear combination of channel c in cell (i..i+1, j0/j1, k..k+1)."""
+        return ((1.0 - t2) * ((1.0 - t0) * (1.0 - t1) * values[i, j0, k, c] +
+                              t0 * (1.0 - t1) * values[i + 1, j0, k, c] +
+                              (1.0 - t0) * t1 * values[i, j1, k, c] +
+                              t0 * t1 * values[i + 1, j1, k, c]) +
+                t2 * ((1.0 - t0) * (1.0 - t1) * values[i, j0, k + 1, c] +
+                      t0 * (1.0 - t1) * values[i + 1, j0, k + 1, c] +
+                      (1.0 - t0) * t1 * values[i, j1, k + 1, c] +
+                      t0 * t1 * values[i + 1, j1, k + 1, c]))
+
+
+    @njit(parallel=True, cache=True, fastmath=True, nogil=True)
+    def _interp3d_cylindrical_batch(x_arr, y_arr, z_arr, grid_r, grid_th, grid_z, values, fill_value,
+                                    period, periodic):
+        """Trilinear interpolation on an (r, θ, z) grid for Cartesian points (x, y, z)."""
+        n = len(x_arr)
+        nr, nz = len(grid_r), len(grid_z)
+        result = np.empty((n, 3), dtype=np.float64)
+        for p in prange(n):
+            x = x_arr[p]
+            y = y_arr[p]
+            z = z_arr[p]
+            r = np.sqrt(x * x + y * y)
+            j0, j1, tth = _locate_theta(np.arctan2(y, x), grid_th, period, periodic)
+
+            if (r < grid_r[0] or r > grid_r[nr - 1] or j0 < 0 or
+                    z < grid_z[0] or z > grid_z[nz - 1]):
+                for c in range(3):
+                    result[p, c] = fill_value
+                continue
+
+            i = max(0, min(_searchsorted_numba(grid_r, r), nr - 2))
+            k = max(0, min(_searchsorted_numba(grid_z, z), nz - 2))
+            tr = max(0.0, min((r - grid_r[i]) / (grid_r[i + 1] - grid_r[i]), 1.0))
+            tz = max(0.0, min((z - grid_z[k]) / (grid_z[k + 1] - grid_z[k]), 1.0))
+
+            f_r = _trilinear_cell(values, i, j0, j1, k, 0, tr, tth, tz)
+            f_th = _trilinear_cell(values, i, j0, j1, k, 1, tr, tth, tz)
+            f_z = _trilinear_cell(values, i, j0, j1, k, 2, tr, tth, tz)
+
+            if r > 0.0:
+                cos_th = x / r
+                sin_th = y / r
+            else:
+                cos_th = 1.0
+                sin_th = 0.0
+            result[p, 0] = f_r * cos_th - f_th * sin_th
+            result[p, 1] = f_r * sin_th + f_th * cos_th
+            result[p, 2] = f_z
+        return result
+
+    @njit(parallel=True, cache=True, fastmath=True, nogil=True)
+    def _interp_midplane_expansion_batch(x_arr, y_arr, z_arr, grid_r, grid_th, values, fill_value,
+                                         period, periodic, order):
+        """
+        Off-midplane field from midplane derivative maps (r, θ grid).
+
+        values channels: B0, ∂B0/∂r, (1/r)∂B0/∂θ, L = ∇²B0, ∂L/∂r, (1/r)∂L/∂θ
+            Br = z ∂B0/∂r        - z³/6 ∂L/∂r
+            Bθ = z (1/r)∂B0/∂θ   - z³/6 (1/r)∂L/∂θ
+            Bz = B0              - z²/2 L
+        Terms above z^order are dropped.
+        """
+        n = len(x_arr)
+        nr = len(grid_r)
+        result = np.empty((n, 3), dtype=np.float64)
+        for p in prange(n):
+            x = x_arr[p]
+            y = y_arr[p]
+            z = z_arr[p]
+            r = np.sqrt(x * x + y * y)
+            j0, j1, tth = _locate_theta(np.arctan2(y, x), grid_th, period, periodic)
+
+            if r < grid_r[0] or r > grid_r[nr - 1] or j0 < 0:
+                for c in range(3):
+                    result[p, c] = fill_value
+                continue
+
+            i = max(0, min(_searchsorted_numba(grid_r, r), nr - 2))
+            tr = max(0.0, min((r - grid_r[i]) / (grid_r[i + 1] - grid_r[i]), 1.0))
+
+            w00 = (1.0 - tr) * (1.0 - tth)
+            w10 = tr * (1.0 - tth)
+            w01 = (1.0 - tr) * tth
+            w11 = tr * tth
+
+            b0 = (w00 * values[i, j0, 0] + w10 * values[i + 1, j0, 0] +
+                  w01 * values[i, j1, 0] + w11 * values[i + 1, j1, 0])
+            db_dr = (w00 * values[i, j0, 1] + w10 * values[i + 1, j0, 1] +
+                     w01 * values[i, j1, 1] + w11 * values[i + 1, j1, 1])
+            db_dth = (w00 * values[i, j0, 2] + w10 * values[i + 1, j0, 2] +
+                      w01 * values[i, j1, 2] + w11 * values[i + 1, j1, 2])
+
+            f_r = z * db_dr
+            f_th = z * db_dth
+            f_z = b0
+
+            if order >= 2:
+                lap = (w00 * values[i, j0, 3] + w10 * values[i + 1, j0, 3] +
+                       w01 * values[i, j1, 3] + w11 * values[i + 1, j1, 3])
+                f_z -= 0.5 * z * z * lap
+
+            if order >= 3:
+                dlap_dr = (w00 * values[i, j0, 4] + w10 * values[i + 1, j0, 4] +
+                           w01 * values[i, j1, 4] + w11 * values[i + 1, j1, 4])
+                dlap_dth = (w00 * values[i, j0, 5] + w10 * values[i + 1, j0, 5] +
+                            w01 * values[i, j1, 5] + w11 * values[i + 1, j1, 5])
+                z3 = z * z * z / 6.0
+                f_r -= z3 * dlap_dr
+                f_th -= z3 * dlap_dth
+
+            if r > 0.0:
+                cos_th = x / r
+                sin_th = y / r
+            else:
+                cos_th = 1.0
+                sin_th = 0.0
+            result[p, 0] = f_r * cos_th - f_th * sin_th
+            result[p, 1] = f_r * sin_th + f_th * cos_th
+            result[p, 2] = f_z
+        return result
+
 # ============================================================================
 # Backend 1: NumbaInterpolator (Custom Numba JIT)
 # ============================================================================
 
-class NumbaInterpolator:
+def _hermite_node_data(points, values):
+    """
+    Per-node Hermite data for the cubic kernels.
+
+    Derivatives are second-order finite differences on the (non-uniform) grid.
+    Channel m holds the mixed derivative along the axes in bitmask m, i.e.
+    [f, fx] (1D), [f, fx, fy, fxy] (2D), [f, fx, fy, fxy, fz, fxz, fyz, fxyz] (3D).
+
+    Returns
+    -------
+    data : np.ndarray(..., 2**ndim)
+    """
+    data = [np.asarray(values, dtype=np.float64)]
+    for axis, grid in enumerate(points):
+        edge_order = 2 if len(grid) > 2 else 1
+        data += [np.gradient(d, grid, axis=axis, edge_order=edge_order) for d in data]
+
+    return np.ascontiguousarray(np.stack(data, axis=-1))
+
+
+class NumbaInterpolator:
+    """
+    Fast interpolator using custom Numba JIT implementation with cell caching.
+
+    Features:
+    - 3-10x speedup over scipy for batch queries
+    - 2-3x additional speedup for sequential queries (particle tracking)
+    - Cell-hint optimization for spatial locality
+
+    Parameters
+    ----------
+    points : tuple of ndarray
+        Grid points in each dimension (1D arrays)
+    values : ndarray
+        Values on grid (N-dimensional array)
+    method : str, optional
+        Interpolation method: 'linear' (default) or 'cubic'. 'cubic' is C1
+        continuous (tricubic Hermite, Lekien-Marsden) and stores 2^ndim
+        precomputed derivative channels per node
+    bounds_error : bool, optional
+        If True, raise error for out-of-bounds points (default: True)
+    fill_value : float, optional
+        Value for out-of-bounds points if bounds_error=False (default: nan)
+    use_cache : bool, optional
+        Enable cell-hint caching for sequential queries (default: True)
+        Set to False for random scattered queries
+    """
+
+    def __init__(self, points, values, method='linear', bounds_error=True,
+                 fill_value=np.nan, use_cache=True):
+        if not HAS_NUMBA:
+            raise ImportError("Numba not installed. Install with: pip install numba")
+
+        if method not in ['linear', 'nearest', 'cubic']:
+            raise ValueError(f"Method '{method}' not supported. Use 'linear' or 'cubic'")
+
+        self.ndim = len(points)
+        self.method = method
+        self.bounds_error = bounds_error
+        self.fill_value = float(fill_value)
+        self.use_cache = use_cache
+
+        # Store grid and values as contiguous arrays for Numba
+        self._grid = tuple(np.ascontiguousarray(p, dtype=np.float64) for p in points)
+        self._values = np.ascontiguousarray(values, dtype=np.float64)
+
+        # Store only bounds for checking
+        self._bounds = tuple((float(g[0]), float(g[-1])) for g in self._grid)
+
+        # Cell hint cache (for single-point sequential queries)
+        if use_cache:
+            if self.ndim == 1:
+                self._cache = np.array([0], dtype=np.int32)
+            elif self.ndim == 2:
+                self._cache = np.array([0, 0], dtype=np.int32)
+            elif self.ndim == 3:
+                self._cache = np.array([0, 0, 0], dtype=np.int32)
+        else:
+            self._cache = None
+
+        # Validate shapes
+        expected_shape = tuple(len(g) for g in self._grid)
+        if self._values.shape != expected_shape:
+            raise ValueError(
+                f"Values shape {self._values.shape} does not match "
+                f"grid shape {expected_shape}"
+            )
+
+        # Select appropriate kernel
+        if self.ndim not in (1, 2, 3):
+            raise ValueError(f"Only 1D, 2D, 3D supported. Got {self.ndim}D")
+
+        # Kernel input: the raw values, or Hermite node data (..., 2^ndim) for cubic.
+        # _values stays the raw grid values (read e.g. by CompositeField pre-summing)
+        self._node_data = self._values
+
+        if method == 'cubic':
+            self._node_data = _hermite_node_data(self._grid, self._values)
+            self._interp_batch = (_cubic1d_batch, _cubic2d_batch, _cubic3d_batch)[self.ndim - 1]
+            self._interp_into = (_cubic1d_into, _cubic2d_into, _cubic3d_into)[self.ndim - 1]
+            self._grad_batch = (_cubic1d_grad_batch, _cubic2d_grad_batch, _cubic3d_grad_batch)[self.ndim - 1]
+        else:
+            self._interp_batch = (_interp1d_batch, _interp2d_batch, _interp3d_batch)[self.ndim - 1]
+            self._interp_into = (_interp1d_into, _interp2d_into, _interp3d_into)[self.ndim - 1]
+            self._grad_batch = (_interp1d_grad_batch, _interp2d_grad_batch, _interp3d_grad_batch)[self.ndim - 1]
+
+    def __call__(self, xi, method=None):
+        """
+        Evaluate interpolator at given points.
+
+        For single sequential queries (particle tracking), uses cell-hint
+        caching to avoid repeated binary searches (~2-3x speedup).
+
+        For batch queries, uses parallel evaluation.
+        """
+        xi = np.asarray(xi, dtype=np.float64)
+        single_point = False
+
+        if xi.ndim == 1:
+            xi = xi.reshape(1, -1)
+            single_point = True
+
+        if xi.shape[1] != self.ndim:
+            raise ValueError(f"Points have dimension {xi.shape[1]}, expected {self.ndim}")
+
+        # Check bounds if requested
+        if self.bounds_error:
+            self._check_bounds(xi)
+
+        # Single point with caching (for particle tracking)
+        if single_point and self.method == 'cubic':
+            if self.ndim == 1:
+                return _cubic1d_single(xi[0, 0], self._grid[0], self._node_data, self.fill_value)
+            if self.ndim == 2:
+                return _cubic2d_single(xi[0, 0], xi[0, 1], *self._grid, self._node_data, self.fill_value)
+            return _cubic3d_single(xi[0, 0], xi[0, 1], xi[0, 2], *self._grid, self._node_data, self.fill_value)
+
+        if single_point and self.use_cache and self.ndim == 3:
+            result, i, j, k = _interp3d_single_cached(
+                xi[0, 0], xi[0, 1], xi[0, 2],
+                self._grid[0], self._grid[1], self._grid[2],
+                self._node_data, self.fill_value,
+                self._cache[0], self._cache[1], self._cache[2]
+            )
+            # Update cache
+            self._cache[0] = i
+            self._cache[1] = j
+            self._cache[2] = k
+            return float(result)
+
+        # Batch query (parallel, no caching benefit), reading the columns of xi in place
+        result = np.empty(len(xi), dtype=np.float64)
+        self._interp_into(xi, *range(self.ndim), *self._grid, self._node_data, self.fill_value,
+                          1.0, result.reshape(-1, 1), 0)
+
+        if single_point:
+            return float(result[0])
+
+        return result
+
+    def evaluate_into(self, pts, axes, out, col, scale=1.0):
+        """
+        Interpolate without copies: out[:, col] = scale * f(pts[:, axes]).
+
+        Parameters
+        ----------
+        pts : np.ndarray(M, ncols), float64
+            Points in any memory layout (C, Fortran or strided view)
+        axes : sequence of int
+            Columns of pts holding the ndim grid coordinates
+        out : np.ndarray(M, C), float64
+            Output buffer
+        col : int
+            Column of out to write
+        scale : float, optional
+            Factor applied in the kernel (default: 1.0)
+        """
+        if len(axes) != self.ndim:
+            raise ValueError(f"Need {self.ndim} axes, got {len(axes)}")
+
+        if self.bounds_error:
+            self._check_bounds(pts[:, list(axes)])
+
+        self._interp_into(pts, *axes, *self._grid, self._node_data, self.fill_value, float(scale), out, col)
+
+    def value_and_gradient(self, xi):
+        """
+        Values and analytic gradient from one cell lookup per point.
+
+        Parameters
+        ----------
+        xi : np.ndarray(M, ndim)
+            Points to evaluate
+
+        Returns
+        -------
+        values : np.ndarray(M,)
+        grad : np.ndarray(M, ndim)
+            Derivative along each grid axis (zero outside the grid)
+        """
+        xi = np.atleast_2d(np.asarray(xi, dtype=np.float64))
+
+        if xi.shape[1] != self.ndim:
+            raise ValueError(f"Points have dimension {xi.shape[1]}, expected {self.ndim}")
+
+        if self.bounds_error:
+            self._check_bounds(xi)
+
+        coords = [np.ascontiguousarray(xi[:, i]) for i in range(self.ndim)]
+
+        return self._grad_batch(*coords, *self._grid, self._node_data, self.fill_value)
+
+    def _check_bounds(self, xi):
+        """Check if points are within bounds."""
+        for i, (xmin, xmax) in enumerate(self._bounds):
+            if np.any(xi[:, i] < xmin) or np.any(xi[:, i] > xmax):
+                raise ValueError("One or more points are outside the interpolation domain")
+
+
+class StackedInterpolator:
+    """
+    Linear interpolator for C channels stored on one grid.
+
+    Values have shape (n1, ..., nd, C); one call returns all channels at
+    once (M, C), with a single cell search per point. Used to evaluate
+    several field components or field maps in one interpolation pass.
+
+    Parameters
+    ----------
+    points : tuple of ndarray
+        Grid points in each dimension (1D arrays)
+    values : ndarray
+        Values on grid with trailing channel axis, shape (n1, ..., nd, C)
+    bounds_error : bool, optional
+        If True, raise error for out-of-bounds points (default: False)
+    fill_value : float, optional
+        Value for out-of-bounds points (default: 0.0)
+    layout : str, optional
+        'plain' (default): C-ordered (nx, ny, nz, C) array.
+        'tiled' (3D only): tile_size^3 bricks with interleaved channels, so
+        the corners of a stencil share cache lines on large grids (see
+        benchmark_layouts)
+    tile_size : int, optional
+        Brick edge for layout='tiled', a power of 2 (default: 8)
+    """
+
+    def __init__(self, points, values, bounds_error=False, fill_value=0.0, layout='plain', tile_size=8):
+        if not HAS_NUMBA:
+            raise ImportError("Numba not installed. Install with: pip install numba")
+
+        self.ndim = len(points)
+        self.bounds_error = bounds_error
+        self.fill_value = float(fill_value)
+        self.layout = layout
+
+        self._grid = tuple(np.ascontiguousarray(p, dtype=np.float64) for p in points)
+        self._values = np.ascontiguousarray(values, dtype=np.float64)
+        self._bounds = tuple((float(g[0]), float(g[-1])) for g in self._grid)
+
+        expected_shape = tuple(len(g) for g in self._grid)
+        if self._values.ndim != self.ndim + 1 or self._values.shape[:-1] != expected_shape:
+            raise ValueError(
+                f"Values shape {self._values.shape} does not match "
+                f"grid shape {expected_shape} + (n_channels,)"
+            )
+
+        if self.ndim == 1:
+            self._interp_batch = _interp1d_stacked_batch
+        elif self.ndim == 2:
+            self._interp_batch = _interp2d_stacked_batch
+        elif self.ndim == 3:
+            self._interp_batch = _interp3d_stacked_batch
+        else:
+            raise ValueError(f"Only 1D, 2D, 3D supported. Got {self.ndim}D")
+
+        if layout == 'tiled':
+            if self.ndim != 3:
+                raise ValueError(f"Tiled layout needs a 3D grid, got {self.ndim}D")
+            if tile_size < 2 or tile_size & (tile_size - 1):
+                raise ValueError(f"tile_size must be a power of 2, got {tile_size}")
+            self._shift = int(tile_size).bit_length() - 1
+            self._n_channels = self._values.shape[-1]
+            self._values, self._strides = _tile_values(self._values, tile_size)
+        elif layout != 'plain':
+            raise ValueError(f"Unknown layout '{layout}'. Use 'plain' or 'tiled'")
+
+    @property
+    def n_channels(self) -> int:
+        if self.layout == 'tiled':
+            return self._n_channels
+        return self._values.shape[-1]
+
+    def __call__(self, xi):
+        """
+        Evaluate all channels at given points.
+
+        Returns
+        -------
+        result : np.ndarray(M, C)
+        """
+        xi = np.atleast_2d(np.asarray(xi, dtype=np.float64))
+
+        if xi.shape[1] != self.ndim:
+            raise ValueError(f"Points have dimension {xi.shape[1]}, expected {self.ndim}")
+
+        if self.bounds_error:
+            for i, (xmin, xmax) in enumerate(self._bounds):
+                if np.any(xi[:, i] < xmin) or np.any(xi[:, i] > xmax):
+                    raise ValueError("One or more points are outside the interpolation domain")
+
+        coords = [np.ascontiguousarray(xi[:, i]) for i in range(self.ndim)]
+        if self.layout == 'tiled':
+            return _interp3d_tiled_batch(*coords, *self._grid, self._values, self._strides, self._shift,
+                                         self._n_channels, self.fill_value)
+
+        return self._interp_batch(*coords, *self._grid, self._values, self.fill_value)
+
+
+def _tile_values(values, tile_size):
     """
-    Fast interpolator using custom Numba JIT implementation with cell caching.
+    (nx, ny, nz, C) -> flat (ntx, nty, ntz, T, T, T, C) bricks, zero-padded to whole tiles,
+    and the element strides (tile x, y, z, local x, y, z) used by _interp3d_tiled_point
+    """
+    shape = values.shape[:3]
+    n_tiles = [-(-n // tile_size) for n in shape]
 
-    Features:
-    - 3-10x speedup over scipy for batch queries
-    - 2-3x additional speedup for sequential queries (particle tracking)
-    - Cell-hint optimization for spatial locality
+    padded = np.zeros([n * tile_size for n in n_tiles] + [values.shape[3]])
+    padded[:shape[0], :shape[1], :shape[2]] = values
+
+    tiles = padded.reshape(n_tiles[0], tile_size, n_tiles[1], tile_size, n_tiles[2], tile_size, -1)
+    tiles = np.ascontiguousarray(tiles.transpose(0, 2, 4, 1, 3, 5, 6))
+    strides = np.array([tiles.strides[d] // tiles.itemsize for d in range(6)], dtype=np.int64)
+
+    return tiles.ravel(), strides
+
+
+class SymmetricInterpolator:
+    """
+    Vector field interpolator that stores only the fundamental domain.
+
+    Supports N-fold rotational symmetry about the z axis and, for 3D maps,
+    midplane (z -> -z) mirror symmetry. Query points are folded into the
+    stored domain inside the Numba kernel and the interpolated vector is
+    mapped back (sign flips for the mirror, rotation for the sector).
 
     Parameters
     ----------
     points : tuple of ndarray
-        Grid points in each dimension (1D arrays)
+        (x, y) or (x, y, z) grid of the fundamental domain. For sector
+        symmetry it must cover the wedge [sector_start, sector_start + 360°/N),
+        for mirror symmetry z >= 0 (usually starting at z = 0)
     values : ndarray
-        Values on grid (N-dimensional array)
-    method : str, optional
-        Interpolation method: only 'linear' supported (default)
-    bounds_error : bool, optional
-        If True, raise error for out-of-bounds points (default: True)
+        Vector values, shape (nx, ny, 3) or (nx, ny, nz, 3)
+    n_sectors : int, optional
+        N-fold rotational symmetry (default: 1, none)
+    sector_start : float, optional
+        Start angle of the stored sector [rad] (default: 0)
+    mirror_z : bool, optional
+        Midplane symmetry, 3D only (default: False)
+    mirror_signs : tuple of float, optional
+        Component signs for z < 0 (default: (-1, -1, 1), magnetic midplane
+        symmetry. Use (1, 1, -1) for an electric field)
     fill_value : float, optional
-        Value for out-of-bounds points if bounds_error=False (default: nan)
-    use_cache : bool, optional
-        Enable cell-hint caching for sequential queries (default: True)
-        Set to False for random scattered queries
+        Value outside the stored domain (default: 0.0)
     """
 
-    def __init__(self, points, values, method='linear', bounds_error=True,
-                 fill_value=np.nan, use_cache=True):
+    def __init__(self, points, values, n_sectors=1, sector_start=0.0, mirror_z=False,
+                 mirror_signs=(-1.0, -1.0, 1.0), fill_value=0.0):
         if not HAS_NUMBA:
             raise ImportError("Numba not installed. Install with: pip install numba")
 
-        if method not in ['linear', 'nearest']:
-            raise ValueError(f"Method '{method}' not supported. Use 'linear'")
-
         self.ndim = len(points)
-        self.method = method
-        self.bounds_error = bounds_error
+        if self.ndim not in (2, 3):
+            raise ValueError(f"Symmetric interpolation needs a 2D or 3D grid. Got {self.ndim}D")
+        if n_sectors < 1:
+            raise ValueError(f"n_sectors must be >= 1, got {n_sectors}")
+        if mirror_z and self.ndim != 3:
+            raise ValueError("mirror_z requires a 3D grid")
+
+        self.n_sectors = int(n_sectors)
+        self.sector_start = float(sector_start)
+        self.mirror_z = bool(mirror_z)
+        self.mirror_signs = np.asarray(mirror_signs, dtype=np.float64)
         self.fill_value = float(fill_value)
-        self.use_cache = use_cache
 
-        # Store grid and values as contiguous arrays for Numba
         self._grid = tuple(np.ascontiguousarray(p, dtype=np.float64) for p in points)
         self._values = np.ascontiguousarray(values, dtype=np.float64)
 
-        # Store only bounds for checking
-        self._bounds = tuple((float(g[0]), float(g[-1])) for g in self._grid)
-
-        # Cell hint cache (for single-point sequential queries)
-        if use_cache:
-            if self.ndim == 1:
-                self._cache = np.array([0], dtype=np.int32)
-            elif self.ndim == 2:
-                self._cache = np.array([0, 0], dtype=np.int32)
-            elif self.ndim == 3:
-                self._cache = np.array([0, 0, 0], dtype=np.int32)
-        else:
-            self._cache = None
-
-        # Validate shapes
-        expected_shape = tuple(len(g) for g in self._grid)
+        expected_shape = tuple(len(g) for g in self._grid) + (3,)
         if self._values.shape != expected_shape:
             raise ValueError(
                 f"Values shape {self._values.shape} does not match "
-                f"grid shape {expected_shape}"
+                f"grid shape + (3,) = {expected_shape}"
             )
 
-        # Select appropriate kernel
-        if self.ndim == 1:
-            self._interp_batch = _interp1d_batch
-        elif self.ndim == 2:
-            self._interp_batch = _interp2d_batch
-        elif self.ndim == 3:
-            self._interp_batch = _interp3d_batch
-        else:
-            raise ValueError(f"Only 1D, 2D, 3D supported. Got {self.ndim}D")
+    def __call__(self, xi):
+        """
+        Evaluate vector field at given points.
 
-    def __call__(self, xi, method=None):
+        Parameters
+        ----------
+        xi : np.ndarray(M, ndim)
+
+        Returns
+        -------
+        result : np.ndarray(M, 3)
         """
-        Evaluate interpolator at given points.
+        xi = np.atleast_2d(np.asarray(xi, dtype=np.float64))
 
-        For single sequential queries (particle tracking), uses cell-hint
-        caching to avoid repeated binary searches (~2-3x speedup).
+        if xi.shape[1] != self.ndim:
+            raise ValueError(f"Points have dimension {xi.shape[1]}, expected {self.ndim}")
 
-        For batch queries, uses parallel evaluation.
+        coords = [np.ascontiguousarray(xi[:, i]) for i in range(self.ndim)]
+
+        if self.ndim == 2:
+            return _interp2d_symmetric_batch(*coords, *self._grid, self._values, self.fill_value,
+                                             self.n_sectors, self.sector_start)
+
+        return _interp3d_symmetric_batch(*coords, *self._grid, self._values, self.fill_value,
+                                         self.n_sectors, self.sector_start,
+                                         self.mirror_z, self.mirror_signs)
+
+
+def _periodic_theta_grid(theta, values, theta_period):
+    """
+    Detect a periodic θ grid (axis 1 of values).
+
+    Periodic θ needs a uniform grid spanning one full period. A duplicated
+    end column (θ_last = θ0 + period) is dropped.
+
+    Returns
+    -------
+    theta, values, periodic
+    """
+    theta = np.ascontiguousarray(theta, dtype=np.float64)
+    dth = np.diff(theta)
+
+    if len(theta) > 1 and np.allclose(dth, dth[0], rtol=1e-6, atol=0.0):
+        tol = 1e-6 * theta_period
+        if abs(len(theta) * dth[0] - theta_period) < tol:
+            return theta, values, True
+        if abs((len(theta) - 1) * dth[0] - theta_period) < tol:
+            return np.ascontiguousarray(theta[:-1]), values[:, :-1], True
+
+    return theta, values, False
+
+
+class CylindricalInterpolator:
+    """
+    Vector field interpolator on a native cylindrical (r, θ[, z]) grid.
+
+    Avoids resampling polar field maps (OPAL midplane, AIMA AGORA) onto a
+    Cartesian grid. Queries take Cartesian points; the conversion to
+    (r, θ, z) and of the interpolated (Fr, Fθ, Fz) back to (Fx, Fy, Fz)
+    happens inside the Numba kernel (same transforms as
+    field.cartesian_to_cylindrical / transform_cylindrical_field_to_cartesian).
+
+    Parameters
+    ----------
+    points : tuple of ndarray
+        (r, theta) or (r, theta, z) grid. theta in radians, ascending
+    values : ndarray
+        Cylindrical components stacked as (nr, nth, 3) or (nr, nth, nz, 3)
+    theta_period : float, optional
+        Angular period [rad] (default: 2π; 2π/N for a map of one of N sectors)
+    fill_value : float, optional
+        Value outside the grid (default: 0.0)
+
+    Notes
+    -----
+    If the uniform θ grid covers a full period (nth * dθ = period), θ is
+    periodic and the last cell wraps to the first column. A duplicated end
+    column (θ_last = θ0 + period) is dropped. Otherwise points outside
+    [θ0, θ_last] (modulo the period) get fill_value.
+    """
+
+    def __init__(self, points, values, theta_period=2.0 * np.pi, fill_value=0.0):
+        if not HAS_NUMBA:
+            raise ImportError("Numba not installed. Install with: pip install numba")
+
+        self.ndim = len(points)
+        if self.ndim not in (2, 3):
+            raise ValueError(f"Cylindrical interpolation needs an (r, theta) or (r, theta, z) grid. Got {self.ndim}D")
+
+        self.theta_period = float(theta_period)
+        self.fill_value = float(fill_value)
+
+        grid = [np.ascontiguousarray(p, dtype=np.float64) for p in points]
+        values = np.asarray(values, dtype=np.float64)
+
+        expected_shape = tuple(len(g) for g in grid) + (3,)
+        if values.shape != expected_shape:
+            raise ValueError(
+                f"Values shape {values.shape} does not match "
+                f"grid shape + (3,) = {expected_shape}"
+            )
+
+        grid[1], values, self.periodic = _periodic_theta_grid(grid[1], values, self.theta_period)
+
+        self._grid = tuple(grid)
+        self._values = np.ascontiguousarray(values)
+
+    def __call__(self, xi):
         """
-        xi = np.asarray(xi, dtype=np.float64)
-        single_point = False
+        Evaluate vector field at Cartesian points.
 
-        if xi.ndim == 1:
-            xi = xi.reshape(1, -1)
-            single_point = True
+        Parameters
+        ----------
+        xi : np.ndarray(M, 2) or (M, 3)
+            (x, y) for an (r, θ) grid, (x, y, z) for an (r, θ, z) grid
+
+        Returns
+        -------
+        result : np.ndarray(M, 3)
+            Cartesian components (Fx, Fy, Fz)
+        """
+        xi = np.atleast_2d(np.asarray(xi, dtype=np.float64))
 
         if xi.shape[1] != self.ndim:
             raise ValueError(f"Points have dimension {xi.shape[1]}, expected {self.ndim}")
 
-        # Check bounds if requested
-        if self.bounds_error:
-            self._check_bounds(xi)
+        coords = [np.ascontiguousarray(xi[:, i]) for i in range(self.ndim)]
 
-        # Single point with caching (for particle tracking)
-        if single_point and self.use_cache and self.ndim == 3:
-            result, i, j, k = _interp3d_single_cached(
-                xi[0, 0], xi[0, 1], xi[0, 2],
-                self._grid[0], self._grid[1], self._grid[2],
-                self._values, self.fill_value,
-                self._cache[0], self._cache[1], self._cache[2]
-            )
-            # Update cache
-            self._cache[0] = i
-            self._cache[1] = j
-            self._cache[2] = k
-            return float(result)
+        if self.ndim == 2:
+            return _interp2d_cylindrical_batch(*coords, *self._grid, self._values, self.fill_value,
+                                               self.theta_period, self.periodic)
 
-        # Batch query (parallel, no caching benefit)
-        if self.ndim == 1:
-            result = self._interp_batch(xi[:, 0], self._grid[0],
-                                        self._values, self.fill_value)
-        elif self.ndim == 2:
-            result = self._interp_batch(xi[:, 0], xi[:, 1],
-                                        self._grid[0], self._grid[1],
-                                        self._values, self.fill_value)
-        elif self.ndim == 3:
-            result = self._interp_batch(xi[:, 0], xi[:, 1], xi[:, 2],
-                                        self._grid[0], self._grid[1], self._grid[2],
-                                        self._values, self.fill_value)
+        return _interp3d_cylindrical_batch(*coords, *self._grid, self._values, self.fill_value,
+                                           self.theta_period, self.periodic)
 
-        if single_point:
-            return float(result[0])
+
+class MidplaneExpansionInterpolator:
+    """
+    3D field from midplane derivative maps on an (r, θ) grid.
+
+    Evaluates the Maxwell-consistent midplane expansion in z (see
+    _interp_midplane_expansion_batch) for Cartesian points, returning
+    Cartesian components. The derivative maps are computed by the caller
+    (field.MidplaneExpansionField).
+
+    Parameters
+    ----------
+    points : tuple of ndarray
+        (r, theta) grid, theta in radians, ascending
+    values : ndarray(nr, nth, 6)
+        B0, ∂B0/∂r, (1/r)∂B0/∂θ, ∇²B0, ∂(∇²B0)/∂r, (1/r)∂(∇²B0)/∂θ
+    order : int, optional
+        Highest power of z kept: 1, 2 or 3 (default: 3)
+    theta_period : float, optional
+        Angular period [rad] (default: 2π)
+    fill_value : float, optional
+        Value outside the (r, θ) grid (default: 0.0)
+    """
+
+    def __init__(self, points, values, order=3, theta_period=2.0 * np.pi, fill_value=0.0):
+        if not HAS_NUMBA:
+            raise ImportError("Numba not installed. Install with: pip install numba")
+        if order not in (1, 2, 3):
+            raise ValueError(f"order must be 1, 2 or 3, got {order}")
+        if len(points) != 2:
+            raise ValueError(f"Midplane expansion needs an (r, theta) grid. Got {len(points)}D")
+
+        self.ndim = 3
+        self.order = int(order)
+        self.theta_period = float(theta_period)
+        self.fill_value = float(fill_value)
+
+        grid_r = np.ascontiguousarray(points[0], dtype=np.float64)
+        values = np.asarray(values, dtype=np.float64)
+
+        expected_shape = (len(grid_r), len(points[1]), 6)
+        if values.shape != expected_shape:
+            raise ValueError(f"Values shape {values.shape} does not match {expected_shape}")
+
+        grid_th, values, self.periodic = _periodic_theta_grid(points[1], values, self.theta_period)
+
+        self._grid = (grid_r, grid_th)
+        self._values = np.ascontiguousarray(values)
+
+    def __call__(self, xi):
+        """
+        Evaluate field at Cartesian points (M, 3).
+
+        Returns
+        -------
+        result : np.ndarray(M, 3)
+            Cartesian components (Bx, By, Bz)
+        """
+        xi = np.atleast_2d(np.asarray(xi, dtype=np.float64))
+
+        if xi.shape[1] != 3:
+            raise ValueError(f"Points have dimension {xi.shape[1]}, expected 3")
+
+        coords = [np.ascontiguousarray(xi[:, i]) for i in range(3)]
+
+        return _interp_midplane_expansion_batch(*coords, *self._grid, self._values, self.fill_value,
+                                                self.theta_period, self.periodic, self.order)
+
+
+class LazyBrickInterpolator:
+    """
+    Trilinear vector interpolation read on demand from (HDF5) datasets.
+
+    The three component datasets stay on disk. Queries read only the bricks
+    of brick_size^3 cells they touch (plus a one-node halo, so every cell
+    lies inside one brick) into an LRU cache bounded by max_bytes, and
+    interpolate in the stored axis order, e.g. native [z, y, x] for H5Part,
+    without transposing.
+
+    Parameters
+    ----------
+    datasets : sequence of 3 array-like
+        x, y, z components, same 3D shape; anything supporting slicing
+        (h5py.Dataset, np.memmap, ndarray)
+    origin : sequence of float
+        Coordinates (x0, y0, z0) of node [0, 0, 0]
+    spacing : sequence of float
+        Node spacing (dx, dy, dz)
+    axis_order : sequence of int, optional
+        Spatial axis (0=x, 1=y, 2=z) of each dataset axis (default: (2, 1, 0),
+        i.e. data[iz, iy, ix])
+    brick_size : int, optional
+        Cells per brick edge (default: 32)
+    max_bytes : int, optional
+        Brick cache budget (default: 512 MB)
+    scale : sequence of float, optional
+        Factor per component applied when a brick is read (default: 1)
+    fill_value : float, optional
+        Value outside the grid (default: 0.0)
+    """
+
+    def __init__(self, datasets, origin, spacing, axis_order=(2, 1, 0), brick_size=32,
+                 max_bytes=512 * 2 ** 20, scale=(1.0, 1.0, 1.0), fill_value=0.0):
+        if len(datasets) != 3:
+            raise ValueError(f"Need 3 component datasets, got {len(datasets)}")
+
+        self.ndim = 3
+        self._datasets = list(datasets)
+        self.shape = np.array(self._datasets[0].shape, dtype=np.int64)
+
+        if len(self.shape) != 3 or any(tuple(ds.shape) != tuple(self.shape) for ds in self._datasets):
+            raise ValueError("Component datasets must be 3D and of equal shape")
+        if np.any(self.shape < 2):
+            raise ValueError(f"Need at least 2 nodes per axis, got shape {tuple(self.shape)}")
+        if sorted(axis_order) != [0, 1, 2]:
+            raise ValueError(f"axis_order must be a permutation of (0, 1, 2), got {axis_order}")
+
+        self.axis_order = tuple(int(a) for a in axis_order)
+        self.origin = np.asarray(origin, dtype=np.float64)
+        self.spacing = np.asarray(spacing, dtype=np.float64)
+        self.brick_size = int(brick_size)
+        self.max_bytes = max_bytes
+        self.scale = np.asarray(scale, dtype=np.float64)
+        self.fill_value = float(fill_value)
+
+        self._n_bricks = (self.shape - 2) // self.brick_size + 1
+        self._bricks = OrderedDict()
+        self._nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __call__(self, xi):
+        """
+        Evaluate field at points (M, 3) in (x, y, z).
+
+        Returns
+        -------
+        result : np.ndarray(M, 3)
+        """
+        xi = np.atleast_2d(np.asarray(xi, dtype=np.float64))
+
+        if xi.shape[1] != 3:
+            raise ValueError(f"Points have dimension {xi.shape[1]}, expected 3")
+
+        result = np.full((len(xi), 3), self.fill_value)
+
+        # Fractional node index along each dataset axis
+        frac = np.empty(xi.shape)
+        is_inside = np.ones(len(xi), dtype=bool)
+        for d, a in enumerate(self.axis_order):
+            frac[:, d] = (xi[:, a] - self.origin[a]) / self.spacing[a]
+            # Bounds test on the node coordinates, as in the Numba kernels: a point
+            # on the last node may round to a fraction just above shape - 1
+            upper = self.origin[a] + (self.shape[d] - 1) * self.spacing[a]
+            is_inside &= (xi[:, a] >= self.origin[a]) & (xi[:, a] <= upper)
+
+        inside = np.flatnonzero(is_inside)
+        if len(inside) == 0:
+            return result
+
+        frac = np.clip(frac[inside], 0.0, self.shape - 1)
+        cell = np.minimum(frac.astype(np.int64), self.shape - 2)
+        t = frac - cell
+        brick = cell // self.brick_size
+
+        # Group points by brick
+        key = np.ravel_multi_index(tuple(brick.T), tuple(self._n_bricks))
+        order = np.argsort(key, kind='stable')
+        starts = np.flatnonzero(np.diff(key[order], prepend=-1))
+        ends = np.append(starts[1:], len(order))
+
+        for start, end in zip(starts, ends):
+            sel = order[start:end]
+            b = brick[sel[0]]
+            data = self._get_brick(tuple(b))
+            local = cell[sel] - b * self.brick_size
+            result[inside[sel]] = _trilinear_gather(data, local, t[sel])
 
         return result
 
-    def _check_bounds(self, xi):
-        """Check if points are within bounds."""
-        for i, (xmin, xmax) in enumerate(self._bounds):
-            if np.any(xi[:, i] < xmin) or np.any(xi[:, i] > xmax):
-                raise ValueError("One or more points are outside the interpolation domain")
+    def _get_brick(self, b):
+        """Brick b (index per dataset axis) as (n0, n1, n2, 3), from cache or disk"""
+        data = self._bricks.get(b)
+        if data is not None:
+            self.hits += 1
+            self._bricks.move_to_end(b)
+            return data
+
+        self.misses += 1
+        region = tuple(slice(i * self.brick_size, min((i + 1) * self.brick_size + 1, n))
+                       for i, n in zip(b, self.shape))
+        data = np.stack([np.asarray(ds[region], dtype=np.float64) for ds in self._datasets], axis=-1)
+        data *= self.scale
+
+        self._bricks[b] = data
+        self._nbytes += data.nbytes
+        while self._nbytes > self.max_bytes and len(self._bricks) > 1:
+            _, evicted = self._bricks.popitem(last=False)
+            self._nbytes -= evicted.nbytes
+
+        return data
+
+    def clear(self):
+        """Drop all cached bricks"""
+        self._bricks.clear()
+        self._nbytes = 0
+
+    def cache_info(self):
+        """Brick hit/miss statistics and memory use"""
+        return {'hits': self.hits, 'misses': self.misses, 'bricks': len(self._bricks),
+                'nbytes': self._nbytes, 'max_bytes': self.max_bytes}
+
+
+def _trilinear_gather(data, local, t):
+    """Trilinear interpolation of (n0, n1, n2, C) data at cells local (M, 3) with fractions t (M, 3)"""
+    i, j, k = local.T
+    t0, t1, t2 = [tt[:, np.newaxis] for tt in t.T]
+
+    c00 = data[i, j, k] * (1.0 - t2) + data[i, j, k + 1] * t2
+    c01 = data[i, j + 1, k] * (1.0 - t2) + data[i, j + 1, k + 1] * t2
+    c10 = data[i + 1, j, k] * (1.0 - t2) + data[i + 1, j, k + 1] * t2
+    c11 = data[i + 1, j + 1, k] * (1.0 - t2) + data[i + 1, j + 1, k + 1] * t2
+
+    c0 = c00 * (1.0 - t1) + c01 * t1
+    c1 = c10 * (1.0 - t1) + c11 * t1
+
+    return c0 * (1.0 - t0) + c1 * t0
+
+
+class NestedGridInterpolator:
+    """
+    Linear vector interpolation on a coarse base grid with refined patches.
+
+    Every level is a regular (x, y) or (x, y, z) grid with stacked channels.
+    Inside the kernel each point is assigned to the finest patch whose
+    bounding box contains it (patches are ordered by cell size, finest
+    first) and falls back to the base grid elsewhere, so only the regions
+    that need it are stored at fine spacing. All levels live in flat
+    concatenated arrays; one batch call costs one box test per patch plus
+    one cell search on the selected level.
+
+    Parameters
+    ----------
+    base : tuple (points, values)
+        Global grid: points is a tuple of 1D arrays, values has shape
+        (n1, ..., nd, C)
+    patches : sequence of (points, values)
+        Refined grids, same dimensionality and channels as the base
+    fill_value : float, optional
+        Value outside the selected level (default: 0.0)
+    """
+
+    def __init__(self, base, patches=(), fill_value=0.0):
+        if not HAS_NUMBA:
+            raise ImportError("Numba not installed. Install with: pip install numba")
+
+        levels = []
+        for points, values in [base] + list(patches):
+            points = tuple(np.ascontiguousarray(g, dtype=np.float64) for g in points)
+            values = np.ascontiguousarray(values, dtype=np.float64)
+            if values.shape[:-1] != tuple(len(g) for g in points):
+                raise ValueError(f"Values shape {values.shape} does not match grid "
+                                 f"{tuple(len(g) for g in points)} + (C,)")
+            if any(len(g) < 2 for g in points):
+                raise ValueError("Every level needs at least 2 nodes per axis")
+            levels.append((points, values))
+
+        self.ndim = len(levels[0][0])
+        self._n_channels = levels[0][1].shape[-1]
+        if self.ndim not in (2, 3):
+            raise ValueError(f"Only 2D and 3D nested grids supported. Got {self.ndim}D")
+        if any(len(pts) != self.ndim or vals.shape[-1] != self._n_channels for pts, vals in levels):
+            raise ValueError("All levels must have the same dimensionality and number of channels")
+
+        # Search order: patches finest first (smallest mean cell volume), base last
+        def cell_volume(level):
+            return np.prod([(g[-1] - g[0]) / (len(g) - 1) for g in level[0]])
+
+        levels = sorted(levels[1:], key=cell_volume) + [levels[0]]
+
+        self.fill_value = float(fill_value)
+        self._levels = levels
+        self._grid = tuple(np.concatenate([pts[d] for pts, _ in levels]) for d in range(self.ndim))
+        self._grid_off = np.zeros((len(levels) + 1, self.ndim), dtype=np.int64)
+        self._grid_off[1:] = np.cumsum([[len(g) for g in pts] for pts, _ in levels], axis=0)
+        self._values = np.concatenate([vals.ravel() for _, vals in levels])
+        self._val_off = np.concatenate([[0], np.cumsum([vals.size for _, vals in levels])]).astype(np.int64)
+        self._bounds = np.array([[(g[0], g[-1]) for g in pts] for pts, _ in levels])
+
+    @property
+    def n_levels(self) -> int:
+        return len(self._levels)
+
+    @property
+    def n_channels(self) -> int:
+        return self._n_channels
+
+    @property
+    def levels(self):
+        """(points, values) of every level in search order"""
+        return [(pts, vals) for pts, vals in self._levels]
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes of all level values and grids"""
+        return self._values.nbytes + sum(g.nbytes for g in self._grid)
+
+    def level_of(self, xi):
+        """
+        Level used for each point: 0 .. n_levels - 2 are patches (finest
+        first, see levels), n_levels - 1 is the base grid.
+        """
+        xi = np.ascontiguousarray(np.atleast_2d(xi), dtype=np.float64)
+        return _nested_level_batch(xi, self._bounds)
+
+    def __call__(self, xi):
+        xi = np.ascontiguousarray(np.atleast_2d(xi), dtype=np.float64)
+
+        if self.ndim == 2:
+            return _interp2d_nested_batch(xi, *self._grid, self._grid_off, self._values, self._val_off,
+                                          self._bounds, self._n_channels, self.fill_value)
+
+        return _interp3d_nested_batch(xi, *self._grid, self._grid_off, self._values, self._val_off,
+                                      self._bounds, self._n_channels, self.fill_value)
 
 
 # ============================================================================
@@ -527,9 +2178,51 @@ class CoordinateMapper:
 
 
 # ============================================================================
-# Interpolator Factory Function
+# Interpolator Factory Functions
 # ============================================================================
 
+def get_stacked_interpolator(points, values, bounds_error=False, fill_value=0.0,
+                             backend='auto', layout='plain'):
+    """
+    Factory for linear interpolators of stacked channels, values (..., C).
+
+    Parameters
+    ----------
+    points : tuple of ndarray
+        Grid points in each dimension
+    values : ndarray
+        Values on grid with trailing channel axis
+    bounds_error : bool, optional
+        Raise error for out-of-bounds (default: False)
+    fill_value : float, optional
+        Fill value for out-of-bounds (default: 0.0)
+    backend : str, optional
+        'auto' or 'numba' (StackedInterpolator), 'scipy' (RegularGridInterpolator,
+        which also accepts trailing value dimensions). 'auto' falls back to
+        scipy if Numba is not available.
+    layout : str, optional
+        'plain' or 'tiled' storage for the numba backend (see StackedInterpolator)
+
+    Returns
+    -------
+    interpolator : callable
+        (M, ndim) -> (M, C)
+    """
+    backend = backend.lower()
+
+    if backend in ('auto', 'numba'):
+        if HAS_NUMBA:
+            return StackedInterpolator(points, values, bounds_error, fill_value, layout=layout)
+        if backend == 'numba':
+            warnings.warn("Numba not available. Falling back to 'scipy' backend.")
+        backend = 'scipy'
+
+    if backend == 'scipy':
+        return RegularGridInterpolator(points, values, 'linear', bounds_error, fill_value)
+
+    raise ValueError(f"Unknown backend '{backend}'. Use: 'auto', 'numba', 'scipy'")
+
+
 def get_interpolator(points, values, method='linear', bounds_error=False,
                      fill_value=0.0, backend='auto'):
     """
@@ -542,7 +2235,9 @@ def get_interpolator(points, values, method='linear', bounds_error=False,
     values : ndarray
         Values on grid
     method : str, optional
-        Interpolation method (default: 'linear')
+        Interpolation method (default: 'linear'). 'cubic' gives a C1-continuous
+        field; with the numba backend it is a tricubic Hermite kernel on
+        precomputed node derivatives
     bounds_error : bool, optional
         Raise error for out-of-bounds (default: False)
     fill_value : float, optional
@@ -699,6 +2394,85 @@ def benchmark_backends(grid_size=50, n_queries=1000, verbose=True):
     return results
 
 
+def benchmark_layouts(grid_size=200, n_particles=100000, n_steps=20, tile_size=8, repeat=3, verbose=True):
+    """
+    Benchmark plain vs. tiled storage of a 3-component field map.
+
+    Two access patterns are timed: points drawn uniformly over the whole map
+    (worst case for any layout) and a gaussian bunch (sigma = 5% of the box)
+    drifting along z in unsorted particle order, as seen in tracking.
+    Times are the best of `repeat` sweeps over all steps.
+    """
+    import time
+
+    if not HAS_NUMBA:
+        raise ImportError("Numba not installed. Install with: pip install numba")
+
+    x = np.linspace(0, 1, grid_size)
+    rng = np.random.default_rng(0)
+    values = rng.standard_normal((grid_size, grid_size, grid_size, 3))
+
+    def uniform(step):
+        return rng.random((n_particles, 3))
+
+    bunch = np.clip(rng.normal(0.5, 0.05, (n_particles, 3)), 0.0, 1.0)
+
+    def drifting_bunch(step):
+        pts = bunch.copy()
+        pts[:, 2] = np.clip(pts[:, 2] - 0.3 + 0.6 * step / max(n_steps - 1, 1), 0.0, 1.0)
+        return pts
+
+    patterns = {'uniform': uniform, 'bunch': drifting_bunch}
+    interps = {'plain': StackedInterpolator((x, x, x), values),
+               'tiled': StackedInterpolator((x, x, x), values, layout='tiled', tile_size=tile_size)}
+    del values
+
+    if verbose:
+        print(f"\n{'=' * 60}")
+        print(f"Benchmarking field layouts")
+        print(f"{'=' * 60}")
+        print(f"Grid size: {grid_size}x{grid_size}x{grid_size}x3, tile: {tile_size}^3")
+        print(f"Particles: {n_particles}, steps: {n_steps}")
+        print(f"{'=' * 60}\n")
+
+    results = {}
+    for pattern, make_points in patterns.items():
+        queries = [make_points(step) for step in range(n_steps)]
+        reference = None
+        for layout, interp in interps.items():
+            _ = interp(queries[0][:10])  # Warmup (JIT)
+
+            t_eval = np.inf
+            for _ in range(repeat):
+                t_start = time.time()
+                for pts in queries:
+                    result = interp(pts)
+                t_eval = min(t_eval, time.time() - t_start)
+
+            if reference is None:
+                reference = result
+            max_error = np.max(np.abs(result - reference))
+
+            results[(pattern, layout)] = {
+                'eval_time': t_eval,
+                'time_per_query': t_eval / (n_steps * n_particles),
+                'max_error': max_error
+            }
+
+            if verbose:
+                print(f"{pattern:8s} {layout:6s}: {t_eval * 1000:8.2f} ms, "
+                      f"{t_eval / (n_steps * n_particles) * 1e9:6.1f} ns/query, error {max_error:.2e}")
+
+        if verbose:
+            speedup = results[(pattern, 'plain')]['eval_time'] / results[(pattern, 'tiled')]['eval_time']
+            print(f"{pattern:8s} tiled speedup: {speedup:.2f}x\n")
+
+    if verbose:
+        print(f"{'=' * 60}\n")
+
+    return results
+
+
 if __name__ == "__main__":
     print("Testing interpolators.py...")
     print(f"\nAvailable backends:")
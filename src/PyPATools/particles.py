@@ -1176,6 +1176,10 @@ class ParticleDistribution(object):
             bunch_charge: float = 0.0,
             bunch_freq: float = 0.0,
 
+            # Random streams
+            rng=None,
+            n_workers: Optional[int] = None,
+
             **kwargs
     ) -> 'ParticleDistribution':
         """
@@ -1196,6 +1200,11 @@ class ParticleDistribution(object):
             Longitudinal direction: 'x', 'y', or 'z' (default: 'z')
         n_particles : int
             Number of macroparticles
+        rng : int, np.random.SeedSequence or np.random.Generator, optional
+            Seed or generator, for reproducible distributions
+        n_workers : int, optional
+            Generate in parallel on n_workers threads. The result does not
+            depend on n_workers (see distribution_generators.generate_distribution)
 
         (See distribution_generators.py for other parameters)
 
@@ -1241,6 +1250,7 @@ class ParticleDistribution(object):
             flattop_length=flattop_length,
             dist_type_end=dist_type_end,
             alpha_end=alpha_end, beta_end=beta_end, emittance_end=emittance_end,
+            rng=rng, n_workers=n_workers,
             **kwargs
         )
 
@@ -15,7 +15,8 @@ Author: PyPATools Development Team
 """
 
 import numpy as np
-from typing import Tuple, Optional, Literal, List
+from typing import Tuple, Optional, Literal, List, Union
+from concurrent.futures import ThreadPoolExecutor
 import warnings
 
 try:
@@ -40,6 +41,15 @@ except ImportError:
 
 CLIGHT = 299792458.0  # m/s
 
+# Maximum number of candidates drawn at once by the rejection sampler
+_MAX_SAMPLE_BLOCK = 1_000_000
+
+# Number of particles per independent random stream in parallel generation
+PARALLEL_BLOCK_SIZE = 65536
+
+# Anything np.random.default_rng() accepts
+SeedLike = Union[None, int, np.random.SeedSequence, np.random.Generator]
+
 
 # ============================================================================
 # Coordinate Transformation Helpers
@@ -203,12 +213,13 @@ def _sample_gaussian(n_particles: int,
                      cholesky_matrix: np.ndarray,
                      cutoff_r: np.ndarray,
                      cutoff_p: np.ndarray,
-                     dim: int) -> np.ndarray:
+                     dim: int,
+                     rng: Optional[np.random.Generator] = None) -> np.ndarray:
     """
     Sample from multivariate Gaussian with optional hyperelliptical cutoffs.
 
-    Uses Cholesky decomposition for correlated sampling and rejection
-    sampling for cutoffs.
+    Uses Cholesky decomposition for correlated sampling and vectorized,
+    block-wise rejection sampling for cutoffs.
 
     Parameters
     ----------
@@ -223,6 +234,8 @@ def _sample_gaussian(n_particles: int,
         Momentum cutoffs [cutoff_px, cutoff_py, cutoff_pz] in σ units
     dim : int
         Dimensionality: 1, 2, or 3
+    rng : np.random.Generator, optional
+        Random number generator (default: a new, unseeded default_rng())
 
     Returns
     -------
@@ -236,7 +249,14 @@ def _sample_gaussian(n_particles: int,
     - Dim 1: |z| ≤ cutoff_z AND |pz| ≤ cutoff_pz
     - Dim 2: (x/cutoff_x)² + (y/cutoff_y)² ≤ 1 AND (px/...)² + (py/...)² ≤ 1
     - Dim 3: (x/...)² + (y/...)² + (z/...)² ≤ 1 AND same for momenta
+
+    Candidates are drawn in blocks sized from the acceptance rate measured so
+    far (the first block has n_particles rows), tested all at once and the
+    accepted ones appended until n_particles are collected.
     """
+    if rng is None:
+        rng = np.random.default_rng()
+
     # Determine which dimensions are active
     if dim == 1:
         active_r_idx = [2]  # z only
@@ -258,14 +278,9 @@ def _sample_gaussian(n_particles: int,
 
     if not has_r_cutoff and not has_p_cutoff:
         # No cutoffs - fast path (no rejection sampling)
-        z = np.random.randn(n_particles, 2 * dim)
+        z = rng.standard_normal((n_particles, 2 * dim))
         return z @ cholesky_matrix.T
 
-    # Rejection sampling with cutoffs
-    samples = []
-    max_attempts = n_particles * 1000  # Safety limit
-    attempts = 0
-
     # Estimate acceptance rate for warning
     if has_r_cutoff:
         avg_cutoff_r = np.mean(cutoff_r_active[cutoff_r_active > 0])
@@ -275,57 +290,48 @@ def _sample_gaussian(n_particles: int,
                 f"Consider using cutoff ≥ 3σ for better performance."
             )
 
-    while len(samples) < n_particles and attempts < max_attempts:
-        # Generate candidate
-        z = np.random.randn(2 * dim)
-        candidate = cholesky_matrix @ z
-
-        # Extract position and momentum (interleaved: [x,px,y,py,z,pz])
-        pos = candidate[::2][:dim]  # [x, y, z][:dim]
-        mom = candidate[1::2][:dim]  # [px, py, pz][:dim]
-
-        accept = True
+    # Inverse cutoffs; axes without cutoff get 0 and do not contribute
+    inv_cutoff_r = np.divide(1.0, cutoff_r_active, out=np.zeros(dim), where=cutoff_r_active > 0)
+    inv_cutoff_p = np.divide(1.0, cutoff_p_active, out=np.zeros(dim), where=cutoff_p_active > 0)
 
-        # Position hyperellipse check
-        if has_r_cutoff:
-            # Only non-zero cutoffs contribute
-            r_terms = []
-            for i, idx in enumerate(active_r_idx[:dim]):
-                if cutoff_r_active[i] > 0:
-                    r_terms.append((pos[i] / cutoff_r_active[i]) ** 2)
+    samples = np.empty((n_particles, 2 * dim))
+    n_accepted = 0
+    n_drawn = 0
+    max_attempts = n_particles * 1000  # Safety limit
 
-            if len(r_terms) > 0:
-                r_norm_sq = np.sum(r_terms)
-                if r_norm_sq > 1.0:
-                    accept = False
+    block_size = min(n_particles, _MAX_SAMPLE_BLOCK)
 
-        # Momentum hyperellipse check
-        if accept and has_p_cutoff:
-            p_terms = []
-            for i, idx in enumerate(active_p_idx[:dim]):
-                if cutoff_p_active[i] > 0:
-                    p_terms.append((mom[i] / cutoff_p_active[i]) ** 2)
+    while n_accepted < n_particles and n_drawn < max_attempts:
+        # Generate block of candidates
+        z = rng.standard_normal((block_size, 2 * dim))
+        candidates = z @ cholesky_matrix.T
+        n_drawn += block_size
 
-            if len(p_terms) > 0:
-                p_norm_sq = np.sum(p_terms)
-                if p_norm_sq > 1.0:
-                    accept = False
+        # Position and momentum (interleaved: [x,px,y,py,z,pz])
+        r_norm_sq = ((candidates[:, 0::2] * inv_cutoff_r) ** 2).sum(axis=1)
+        p_norm_sq = ((candidates[:, 1::2] * inv_cutoff_p) ** 2).sum(axis=1)
+        accepted = candidates[(r_norm_sq <= 1.0) & (p_norm_sq <= 1.0)]
 
-        if accept:
-            samples.append(candidate)
+        n_take = min(len(accepted), n_particles - n_accepted)
+        samples[n_accepted:n_accepted + n_take] = accepted[:n_take]
+        n_accepted += n_take
 
-        attempts += 1
+        # Size the next block from the measured acceptance rate (+10% margin)
+        acceptance = max(n_accepted / n_drawn, 1.0 / _MAX_SAMPLE_BLOCK)
+        n_missing = n_particles - n_accepted
+        block_size = int(min(_MAX_SAMPLE_BLOCK, np.ceil(1.1 * n_missing / acceptance) + 16))
 
-    if len(samples) < n_particles:
+    if n_accepted < n_particles:
         raise RuntimeError(
-            f"Rejection sampling failed: generated only {len(samples)}/{n_particles} "
-            f"particles after {max_attempts} attempts. Cutoffs may be too restrictive."
+            f"Rejection sampling failed: generated only {n_accepted}/{n_particles} "
+            f"particles after {n_drawn} attempts. Cutoffs may be too restrictive."
         )
 
-    return np.array(samples)
+    return samples
 
 
-def _sample_kv(n_particles: int, dim: int) -> np.ndarray:
+def _sample_kv(n_particles: int, dim: int,
+               rng: Optional[np.random.Generator] = None) -> np.ndarray:
     """
     Sample from Kapchinskij-Vladimirskij distribution.
 
@@ -337,6 +343,8 @@ def _sample_kv(n_particles: int, dim: int) -> np.ndarray:
         Number of particles
     dim : int
         Dimensionality (1, 2, or 3)
+    rng : np.random.Generator, optional
+        Random number generator (default: a new, unseeded default_rng())
 
     Returns
     -------
@@ -350,15 +358,18 @@ def _sample_kv(n_particles: int, dim: int) -> np.ndarray:
 
     Boundary is at 4-RMS (4σ equivalent).
     """
+    if rng is None:
+        rng = np.random.default_rng()
+
     # Sample uniformly in (2*dim)-dimensional hypersphere, then project
     # to get uniform distribution in phase space
 
     # Radius: uniform in [0, 4] (4-RMS boundary)
-    r = 4.0 * np.random.uniform(0, 1, n_particles) ** (1.0 / (2 * dim))
+    r = 4.0 * rng.uniform(0, 1, n_particles) ** (1.0 / (2 * dim))
 
     # Angular coordinates: uniform on (2*dim-1)-sphere
     # Generate normal then normalize (standard method)
-    angles = np.random.randn(n_particles, 2 * dim)
+    angles = rng.standard_normal((n_particles, 2 * dim))
     angles = angles / np.linalg.norm(angles, axis=1, keepdims=True)
 
     # Scale by radius
@@ -367,7 +378,8 @@ def _sample_kv(n_particles: int, dim: int) -> np.ndarray:
     return samples
 
 
-def _sample_waterbag(n_particles: int, dim: int) -> np.ndarray:
+def _sample_waterbag(n_particles: int, dim: int,
+                     rng: Optional[np.random.Generator] = None) -> np.ndarray:
     """
     Sample from waterbag distribution.
 
@@ -379,6 +391,8 @@ def _sample_waterbag(n_particles: int, dim: int) -> np.ndarray:
         Number of particles
     dim : int
         Dimensionality (1, 2, or 3)
+    rng : np.random.Generator, optional
+        Random number generator (default: a new, unseeded default_rng())
 
     Returns
     -------
@@ -387,9 +401,11 @@ def _sample_waterbag(n_particles: int, dim: int) -> np.ndarray:
     """
     # Similar to KV but in full phase space
     # Uniform in (2*dim)-D ball
+    if rng is None:
+        rng = np.random.default_rng()
 
-    r = 4.0 * np.random.uniform(0, 1, n_particles) ** (1.0 / (2 * dim))
-    angles = np.random.randn(n_particles, 2 * dim)
+    r = 4.0 * rng.uniform(0, 1, n_particles) ** (1.0 / (2 * dim))
+    angles = rng.standard_normal((n_particles, 2 * dim))
     angles = angles / np.linalg.norm(angles, axis=1, keepdims=True)
 
     samples = r[:, np.newaxis] * angles
@@ -406,7 +422,8 @@ def generate_dist_from_sigma_matrix(
         sigma_matrix: np.ndarray,
         dist_type: Literal['gaussian', 'kv', 'waterbag'],
         cutoff_r: Optional[np.ndarray] = None,
-        cutoff_p: Optional[np.ndarray] = None
+        cutoff_p: Optional[np.ndarray] = None,
+        rng: Optional[np.random.Generator] = None
 ) -> np.ndarray:
     """
     Generate distribution from covariance matrix in momentum space.
@@ -424,6 +441,8 @@ def generate_dist_from_sigma_matrix(
         Position cutoffs [cutoff_x, cutoff_y, cutoff_z]
     cutoff_p : np.ndarray(3,), optional
         Momentum cutoffs [cutoff_px, cutoff_py, cutoff_pz]
+    rng : np.random.Generator, optional
+        Random number generator (default: a new, unseeded default_rng())
 
     Returns
     -------
@@ -458,7 +477,7 @@ def generate_dist_from_sigma_matrix(
     # Sample based on distribution type
     if dist_type == 'gaussian':
         samples_normalized = _sample_gaussian(
-            n_particles, cholesky_corr, cutoff_r, cutoff_p, dim
+            n_particles, cholesky_corr, cutoff_r, cutoff_p, dim, rng
         )
     elif dist_type == 'kv':
         if np.any(cutoff_r > 0) or np.any(cutoff_p > 0):
@@ -466,14 +485,14 @@ def generate_dist_from_sigma_matrix(
                 "Cutoffs specified for KV distribution but ignored "
                 "(KV has natural boundary at 4σ)"
             )
-        samples_normalized = _sample_kv(n_particles, dim)
+        samples_normalized = _sample_kv(n_particles, dim, rng)
     elif dist_type == 'waterbag':
         if np.any(cutoff_r > 0) or np.any(cutoff_p > 0):
             warnings.warn(
                 "Cutoffs specified for waterbag distribution but ignored "
                 "(waterbag has natural boundary)"
             )
-        samples_normalized = _sample_waterbag(n_particles, dim)
+        samples_normalized = _sample_waterbag(n_particles, dim, rng)
     else:
         raise ValueError(f"Unknown dist_type: {dist_type}")
 
@@ -495,7 +514,8 @@ def generate_dist_from_twiss_parameters(
         reference_momentum: float = 1.0,
         dist_type: Literal['gaussian', 'kv', 'waterbag'] = 'gaussian',
         cutoff_r: Optional[np.ndarray] = None,
-        cutoff_p: Optional[np.ndarray] = None
+        cutoff_p: Optional[np.ndarray] = None,
+        rng: Optional[np.random.Generator] = None
 ) -> np.ndarray:
     """
     Generate distribution from Twiss parameters.
@@ -519,6 +539,8 @@ def generate_dist_from_twiss_parameters(
         'gaussian', 'kv', or 'waterbag'
     cutoff_r, cutoff_p : np.ndarray, optional
         Position and momentum cutoffs
+    rng : np.random.Generator, optional
+        Random number generator (default: a new, unseeded default_rng())
 
     Returns
     -------
@@ -566,7 +588,7 @@ def generate_dist_from_twiss_parameters(
         sigma_matrix[5, 5] = s_pzpz
 
     return generate_dist_from_sigma_matrix(
-        n_particles, sigma_matrix, dist_type, cutoff_r, cutoff_p
+        n_particles, sigma_matrix, dist_type, cutoff_r, cutoff_p, rng
     )
 
 
@@ -578,7 +600,8 @@ def generate_dist_longitudinal_flattop(
         alpha_end: float = 0.0,
         beta_end: float = 1.0,
         emittance_end: float = 0.0,
-        reference_momentum: float = 1.0
+        reference_momentum: float = 1.0,
+        rng: Optional[np.random.Generator] = None
 ) -> Tuple[np.ndarray, np.ndarray]:
     """
     Generate longitudinal flat-top distribution.
@@ -600,6 +623,8 @@ def generate_dist_longitudinal_flattop(
         Twiss parameters for end caps (only if dist_type_end != 'flat')
     reference_momentum : float
         Reference momentum [β·γ]
+    rng : np.random.Generator, optional
+        Random number generator (default: a new, unseeded default_rng())
 
     Returns
     -------
@@ -614,10 +639,13 @@ def generate_dist_longitudinal_flattop(
     if sigma_pz <= 0:
         raise ValueError(f"sigma_pz must be positive, got {sigma_pz}")
 
+    if rng is None:
+        rng = np.random.default_rng()
+
     if dist_type_end == 'flat':
         # Perfect cylinder: uniform z, Gaussian pz
-        z = np.random.uniform(-flattop_length / 2, flattop_length / 2, n_particles)
-        pz = np.random.randn(n_particles) * sigma_pz
+        z = rng.uniform(-flattop_length / 2, flattop_length / 2, n_particles)
+        pz = rng.standard_normal(n_particles) * sigma_pz
         return z, pz
 
     # With end caps: 3-part distribution
@@ -636,8 +664,8 @@ def generate_dist_longitudinal_flattop(
     n_right_cap = n_caps_total - n_left_cap
 
     # Generate core (uniform in position, Gaussian in momentum)
-    z_core = np.random.uniform(-flattop_length / 2.0, flattop_length / 2.0, n_core)
-    pz_core = np.random.randn(n_core) * sigma_pz
+    z_core = rng.uniform(-flattop_length / 2.0, flattop_length / 2.0, n_core)
+    pz_core = rng.standard_normal(n_core) * sigma_pz
 
     # Generate left cap (centered at -flattop_length/2 - sigma_z_end)
     sigma_matrix_end = np.array([
@@ -646,7 +674,7 @@ def generate_dist_longitudinal_flattop(
     ])
 
     samples_left = generate_dist_from_sigma_matrix(
-        n_left_cap, sigma_matrix_end, dist_type_end
+        n_left_cap, sigma_matrix_end, dist_type_end, rng=rng
     )
     z_left = samples_left[:, 0] - flattop_length / 2.0  # Shift down
     pz_left = samples_left[:, 1]
@@ -658,7 +686,7 @@ def generate_dist_longitudinal_flattop(
 
     # Generate right cap (centered at +flattop_length/2 + sigma_z_end)
     samples_right = generate_dist_from_sigma_matrix(
-        n_right_cap, sigma_matrix_end, dist_type_end
+        n_right_cap, sigma_matrix_end, dist_type_end, rng=rng
     )
     z_right = samples_right[:, 0] + flattop_length / 2.0  # Shift up
     pz_right = samples_right[:, 1]
@@ -678,8 +706,8 @@ def generate_dist_longitudinal_flattop(
     if n_generated < n_particles:
         # Lost particles to masking; pad with core particles
         n_missing = n_particles - n_generated
-        z_pad = np.random.uniform(-flattop_length / 2.0, flattop_length / 2.0, n_missing)
-        pz_pad = np.random.randn(n_missing) * sigma_pz
+        z_pad = rng.uniform(-flattop_length / 2.0, flattop_length / 2.0, n_missing)
+        pz_pad = rng.standard_normal(n_missing) * sigma_pz
         z = np.concatenate([z, z_pad])
         pz = np.concatenate([pz, pz_pad])
 
@@ -741,6 +769,11 @@ def generate_distribution(
         beta_end: Optional[float] = None,
         emittance_end: Optional[float] = None,
 
+        # Random streams
+        rng: SeedLike = None,
+        n_workers: Optional[int] = None,
+        block_size: int = PARALLEL_BLOCK_SIZE,
+
         **kwargs
 ) -> Tuple[np.ndarray, np.ndarray]:
     """
@@ -759,6 +792,19 @@ def generate_distribution(
     s_direction : str
         Longitudinal direction: 'x', 'y', or 'z'
 
+    rng : int, np.random.SeedSequence or np.random.Generator, optional
+        Seed or generator for all random draws. None gives fresh OS entropy.
+
+    n_workers : int, optional
+        If given, generate in parallel mode: n_particles is split into fixed
+        blocks of block_size particles, each drawn from its own stream spawned
+        from the root SeedSequence, and the blocks are distributed over
+        n_workers threads. The result depends only on rng and block_size,
+        not on n_workers. (Parallel and serial mode draw different streams.)
+
+    block_size : int
+        Particles per independent stream in parallel mode
+
     Returns
     -------
     positions : np.ndarray(n_particles, 3)
@@ -799,7 +845,32 @@ def generate_distribution(
     ...     sigma_z=0.01, sigma_pz=0.001,
     ...     n_particles=10000
     ... )
+
+    # Reproducible, 8 threads (same result for any n_workers)
+    > pos, mom = generate_distribution(..., rng=42, n_workers=8)
     """
+    if n_workers is not None:
+        params = dict(
+            type=type, s_direction=s_direction,
+            correlation_matrix=correlation_matrix,
+            sigma_x=sigma_x, sigma_px=sigma_px,
+            sigma_y=sigma_y, sigma_py=sigma_py,
+            sigma_z=sigma_z, sigma_pz=sigma_pz,
+            sigma_matrix=sigma_matrix,
+            alpha_x=alpha_x, beta_x=beta_x, emittance_x=emittance_x,
+            alpha_y=alpha_y, beta_y=beta_y, emittance_y=emittance_y,
+            alpha_z=alpha_z, beta_z=beta_z, emittance_z=emittance_z,
+            reference_momentum=reference_momentum,
+            cutoff_x=cutoff_x, cutoff_y=cutoff_y, cutoff_z=cutoff_z,
+            cutoff_px=cutoff_px, cutoff_py=cutoff_py, cutoff_pz=cutoff_pz,
+            flattop_length=flattop_length, dist_type_end=dist_type_end,
+            alpha_end=alpha_end, beta_end=beta_end, emittance_end=emittance_end,
+            **kwargs
+        )
+        return _generate_distribution_parallel(n_particles, rng, n_workers, block_size, params)
+
+    rng = np.random.default_rng(rng)
+
     dim = len(type)
 
     if dim < 1 or dim > 3:
@@ -877,7 +948,7 @@ def generate_distribution(
                 alpha_y, beta_y, emittance_y,
                 alpha_z, beta_z, emittance_z,
                 reference_momentum, dist_type,
-                cutoff_r, cutoff_p
+                cutoff_r, cutoff_p, rng
             )
 
             # Convert samples to positions and momenta
@@ -908,7 +979,7 @@ def generate_distribution(
 
         # Generate from sigma matrix
         samples = generate_dist_from_sigma_matrix(
-            n_particles, sigma_matrix, dist_type, cutoff_r, cutoff_p
+            n_particles, sigma_matrix, dist_type, cutoff_r, cutoff_p, rng
         )
 
         # Convert to 3D arrays
@@ -959,7 +1030,7 @@ def generate_distribution(
                 alpha_y, beta_y, emittance_y,
                 None, None, None,  # No z
                 reference_momentum, trans_type,
-                cutoff_r, cutoff_p
+                cutoff_r, cutoff_p, rng
             )
         else:
             raise NotImplementedError(
@@ -982,7 +1053,8 @@ def generate_distribution(
             alpha_end if alpha_end is not None else 0.0,
             beta_end if beta_end is not None else 1.0,
             emittance_end if emittance_end is not None else 0.0,
-            reference_momentum if reference_momentum is not None else 1.0
+            reference_momentum if reference_momentum is not None else 1.0,
+            rng
         )
 
         # Combine transverse and longitudinal (assuming z is longitudinal in generation)
@@ -1007,6 +1079,67 @@ def generate_distribution(
         )
 
 
+def _generate_distribution_parallel(n_particles: int,
+                                    rng: SeedLike,
+                                    n_workers: int,
+                                    block_size: int,
+                                    params: dict) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Parallel mode of generate_distribution().
+
+    Splits n_particles into fixed blocks, gives every block its own Generator
+    spawned from one root SeedSequence and fills the blocks on a thread pool
+    (NumPy releases the GIL while drawing and in the matrix products). Since
+    the block layout is fixed, the output is independent of n_workers.
+
+    Parameters
+    ----------
+    n_particles : int
+        Total number of particles
+    rng : int, np.random.SeedSequence or np.random.Generator, optional
+        Root seed. A Generator is used to spawn the block streams.
+    n_workers : int
+        Number of worker threads
+    block_size : int
+        Particles per block (one random stream each)
+    params : dict
+        All remaining keyword arguments of generate_distribution()
+
+    Returns
+    -------
+    positions, momenta : np.ndarray(n_particles, 3)
+    """
+    if n_workers < 1:
+        raise ValueError(f"n_workers must be >= 1, got {n_workers}")
+    if block_size < 1:
+        raise ValueError(f"block_size must be >= 1, got {block_size}")
+
+    if isinstance(rng, np.random.Generator):
+        block_rngs = rng.spawn(-(-n_particles // block_size))
+    else:
+        if not isinstance(rng, np.random.SeedSequence):
+            rng = np.random.SeedSequence(rng)
+        block_rngs = [np.random.default_rng(ss) for ss in rng.spawn(-(-n_particles // block_size))]
+
+    starts = range(0, n_particles, block_size)
+
+    positions = np.empty((n_particles, 3))
+    momenta = np.empty((n_particles, 3))
+
+    def _fill_block(i_block):
+        start = starts[i_block]
+        stop = min(start + block_size, n_particles)
+        pos, mom = generate_distribution(n_particles=stop - start, rng=block_rngs[i_block], **params)
+        positions[start:stop] = pos
+        momenta[start:stop] = mom
+
+    with ThreadPoolExecutor(max_workers=n_workers) as pool:
+        # list() re-raises exceptions from the workers
+        list(pool.map(_fill_block, range(len(block_rngs))))
+
+    return positions, momenta
+
+
 if __name__ == "__main__":
     # Basic tests
     print("Testing distribution_generators.py...")
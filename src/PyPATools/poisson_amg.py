@@ -25,7 +25,7 @@ Author: PyPATools Team
 """
 
 import numpy as np
-from scipy.sparse import lil_matrix, csr_matrix, coo_matrix
+from scipy.sparse import csr_matrix, coo_matrix
 from scipy.sparse.linalg import gmres, LinearOperator
 import pyamg
 import time
@@ -82,6 +82,13 @@ class PyAMGSolverConfig:
     # Field output
     interpolator_backend: str = 'auto'  # 'scipy', 'cupy', or 'auto'
 
+    # Matrix-free operator: 7-point stencil kernel + CSR of the Shortley-Weller rows only.
+    # Lowers the memory held during solves; peak (setup) memory is unchanged because
+    # the AMG hierarchy is built from the full CSR matrix
+    matrix_free: bool = False
+    jacobi_omega: float = 2.0 / 3.0  # Fine-level smoother weight when matrix_free
+    jacobi_sweeps: int = 2
+
 
 class CellType(IntEnum):
     """Classification of mesh cells"""
@@ -130,6 +137,141 @@ def compute_field_from_potential_numba(phi_3d, hx, hy, hz):
     return Ex, Ey, Ez
 
 
+@nb.jit(nopython=True, parallel=True, cache=True)
+def poisson_stencil_matvec_numba(x_full, dof_mapping, regular, hx, hy, hz, y):
+    """
+    y = A x for the rows of the reduced system without conductor neighbors.
+
+    These rows are the constant 7-point stencil; neighbors outside the
+    domain count as 0 (Dirichlet), as in the assembled matrix.
+
+    Parameters
+    ----------
+    x_full : np.ndarray(nx, ny, nz)
+        Reduced vector scattered to the grid, 0 in conductor cells
+    dof_mapping : np.ndarray(nx * ny * nz,)
+        Reduced DOF index per cell, -1 for conductors
+    regular : np.ndarray(n_active_dofs,) of bool
+        Rows computed here; the others are left untouched
+    hx, hy, hz : float
+        Grid spacings
+    y : np.ndarray(n_active_dofs,)
+        Output
+    """
+    nx, ny, nz = x_full.shape
+    cx = 1.0 / (hx * hx)
+    cy = 1.0 / (hy * hy)
+    cz = 1.0 / (hz * hz)
+    cd = 2.0 * (cx + cy + cz)
+
+    for i in nb.prange(nx):
+        for j in range(ny):
+            for k in range(nz):
+                p = dof_mapping[(i * ny + j) * nz + k]
+                if p < 0 or not regular[p]:
+                    continue
+
+                acc = cd * x_full[i, j, k]
+                if i > 0:
+                    acc -= cx * x_full[i - 1, j, k]
+                if i < nx - 1:
+                    acc -= cx * x_full[i + 1, j, k]
+                if j > 0:
+                    acc -= cy * x_full[i, j - 1, k]
+                if j < ny - 1:
+                    acc -= cy * x_full[i, j + 1, k]
+                if k > 0:
+                    acc -= cz * x_full[i, j, k - 1]
+                if k < nz - 1:
+                    acc -= cz * x_full[i, j, k + 1]
+                y[p] = acc
+
+
+class StencilPoissonOperator(LinearOperator):
+    """
+    Matrix-free Shortley-Weller Poisson operator of the reduced system.
+
+    Rows without conductor neighbors are applied with a Numba 7-point
+    stencil on a full-grid work array; only the Shortley-Weller rows next to
+    conductors are stored as CSR. Holds 12 bytes per grid cell (dof_mapping,
+    work array) plus 17 bytes per active DOF (keep_indices, regular,
+    diagonal) plus the boundary rows, against ~7 nonzeros (~88 bytes) per row
+    for the full CSR. Usable wherever scipy accepts a LinearOperator (gmres,
+    cg) and as the fine-level operator of a PyAMG hierarchy (see
+    jacobi_smoother). Peak memory is unchanged: the PyAMG hierarchy is still
+    built from the full CSR matrix, which is released afterwards.
+
+    Parameters
+    ----------
+    shape : (nx, ny, nz)
+        Grid shape
+    spacing : (hx, hy, hz)
+        Grid spacings
+    dof_mapping : np.ndarray(nx * ny * nz,)
+        Reduced DOF index per cell, -1 for conductors
+    keep_indices : np.ndarray(n_active_dofs,)
+        Cell index per reduced DOF
+    regular : np.ndarray(n_active_dofs,) of bool
+        Rows without conductor neighbors
+    irregular_rows : np.ndarray
+        Reduced DOF indices of the other rows
+    A_irregular : csr_matrix (len(irregular_rows), n_active_dofs)
+        Their Shortley-Weller rows
+    """
+
+    def __init__(self, shape, spacing, dof_mapping, keep_indices, regular, irregular_rows, A_irregular):
+        n = len(keep_indices)
+        super().__init__(dtype=np.float64, shape=(n, n))
+
+        self.grid_shape = tuple(shape)
+        self.spacing = tuple(float(h) for h in spacing)
+        self.dof_mapping = dof_mapping
+        self.keep_indices = keep_indices
+        self.regular = regular
+        self.irregular_rows = irregular_rows
+        self.A_irregular = A_irregular
+
+        self._x_full = np.zeros(self.grid_shape, dtype=np.float64)
+
+        hx, hy, hz = self.spacing
+        self._diagonal = np.full(n, 2.0 / hx ** 2 + 2.0 / hy ** 2 + 2.0 / hz ** 2)
+        self._diagonal[irregular_rows] = A_irregular[np.arange(len(irregular_rows)), irregular_rows].A1
+
+    def _matvec(self, x):
+        x = np.ravel(x)
+        self._x_full.ravel()[self.keep_indices] = x  # Conductor cells stay 0
+
+        y = np.empty(self.shape[0], dtype=np.float64)
+        poisson_stencil_matvec_numba(self._x_full, self.dof_mapping, self.regular, *self.spacing, y)
+        y[self.irregular_rows] = self.A_irregular @ x
+
+        return y
+
+    def diagonal(self) -> np.ndarray:
+        """Main diagonal (n_active_dofs,)"""
+        return self._diagonal
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the operator"""
+        return (self.dof_mapping.nbytes + self.keep_indices.nbytes + self.regular.nbytes
+                + self.irregular_rows.nbytes + self._x_full.nbytes + self._diagonal.nbytes
+                + self.A_irregular.data.nbytes + self.A_irregular.indices.nbytes + self.A_irregular.indptr.nbytes)
+
+    def jacobi_smoother(self, omega: float = 2.0 / 3.0, sweeps: int = 2):
+        """
+        Matrix-free weighted Jacobi relaxation x <- x + omega D^-1 (b - A x),
+        in the fn(A, x, b) in-place form PyAMG uses for level smoothers.
+        """
+        inv_diag = omega / self._diagonal
+
+        def smoother(A, x, b):
+            for _ in range(sweeps):
+                x += inv_diag * (np.ravel(b) - self._matvec(x))
+
+        return smoother
+
+
 class PyAMGPoissonSolver:
     """
     3D Poisson solver for cyclotron space-charge using PyAMG.
@@ -215,6 +357,12 @@ class PyAMGPoissonSolver:
             self._transfer_matrix_to_gpu()
             print(f"[OK] Transferred matrix to GPU ({time.time() - t0:.2f}s)")
 
+        self.A_op = None
+        if config.matrix_free:
+            t0 = time.time()
+            self._build_stencil_operator()
+            print(f"[OK] Built matrix-free operator ({time.time() - t0:.2f}s)")
+
         self.turn_count = 0
         self.solve_times = []
 
@@ -307,141 +455,110 @@ class PyAMGPoissonSolver:
 
         print(f"    Active DOFs (interior+boundary): {self.n_active_dofs:,d} / {self.n_dofs:,d}")
 
-        A_temp = lil_matrix((self.n_active_dofs, self.n_active_dofs), dtype=np.float64)
-
-        for i in range(self.nx):
-            if i % 10 == 0:
-                print(f"    Progress: {i}/{self.nx}")
-
-            for j in range(self.ny):
-                for k in range(self.nz):
-                    idx_old = self._ijk_to_idx(i, j, k)
-
-                    if self.cell_type[idx_old] == CellType.CONDUCTOR:
-                        continue
-
-                    idx_new = self.dof_mapping[idx_old]
-                    diag_val = 0.0
-
-                    # =========================================================
-                    # X - AXIS (i)
-                    # =========================================================
-                    i_pos = i + 1
-                    i_neg = i - 1
-
-                    # +X Neighbor
-                    if i_pos < self.nx:
-                        idx_pos = self._ijk_to_idx(i_pos, j, k)
-                        is_cond = self.cell_type[idx_pos] == CellType.CONDUCTOR
-                        hx_pos = max(self.boundary_distances[idx_old, 0], self.hx * 1e-3) if is_cond else self.hx
-                    else:
-                        is_cond = False
-                        hx_pos = self.hx
-                        idx_pos = -1
-
-                    # -X Neighbor
-                    if i_neg >= 0:
-                        idx_neg = self._ijk_to_idx(i_neg, j, k)
-                        is_cond_neg = self.cell_type[idx_neg] == CellType.CONDUCTOR
-                        hx_neg = max(self.boundary_distances[idx_old, 1], self.hx * 1e-3) if is_cond_neg else self.hx
-                    else:
-                        is_cond_neg = False
-                        hx_neg = self.hx
-                        idx_neg = -1
-
-                    # Apply to matrix
-                    diag_val += 2.0 / (hx_pos * hx_neg)
-
-                    if i_pos < self.nx and not is_cond:
-                        A_temp[idx_new, self.dof_mapping[idx_pos]] = -2.0 / (hx_pos * (hx_pos + hx_neg))
-
-                    if i_neg >= 0 and not is_cond_neg:
-                        A_temp[idx_new, self.dof_mapping[idx_neg]] = -2.0 / (hx_neg * (hx_pos + hx_neg))
-
-                    # =========================================================
-                    # Y - AXIS (j)
-                    # =========================================================
-                    j_pos = j + 1
-                    j_neg = j - 1
-
-                    # +Y Neighbor
-                    if j_pos < self.ny:
-                        idx_pos = self._ijk_to_idx(i, j_pos, k)
-                        is_cond = self.cell_type[idx_pos] == CellType.CONDUCTOR
-                        hy_pos = max(self.boundary_distances[idx_old, 2], self.hy * 1e-3) if is_cond else self.hy
-                    else:
-                        is_cond = False
-                        hy_pos = self.hy
-                        idx_pos = -1
-
-                    # -Y Neighbor
-                    if j_neg >= 0:
-                        idx_neg = self._ijk_to_idx(i, j_neg, k)
-                        is_cond_neg = self.cell_type[idx_neg] == CellType.CONDUCTOR
-                        hy_neg = max(self.boundary_distances[idx_old, 3], self.hy * 1e-3) if is_cond_neg else self.hy
-                    else:
-                        is_cond_neg = False
-                        hy_neg = self.hy
-                        idx_neg = -1
-
-                    # Apply to matrix
-                    diag_val += 2.0 / (hy_pos * hy_neg)
-
-                    if j_pos < self.ny and not is_cond:
-                        A_temp[idx_new, self.dof_mapping[idx_pos]] = -2.0 / (hy_pos * (hy_pos + hy_neg))
-
-                    if j_neg >= 0 and not is_cond_neg:
-                        A_temp[idx_new, self.dof_mapping[idx_neg]] = -2.0 / (hy_neg * (hy_pos + hy_neg))
-
-                    # =========================================================
-                    # Z - AXIS (k)
-                    # =========================================================
-                    k_pos = k + 1
-                    k_neg = k - 1
-
-                    # +Z Neighbor
-                    if k_pos < self.nz:
-                        idx_pos = self._ijk_to_idx(i, j, k_pos)
-                        is_cond = self.cell_type[idx_pos] == CellType.CONDUCTOR
-                        hz_pos = max(self.boundary_distances[idx_old, 4], self.hz * 1e-3) if is_cond else self.hz
-                    else:
-                        is_cond = False
-                        hz_pos = self.hz
-                        idx_pos = -1
-
-                    # -Z Neighbor
-                    if k_neg >= 0:
-                        idx_neg = self._ijk_to_idx(i, j, k_neg)
-                        is_cond_neg = self.cell_type[idx_neg] == CellType.CONDUCTOR
-                        hz_neg = max(self.boundary_distances[idx_old, 5], self.hz * 1e-3) if is_cond_neg else self.hz
-                    else:
-                        is_cond_neg = False
-                        hz_neg = self.hz
-                        idx_neg = -1
-
-                    # Apply to matrix
-                    diag_val += 2.0 / (hz_pos * hz_neg)
-
-                    if k_pos < self.nz and not is_cond:
-                        A_temp[idx_new, self.dof_mapping[idx_pos]] = -2.0 / (hz_pos * (hz_pos + hz_neg))
-
-                    if k_neg >= 0 and not is_cond_neg:
-                        A_temp[idx_new, self.dof_mapping[idx_neg]] = -2.0 / (hz_neg * (hz_pos + hz_neg))
-
-                    # =========================================================
-                    # Set Final Diagonal
-                    # =========================================================
-                    A_temp[idx_new, idx_new] = diag_val
-
-        # Convert to CSR format
-        self.A = A_temp.tocsr()
-        self.A.eliminate_zeros()
+        # Step 2: One row per active DOF
+        self.A = self._assemble_rows(self.keep_indices)
 
         print(
             f"    Reduced matrix: {self.A.nnz:,d} nonzeros ({100 * self.A.nnz / (self.n_active_dofs ** 2):.3f}% dense)")
 
         self._check_matrix_health()
 
+    def _assemble_rows(self, cells: np.ndarray) -> csr_matrix:
+        """
+        Shortley-Weller rows of the reduced system for the given cells.
+
+        Along each axis, a conductor neighbor is replaced by the wall at the
+        ray-cast distance (at least 1e-3 cells) and drops out of the row
+        (Dirichlet 0); neighbors outside the domain drop out at the regular
+        spacing.
+
+        Parameters
+        ----------
+        cells : np.ndarray
+            Full-grid indices of active (non-conductor) cells
+
+        Returns
+        -------
+        csr_matrix (len(cells), n_active_dofs)
+            Row r belongs to cells[r]; columns are reduced DOF indices
+        """
+        shape = (self.nx, self.ny, self.nz)
+        strides = (self.ny * self.nz, self.nz, 1)
+        ijk = np.unravel_index(cells, shape)
+        n_rows = len(cells)
+
+        diag = np.zeros(n_rows)
+        rows, cols, vals = [np.arange(n_rows)], [self.dof_mapping[cells]], []
+
+        for axis, h in enumerate((self.hx, self.hy, self.hz)):
+            sides = []
+            for sign, column in ((1, 2 * axis), (-1, 2 * axis + 1)):
+                exists = (ijk[axis] + sign >= 0) & (ijk[axis] + sign < shape[axis])
+                neighbor = np.where(exists, cells + sign * strides[axis], 0)
+                is_cond = exists & (self.cell_type[neighbor] == CellType.CONDUCTOR)
+                h_side = np.where(is_cond, np.maximum(self.boundary_distances[cells, column], h * 1e-3), h)
+                sides.append((exists & ~is_cond, neighbor, h_side))
+
+            (_, _, h_pos), (_, _, h_neg) = sides
+            diag += 2.0 / (h_pos * h_neg)
+
+            for coupled, neighbor, h_side in sides:
+                rows.append(np.flatnonzero(coupled))
+                cols.append(self.dof_mapping[neighbor[coupled]])
+                vals.append((-2.0 / (h_side * (h_pos + h_neg)))[coupled])
+
+        vals.insert(0, diag)
+        A = coo_matrix((np.concatenate(vals), (np.concatenate(rows), np.concatenate(cols))),
+                       shape=(n_rows, self.n_active_dofs)).tocsr()
+        A.eliminate_zeros()
+
+        return A
+
+    def _build_stencil_operator(self):
+        """
+        Replace the fine-level CSR matrix by the matrix-free operator.
+
+        Rows without conductor neighbors are the constant 7-point stencil;
+        only the remaining (Shortley-Weller) rows are kept as a CSR block.
+        The fine level of the AMG hierarchy switches to the operator with
+        matrix-free weighted Jacobi smoothing, and the fine-level matrix is
+        released (coarse levels are unchanged).
+        """
+        shape = (self.nx, self.ny, self.nz)
+        is_cond = (self.cell_type == CellType.CONDUCTOR).reshape(shape)
+
+        # Active cells with a conductor among their 6 neighbors
+        near_cond = np.zeros(shape, dtype=bool)
+        near_cond[1:] |= is_cond[:-1]
+        near_cond[:-1] |= is_cond[1:]
+        near_cond[:, 1:] |= is_cond[:, :-1]
+        near_cond[:, :-1] |= is_cond[:, 1:]
+        near_cond[:, :, 1:] |= is_cond[:, :, :-1]
+        near_cond[:, :, :-1] |= is_cond[:, :, 1:]
+        regular = ~near_cond.ravel()[self.keep_indices]
+
+        irregular_rows = np.flatnonzero(~regular)
+        A_irregular = self._assemble_rows(self.keep_indices[irregular_rows])
+
+        self.A_op = StencilPoissonOperator(shape, (self.hx, self.hy, self.hz), self.dof_mapping,
+                                           self.keep_indices, regular, irregular_rows, A_irregular)
+
+        print(f"    Stencil rows: {regular.sum():,d}, Shortley-Weller rows: {len(irregular_rows):,d} "
+              f"({A_irregular.nnz:,d} nonzeros)")
+
+        level = self.amg.levels[0]
+        level.A = self.A_op
+        level.presmoother = level.postsmoother = self.A_op.jacobi_smoother(self.config.jacobi_omega,
+                                                                            self.config.jacobi_sweeps)
+        if hasattr(level, 'C'):
+            del level.C  # Setup-only strength matrix (kept by keep=True)
+
+        self.A = None
+
+    @property
+    def operator(self):
+        """System operator used by GMRES: the CSR matrix, or the stencil operator if matrix_free"""
+        return self.A_op if self.A is None else self.A
 
     def _build_amg_hierarchy(self):
         """
@@ -697,7 +814,7 @@ class PyAMGPoissonSolver:
         logging.info("  Solving with GMRES (scipy) + AMG preconditioner...")
 
         x_cpu, gmres_info = gmres(
-            self.A,
+            self.operator,
             b_cpu,
             M=M,
             rtol=self.config.solver_tol,
@@ -788,7 +905,7 @@ class PyAMGPoissonSolver:
         logging.info(f"    Field comp.:  {(t_field - t_solve) * 1000:6.1f} ms")
         logging.info(f"    Interp. create: {(t_interp - t_field) * 1000:6.1f} ms")
         logging.info(f"    Total:        {solve_time * 1000:6.1f} ms")
-        logging.info(f"    Residual:     {np.linalg.norm(self.A @ x_cpu - b_cpu):.2e}\n")
+        logging.info(f"    Residual:     {np.linalg.norm(self.operator @ x_cpu - b_cpu):.2e}\n")
 
         return (phi_3d, E_field)
 
@@ -22,15 +22,23 @@ References:
 
 Notes:
     - All field query functions must be callable: efield(pts), bfield(pts)
+    - Fields with time_dependent=True (e.g. RFField) are called as efield(pts, t)
+      by the batch methods
     - Single particle push() accepts (3,) arrays but may change to (1,3) in future
     - Boundary checking removed for performance (may be re-added later)
 """
 
 import numpy as np
-from typing import Tuple, Callable
+from typing import Tuple, Callable, Optional, Union, List, TYPE_CHECKING
 import warnings
+from scipy.ndimage import distance_transform_edt
 from .global_variables import CLIGHT
-from py_electrodes.py_electrodes import PyElectrodeAssembly
+from .apertures import Aperture, ApertureSet, as_aperture_set
+from .field import _evaluate_field
+
+if TYPE_CHECKING:
+    # Annotations only: the pusher just calls methods of the assembly it is given
+    from py_electrodes.py_electrodes import PyElectrodeAssembly
 
 try:
     from numba import njit, prange
@@ -423,6 +431,165 @@ def rk4_rel_dbetagamma_dt_batch_numpy(v_array, efield_array, bfield_array, q_ove
     return force / gamma[:, np.newaxis] - correction
 
 
+# ============================================================================
+# Collision Acceleration
+# ============================================================================
+
+# Fraction of the clearance a particle may travel between adaptive collision checks
+COLLISION_SAFETY = 0.5
+
+# One record per particle lost on an electrode (see Pusher.track_batch)
+LOSS_DTYPE = np.dtype([('index', np.int64),         # particle index in r0_array
+                       ('step', np.int64),          # step during which the particle hit
+                       ('time', np.float64),        # impact time [s]
+                       ('position', np.float64, 3), # impact point [m]
+                       ('velocity', np.float64, 3), # velocity after the loss step [m/s]
+                       ('electrode_id', np.int32),  # -1 if the assembly reports none or an aperture was hit
+                       ('aperture_id', np.int32)])  # index in the ApertureSet, -1 for electrode hits
+
+
+class CollisionGrid:
+    """
+    Voxel clearance map used to pre-filter electrode collision tests.
+
+    Stores, per voxel of the tracking domain, a lower bound on the distance
+    from any point of the voxel to the nearest electrode surface (0 for
+    voxels that may contain surface). A step segment whose length is below
+    the clearance of its start voxel cannot reach a surface, so only the
+    remaining segments need the exact (ray-triangle) intersection test.
+    Surfaces outside the domain are not mapped, so the clearance is capped
+    at the distance to the domain boundary, and points outside the domain
+    always go to the exact test.
+
+    Parameters
+    ----------
+    clearance : np.ndarray(nx, ny, nz)
+        Distance lower bound per voxel [m]
+    origin : array-like (3,)
+        Lower corner of voxel [0, 0, 0] [m]
+    spacing : array-like (3,)
+        Voxel edge lengths [m]
+
+    Examples
+    --------
+    > grid = CollisionGrid.from_electrodes(electrodes, domain=((-0.1, 0.1), (-0.1, 0.1), (0, 0.5)),
+    ...                                    voxel_size=1e-3)
+    > pusher = Pusher(ion, 'vay_rel', electrode_assembly=electrodes, collision_grid=grid)
+    """
+
+    def __init__(self, clearance: np.ndarray, origin, spacing):
+        self.clearance = np.ascontiguousarray(clearance, dtype=np.float64)
+        self.origin = np.asarray(origin, dtype=np.float64)
+        self.spacing = np.asarray(spacing, dtype=np.float64)
+        self.shape = np.array(self.clearance.shape, dtype=np.int64)
+
+        if self.clearance.ndim != 3:
+            raise ValueError(f"clearance must be a 3D array, got shape {self.clearance.shape}")
+
+        # Distance from any point of a voxel to the nearest domain face
+        face = [np.minimum(np.arange(n), np.arange(n)[::-1]) * h for n, h in zip(self.shape, self.spacing)]
+        boundary = np.minimum(np.minimum(face[0][:, None, None], face[1][None, :, None]), face[2][None, None, :])
+        self.clearance = np.minimum(self.clearance, boundary)
+
+    @classmethod
+    def from_electrodes(cls, electrode_assembly: 'PyElectrodeAssembly',
+                        domain: Tuple[Tuple[float, float], Tuple[float, float], Tuple[float, float]],
+                        voxel_size: Union[float, Tuple[float, float, float]],
+                        use_gpu: bool = False) -> 'CollisionGrid':
+        """
+        Build the clearance map from axis-aligned surface ray casts.
+
+        Every voxel corner node casts rays along +-x, +-y, +-z. A surface
+        cutting a voxel crosses one of its edges, so a node whose nearest
+        hit along an axis is within one voxel edge flags all voxels sharing
+        that node as near-surface. The clearance of the other voxels is the
+        Euclidean distance transform to the flagged voxels minus one voxel
+        diagonal. Surface features smaller than a voxel that cut no voxel
+        edge can be missed, so voxel_size should be below the thinnest
+        electrode feature.
+
+        Parameters
+        ----------
+        electrode_assembly : PyElectrodeAssembly
+            Electrode geometry
+        domain : ((xmin, xmax), (ymin, ymax), (zmin, zmax))
+            Tracking domain [m]
+        voxel_size : float or (dx, dy, dz)
+            Voxel edge length [m]
+        use_gpu : bool
+            Passed to compute_axis_aligned_surface_intersections
+        """
+        lo = np.array([d[0] for d in domain], dtype=np.float64)
+        hi = np.array([d[1] for d in domain], dtype=np.float64)
+        shape = np.maximum(np.ceil((hi - lo) / np.broadcast_to(voxel_size, 3)).astype(np.int64), 1)
+        spacing = (hi - lo) / shape
+
+        axes = [lo[d] + spacing[d] * np.arange(shape[d] + 1) for d in range(3)]
+        mesh = np.meshgrid(*axes, indexing='ij')
+        nodes = np.column_stack([m.ravel() for m in mesh])
+
+        # Ray distances in order x+, x-, y+, y-, z+, z-
+        min_distances, _ = electrode_assembly.compute_axis_aligned_surface_intersections(
+            nodes, axes='all', use_gpu=use_gpu)
+        node_near = (np.asarray(min_distances) <= np.repeat(spacing, 2)).any(axis=1)
+        node_near = node_near.reshape(tuple(shape + 1))
+
+        occupied = np.zeros(tuple(shape), dtype=bool)
+        for di in (0, 1):
+            for dj in (0, 1):
+                for dk in (0, 1):
+                    occupied |= node_near[di:di + shape[0], dj:dj + shape[1], dk:dk + shape[2]]
+
+        if occupied.any():
+            distance = distance_transform_edt(~occupied, sampling=spacing)
+            clearance = np.maximum(distance - np.linalg.norm(spacing), 0.0)
+        else:
+            clearance = np.full(tuple(shape), np.inf)
+
+        return cls(clearance, lo, spacing)
+
+    def clearance_at(self, pts: np.ndarray) -> np.ndarray:
+        """Clearance [m] of the voxels containing pts (M, 3); 0 outside the domain"""
+        idx = np.floor((pts - self.origin) / self.spacing).astype(np.int64)
+        inside = np.all((idx >= 0) & (idx < self.shape), axis=1)
+
+        result = np.zeros(len(pts))
+        result[inside] = self.clearance[idx[inside, 0], idx[inside, 1], idx[inside, 2]]
+
+        return result
+
+    def segments_near_surface(self, r_old: np.ndarray, r_new: np.ndarray) -> np.ndarray:
+        """Mask (M,) of segments r_old -> r_new that may intersect a surface"""
+        length = np.sqrt(np.sum((r_new - r_old) ** 2, axis=1))
+        return length >= self.clearance_at(r_old)
+
+    @property
+    def near_fraction(self) -> float:
+        """Fraction of voxels flagged as near-surface"""
+        return float(np.mean(self.clearance == 0.0))
+
+    def __repr__(self):
+        return (f"CollisionGrid(shape={tuple(self.shape.tolist())}, spacing={self.spacing.tolist()}, "
+                f"near={100 * self.near_fraction:.1f}%)")
+
+
+def _first_losses(candidates: List[Tuple[np.ndarray, ...]]) -> Tuple[np.ndarray, ...]:
+    """
+    Earliest loss per particle from several termination checks.
+
+    candidates: tuples (particle, step, fraction, impact, electrode_id,
+    aperture_id) of arrays; a particle hit by several checks keeps the hit
+    with the smallest step + fraction.
+    """
+    particle, step, fraction, impact, electrode_id, aperture_id = [np.concatenate(c) for c in zip(*candidates)]
+
+    first = np.lexsort((step + fraction, particle))
+    first = first[np.unique(particle[first], return_index=True)[1]]
+
+    return (particle[first], step[first], fraction[first], impact[first].reshape(-1, 3),
+            electrode_id[first], aperture_id[first])
+
+
 # ============================================================================
 # Pusher Class
 # ============================================================================
@@ -449,6 +616,14 @@ class Pusher:
         - 'yoshida_rel': Relativistic symplectic
     use_numba : bool
         Use Numba JIT compilation (default: True if available)
+    electrode_assembly : PyElectrodeAssembly, optional
+        Electrodes that terminate particles in track_batch
+    collision_grid : CollisionGrid, optional
+        Clearance map of the electrodes; only step segments that may reach a
+        surface get the exact intersection test (see build_collision_grid)
+    apertures : ApertureSet or list of Aperture, optional
+        Analytic apertures that terminate particles in track_batch, tested
+        for every particle every step; combinable with electrode_assembly
 
     Examples
     --------
@@ -466,7 +641,9 @@ class Pusher:
                   'vay_rel', 'rk4_rel', 'yoshida_rel']
 
     def __init__(self, ion, algorithm: str = 'boris',
-                 use_numba: bool = True, electrode_assembly: PyElectrodeAssembly = None):
+                 use_numba: bool = True, electrode_assembly: Optional['PyElectrodeAssembly'] = None,
+                 collision_grid: Optional[CollisionGrid] = None,
+                 apertures: Optional[Union[ApertureSet, List[Aperture]]] = None):
         """Initialize pusher with ion species and algorithm."""
         self.ion = ion
         self.q_over_m = ion.q_over_m
@@ -500,6 +677,8 @@ class Pusher:
         # TODO: Think about separating Pusher and TrackingLoop
         # TODO: Termination checks sold then be in TrackingLoop
         self.elec_assy = electrode_assembly
+        self.collision_grid = collision_grid
+        self.apertures = as_aperture_set(apertures)
 
     # ========================================================================
     # Single Particle Methods
@@ -698,7 +877,7 @@ Notes
 
     def push_batch(self, r_array: np.ndarray, v_array: np.ndarray,
                    efield: Callable, bfield: Callable,
-                   dt: float) -> Tuple[np.ndarray, np.ndarray]:
+                   dt: float, t: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
         """
         Advance batch of particles by one time step.
 
@@ -714,6 +893,9 @@ Notes
             Magnetic field function: (pts) -> (Bx, By, Bz)
         dt : float
             Time step [s]
+        t : float, optional
+            Time of r_array [s], passed to time-dependent fields
+            (static fields ignore it)
 
         Returns
         -------
@@ -723,8 +905,8 @@ Notes
             Updated velocities [m/s]
         """
         # Query fields for all particles (batch query for parallelization)
-        efield_array = efield(r_array)
-        bfield_array = bfield(r_array)
+        efield_array = _evaluate_field(efield, r_array, t)
+        bfield_array = _evaluate_field(bfield, r_array, t)
 
         # Algorithm-specific integration
         if self.algorithm == 'leapfrog':
@@ -777,7 +959,7 @@ Notes
         elif self.algorithm in ['rk4', 'rk4_rel']:
             # RK4 with batched field queries
             r_new_array, v_new_array = self._rk4_step_batch(
-                r_array, v_array, efield, bfield, dt
+                r_array, v_array, efield, bfield, dt, t
             )
 
         elif self.algorithm in ['yoshida', 'yoshida_rel']:
@@ -802,22 +984,30 @@ Notes
 
     def _rk4_step_batch(self, r_array: np.ndarray, v_array: np.ndarray,
                         efield: Callable, bfield: Callable,
-                        dt: float) -> Tuple[np.ndarray, np.ndarray]:
+                        dt: float, t: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
         """
         Batch RK4 step with proper field queries at intermediate points.
 
         Uses batched field queries for parallelization: evaluates all M particles
         simultaneously at each K stage rather than processing sequentially.
+        Time-dependent fields are evaluated at t, t + dt/2 and t + dt.
         """
         dbetagamma_fn = (rk4_rel_dbetagamma_dt_batch if self.relativistic
                         else None)
 
+        # Stage times (per particle if dt is an array)
+        if t is None:
+            t_half = t_end = None
+        else:
+            t_half = t + 0.5 * dt
+            t_end = t + dt
+
         if not isinstance(dt, float):
             dt = np.broadcast_to(dt[:, np.newaxis], (len(dt), 3))
 
         # K1: Evaluate at current positions (all particles at once)
-        ef1 = efield(r_array)
-        bf1 = bfield(r_array)
+        ef1 = _evaluate_field(efield, r_array, t)
+        bf1 = _evaluate_field(bfield, r_array, t)
 
         if self.relativistic and self.use_numba:
             k1_v = dbetagamma_fn(v_array, ef1, bf1, self.q_over_m)
@@ -833,8 +1023,8 @@ Notes
         # K2: Evaluate at midpoint (all particles at once)
         r2 = r_array + 0.5 * dt * k1_r
         v2 = v_array + 0.5 * dt * k1_v
-        ef2 = efield(r2)
-        bf2 = bfield(r2)
+        ef2 = _evaluate_field(efield, r2, t_half)
+        bf2 = _evaluate_field(bfield, r2, t_half)
 
         if self.relativistic and self.use_numba:
             k2_v = dbetagamma_fn(v2, ef2, bf2, self.q_over_m)
@@ -849,8 +1039,8 @@ Notes
         # K3: Evaluate at midpoint with k2 (all particles at once)
         r3 = r_array + 0.5 * dt * k2_r
         v3 = v_array + 0.5 * dt * k2_v
-        ef3 = efield(r3)
-        bf3 = bfield(r3)
+        ef3 = _evaluate_field(efield, r3, t_half)
+        bf3 = _evaluate_field(bfield, r3, t_half)
 
         if self.relativistic and self.use_numba:
             k3_v = dbetagamma_fn(v3, ef3, bf3, self.q_over_m)
@@ -865,8 +1055,8 @@ Notes
         # K4: Evaluate at endpoint (all particles at once)
         r4 = r_array + dt * k3_r
         v4 = v_array + dt * k3_v
-        ef4 = efield(r4)
-        bf4 = bfield(r4)
+        ef4 = _evaluate_field(efield, r4, t_end)
+        bf4 = _evaluate_field(bfield, r4, t_end)
 
         if self.relativistic and self.use_numba:
             k4_v = dbetagamma_fn(v4, ef4, bf4, self.q_over_m)
@@ -895,7 +1085,11 @@ Notes
                     efield: Callable, bfield: Callable,
                     nsteps: int, dt: float,
                     rec_every_n_steps: int = 1,
-                    verbose: bool = False) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+                    verbose: bool = False,
+                    t0: float = 0.0,
+                    collision_every: int = 1,
+                    return_losses: bool = False) -> Union[Tuple[np.ndarray, np.ndarray, np.ndarray],
+                                                          Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]]:
         """
         Track batch of particles through fields (parallelized).
 
@@ -917,6 +1111,20 @@ Notes
             Record data every N steps (default: 1)
         verbose : bool
             Print progress updates (default: False)
+        t0 : float
+            Start time [s]. Time-dependent fields (e.g. RFField) are
+            evaluated at t0 + step * dt (default: 0)
+        collision_every : int
+            Maximum number of steps between electrode collision checks
+            (default: 1). A check tests every step segment of the polyline
+            since the particle's last check, so lost particles, loss step
+            and impact point are the same as with per-step checks; lost
+            particles are rolled back to their loss step. With a
+            collision_grid the interval is chosen per particle from its
+            clearance and speed, so that the polyline usually passes the
+            pre-filter without an exact test
+        return_losses : bool
+            Also return the loss records (default: False)
 
         Returns
         -------
@@ -926,6 +1134,13 @@ Notes
             Velocity history [m/s]
         active : np.ndarray(M,)
             particles still alive or collision with bd?
+        losses : np.ndarray(n_lost,) of LOSS_DTYPE
+            Only if return_losses: particle index, step, impact time, impact
+            point, velocity, electrode id and aperture id of every particle
+            lost on an electrode or aperture, in order of loss. Impact point and electrode id are
+            taken from the 'hit_points' and 'electrode_ids' entries of
+            segment_intersects_surface if provided, otherwise the end of the
+            loss step and -1 are stored
 
         Notes
         -----
@@ -943,10 +1158,12 @@ Notes
         r_current = r0_array.copy()
         v_current = v0_array.copy()
 
+        t = t0
+
         # For Boris: initialize velocities at half-step back
         if self.algorithm == 'boris':
-            efield_array = efield(r_current)
-            bfield_array = bfield(r_current)
+            efield_array = _evaluate_field(efield, r_current, t)
+            bfield_array = _evaluate_field(bfield, r_current, t)
 
             if self.use_numba:
                 v_current = boris_push_batch(v_current, efield_array, bfield_array,
@@ -962,15 +1179,33 @@ Notes
         v_array[0] = v_current
         record_idx = 1
 
+        # Ring buffer of the states since the last collision check; slot
+        # step % n_window holds the state after step, slot -1 the initial one
+        if self.elec_assy:
+            if collision_every < 1:
+                raise ValueError(f"collision_every must be >= 1, got {collision_every}")
+            n_window = collision_every + 1
+            window_r = np.empty((n_window, M, 3))
+            window_v = np.empty((n_window, M, 3))
+            window_r[-1], window_v[-1] = r_current, v_current
+            last_check = np.full(M, -1, dtype=np.int64)
+            next_check = np.zeros(M, dtype=np.int64)
+
+        # Every particle is lost at most once
+        losses = np.zeros(M, dtype=LOSS_DTYPE)
+        n_lost = 0
+
         # Main tracking loop
         for step in range(nsteps):
             if verbose and nsteps >= 10 and (step % (nsteps // 10) == 0):
                 print(f"Step {step}/{nsteps} ({100*step/nsteps:.0f}%)")
 
             # Advance all particles
-            r_old = r_current[active].copy()
+            if self.apertures is not None:
+                r_old = r_current[active].copy()
             r_current[active], v_current[active] = self.push_batch(r_current[active], v_current[active],
-                                                   efield, bfield, dt)
+                                                   efield, bfield, dt, t)
+            t = t0 + (step + 1) * dt
 
             # Record if needed
             if (step + 1) % rec_every_n_steps == 0:
@@ -979,11 +1214,59 @@ Notes
                     v_array[record_idx][active] = v_current[active]
                     record_idx += 1
 
-            # Collision test if there is a PyElectrodeAssembly
-            if self.elec_assy:
-                collision_data = self.elec_assy.segment_intersects_surface(r_old, r_current[active])
-                old_active_idx = np.where(active)[0]
-                active[old_active_idx[collision_data["hit_mask"]]] = False
+            # Termination on apertures (every step) and electrodes (when due)
+            if self.apertures is not None or self.elec_assy:
+                candidates = []
+
+                if self.apertures is not None:
+                    alive = np.flatnonzero(active)
+                    hit_id, fraction = self.apertures.check(r_old, r_current[alive])
+                    hit = hit_id >= 0
+                    impact = r_old[hit] + fraction[hit, np.newaxis] * (r_current[alive[hit]] - r_old[hit])
+                    candidates.append((alive[hit], np.full(hit.sum(), step), fraction[hit], impact,
+                                       np.full(hit.sum(), -1, dtype=np.int32), hit_id[hit].astype(np.int32)))
+
+                if self.elec_assy:
+                    window_r[step % n_window][active] = r_current[active]
+                    window_v[step % n_window][active] = v_current[active]
+
+                    # Particles stopped by an aperture are checked for earlier electrode hits
+                    due = active & ((next_check <= step) | (step == nsteps - 1))
+                    if candidates:
+                        due[candidates[0][0]] = True
+                    due = np.flatnonzero(due)
+
+                    lost, loss_step, impact, electrode_id, fraction = self._polyline_collisions(
+                        due, last_check[due], step, window_r)
+                    candidates.append((lost, loss_step, fraction, impact, electrode_id,
+                                       np.full(len(lost), -1, dtype=np.int32)))
+
+                lost, loss_step, fraction, impact, electrode_id, aperture_id = _first_losses(candidates)
+
+                # Roll lost particles back to the end of their loss step
+                active[lost] = False
+                if self.elec_assy:
+                    r_current[lost] = window_r[loss_step % n_window, lost]
+                    v_current[lost] = window_v[loss_step % n_window, lost]
+                for j, s in zip(lost, loss_step):
+                    r_array[(s + 1) // rec_every_n_steps + 1:, j] = np.nan
+                    v_array[(s + 1) // rec_every_n_steps + 1:, j] = np.nan
+
+                record = losses[n_lost:n_lost + len(lost)]
+                record['index'] = lost
+                record['step'] = loss_step
+                record['time'] = t0 + (loss_step + fraction) * dt
+                record['position'] = impact
+                record['velocity'] = v_current[lost]
+                record['electrode_id'] = electrode_id
+                record['aperture_id'] = aperture_id
+                n_lost += len(lost)
+
+                if self.elec_assy:
+                    checked = due[active[due]]
+                    last_check[checked] = step
+                    next_check[checked] = step + self._collision_interval(r_current[checked], v_current[checked],
+                                                                          dt, collision_every)
 
                 # If all particles are lost --> terminate tracking
                 if len(np.where(active)[0]) == 0:
@@ -991,8 +1274,8 @@ Notes
 
         # For Boris: push velocities forward by half-step for final state
         if self.algorithm == 'boris':
-            efield_array = efield(r_current[active])
-            bfield_array = bfield(r_current[active])
+            efield_array = _evaluate_field(efield, r_current[active], t)
+            bfield_array = _evaluate_field(bfield, r_current[active], t)
 
             if self.use_numba:
                 v_current[active] = boris_push_batch(v_current[active], efield_array, bfield_array,
@@ -1009,8 +1292,99 @@ Notes
         if verbose:
             print(f"Tracking complete: {nsteps} steps, {M} particles")
 
+        if return_losses:
+            return r_array, v_array, active, losses[:n_lost].copy()
+
         return r_array, v_array, active
 
+    def _polyline_collisions(self, particles: np.ndarray, last_check: np.ndarray,
+                             step: int, window_r: np.ndarray) -> Tuple[np.ndarray, ...]:
+        """
+        Exact electrode test of the step segments since each particle's last check.
+
+        Parameters
+        ----------
+        particles : np.ndarray(D,)
+            Particle indices to check
+        last_check : np.ndarray(D,)
+            Step of their last check (-1 = initial state)
+        step : int
+            Current step
+        window_r : np.ndarray(n_window, M, 3)
+            Ring buffer of positions, slot s % n_window after step s
+
+        Returns
+        -------
+        lost : np.ndarray
+            Indices of particles that hit a surface
+        loss_step : np.ndarray
+            Step during which each of them hit (first hit on the polyline)
+        impact : np.ndarray(n_lost, 3)
+            Impact points (end of the loss step if the assembly reports none)
+        electrode_id : np.ndarray(n_lost,)
+            Electrode hit, -1 if not reported
+        fraction : np.ndarray(n_lost,)
+            Position of the impact along the loss step segment, 0..1
+        """
+        n_window = window_r.shape[0]
+        n_seg = step - last_check
+        owner = np.repeat(np.arange(len(particles)), n_seg)
+        seg_start = last_check[owner] + np.arange(len(owner)) - np.repeat(np.cumsum(n_seg) - n_seg, n_seg)
+
+        r_a = window_r[seg_start % n_window, particles[owner]]
+        r_b = window_r[(seg_start + 1) % n_window, particles[owner]]
+
+        # Polylines shorter than the clearance at their start cannot reach a surface
+        if self.collision_grid is not None and len(owner) > 0:
+            length = np.bincount(owner, weights=np.sqrt(np.sum((r_b - r_a) ** 2, axis=1)),
+                                 minlength=len(particles))
+            start = window_r[last_check % n_window, particles]
+            near = (length >= self.collision_grid.clearance_at(start))[owner]
+            owner, seg_start, r_a, r_b = owner[near], seg_start[near], r_a[near], r_b[near]
+
+        if len(owner) == 0:
+            return (np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), np.empty((0, 3)),
+                    np.empty(0, dtype=np.int32), np.empty(0))
+
+        collision_data = self.elec_assy.segment_intersects_surface(r_a, r_b)
+        hit = np.flatnonzero(collision_data["hit_mask"])
+
+        # First hit segment of each particle (segments are in step order per owner)
+        hit = hit[np.lexsort((seg_start[hit], owner[hit]))]
+        hit = hit[np.unique(owner[hit], return_index=True)[1]]
+
+        if "hit_points" in collision_data:
+            impact = np.asarray(collision_data["hit_points"], dtype=np.float64)[hit]
+        else:
+            impact = r_b[hit]
+        if "electrode_ids" in collision_data:
+            electrode_id = np.asarray(collision_data["electrode_ids"], dtype=np.int32)[hit]
+        else:
+            electrode_id = np.full(len(hit), -1, dtype=np.int32)
+
+        seg_length_sq = np.sum((r_b[hit] - r_a[hit]) ** 2, axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            fraction = np.sum((impact - r_a[hit]) * (r_b[hit] - r_a[hit]), axis=1) / seg_length_sq
+        fraction = np.clip(np.nan_to_num(fraction, nan=1.0), 0.0, 1.0)
+
+        return particles[owner[hit]], seg_start[hit] + 1, impact, electrode_id, fraction
+
+    def _collision_interval(self, r: np.ndarray, v: np.ndarray, dt: float, collision_every: int) -> np.ndarray:
+        """
+        Steps until the next collision check per particle: collision_every, or
+        with a collision grid the number of steps that covers COLLISION_SAFETY
+        of the clearance at the current speed (at least 1)
+        """
+        if self.collision_grid is None or collision_every == 1:
+            return np.full(len(r), collision_every, dtype=np.int64)
+
+        step_length = np.sqrt(np.sum(v ** 2, axis=1)) * abs(dt)
+        clearance = self.collision_grid.clearance_at(r)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            n_steps = np.where(step_length > 0, COLLISION_SAFETY * clearance / step_length, collision_every)
+
+        return np.clip(np.nan_to_num(n_steps, posinf=collision_every), 1, collision_every).astype(np.int64)
+
     # ========================================================================
     # Utility Methods
     # ========================================================================
@@ -1030,7 +1404,23 @@ Notes
                 f"Unknown algorithm '{algorithm}'. Must be one of {self.ALGORITHMS}"
             )
 
-        self.__init__(self.ion, algorithm=algorithm, use_numba=self.use_numba)
+        self.__init__(self.ion, algorithm=algorithm, use_numba=self.use_numba,
+                      electrode_assembly=self.elec_assy, collision_grid=self.collision_grid,
+                      apertures=self.apertures)
+
+    def build_collision_grid(self, domain: Tuple[Tuple[float, float], Tuple[float, float], Tuple[float, float]],
+                             voxel_size: Union[float, Tuple[float, float, float]],
+                             use_gpu: bool = False) -> CollisionGrid:
+        """
+        Build and attach the collision pre-filter for the electrode assembly.
+
+        See CollisionGrid.from_electrodes for the parameters.
+        """
+        if self.elec_assy is None:
+            raise RuntimeError("No electrode assembly to build a collision grid from")
+
+        self.collision_grid = CollisionGrid.from_electrodes(self.elec_assy, domain, voxel_size, use_gpu=use_gpu)
+        return self.collision_grid
 
     def __repr__(self):
         return (f"Pusher(ion={self.ion.name}, algorithm='{self.algorithm}', "
@@ -0,0 +1,50 @@
+import numpy as np
+
+from PyPATools.pusher import CollisionGrid
+
+
+class _SphereShell:
+    """Minimal electrode: thin spherical shell with axis-aligned ray casts"""
+
+    def __init__(self, center, radius):
+        self.center = np.asarray(center, dtype=np.float64)
+        self.radius = radius
+
+    def compute_axis_aligned_surface_intersections(self, nodes, axes='all', use_gpu=False):
+        directions = [(1, 0, 0), (-1, 0, 0), (0, 1, 0), (0, -1, 0), (0, 0, 1), (0, 0, -1)]
+        distances = np.full((len(nodes), 6), np.inf)
+
+        oc = nodes - self.center
+        for i, direction in enumerate(directions):
+            b = oc @ np.array(direction, dtype=np.float64)
+            disc = b ** 2 - (np.sum(oc ** 2, axis=1) - self.radius ** 2)
+            root = np.sqrt(np.maximum(disc, 0.0))
+            t = np.where(-b - root >= 0, -b - root, np.where(-b + root >= 0, -b + root, np.inf))
+            distances[:, i] = np.where(disc >= 0, t, np.inf)
+
+        return distances, np.zeros((len(nodes), 6), dtype=np.int64)
+
+
+def test_surface_outside_domain_is_not_pruned():
+    # Shell bottom at z = 10 mm, 3 mm above the upper z face of the domain
+    shell = _SphereShell(center=(0.0, 0.0, 0.02), radius=0.01)
+    grid = CollisionGrid.from_electrodes(shell, domain=((-0.01, 0.01), (-0.01, 0.01), (-0.01, 0.007)),
+                                         voxel_size=1e-3)
+
+    r_old = np.array([[0.0, 0.0, 0.0065]])
+    r_new = np.array([[0.0, 0.0, 0.0105]])
+
+    assert np.isfinite(grid.clearance_at(r_old)).all()
+    assert grid.segments_near_surface(r_old, r_new).all()
+
+
+def test_clearance_bounded_by_domain_faces():
+    shell = _SphereShell(center=(0.0, 0.0, 0.5), radius=0.01)
+    grid = CollisionGrid.from_electrodes(shell, domain=((-0.01, 0.01), (-0.01, 0.01), (-0.01, 0.01)),
+                                         voxel_size=1e-3)
+
+    centers = grid.origin + (np.argwhere(np.ones(tuple(grid.shape))) + 0.5) * grid.spacing
+    to_face = np.min(np.minimum(centers - grid.origin,
+                                grid.origin + grid.shape * grid.spacing - centers), axis=1)
+
+    assert np.all(grid.clearance_at(centers) <= to_face)
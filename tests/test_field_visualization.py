@@ -0,0 +1,33 @@
+import numpy as np
+
+from PyPATools.field import Field, CompositeField, ScaledField
+from PyPATools.field_src.field_visualization import sample_field_slices
+
+
+def _uniform_field(fx):
+    axis = np.linspace(-1.0, 1.0, 5)
+    shape = (len(axis),) * 3
+    return Field.from_arrays(grid={'x': axis, 'y': axis, 'z': axis},
+                             values={'x': np.full(shape, fx), 'y': np.zeros(shape), 'z': np.zeros(shape)})
+
+
+def _fx_plane(field):
+    _, _, planes = sample_field_slices(field, 'z', [0.0], ((-0.5, 0.5), (-0.5, 0.5)), 4)
+    return planes[0][0]
+
+
+def test_slice_cache_follows_composite_weights():
+    composite = CompositeField([_uniform_field(1.0), _uniform_field(1.0)], [0.5, 0.0])
+    assert np.allclose(_fx_plane(composite), 0.5)
+
+    composite.weights[1] = 5.0
+    assert np.allclose(_fx_plane(composite), 5.5)
+
+
+def test_slice_cache_follows_scaled_field():
+    scaled = ScaledField(_uniform_field(1.0), scale=2.0)
+    assert np.allclose(_fx_plane(scaled), 2.0)
+
+    scaled.scale = 3.0
+    scaled.offset = 1.0
+    assert np.allclose(_fx_plane(scaled), 4.0)